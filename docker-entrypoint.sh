@@ -1,37 +1,10 @@
 #!/bin/bash
 set -e
 
+# Migrations, static files, initial data and the superuser in one Django
+# process; steps with nothing to do are skipped (see manage.py bootstrap)
 echo "Starting Django application setup..."
-
-# Run database migrations
-echo "Running database migrations..."
-python manage.py migrate --noinput
-
-# Collect static files
-echo "Collecting static files..."
-python manage.py collectstatic --noinput --clear
-
-# Load initial data
-echo "Loading initial data..."
-python manage.py populate_sample_data
-
-# Create superuser if it doesn't exist
-echo "Creating superuser if needed..."
-python manage.py shell << END
-from django.contrib.auth import get_user_model
-import os
-
-User = get_user_model()
-username = os.environ.get('DJANGO_SUPERUSER_USERNAME', 'admin')
-email = os.environ.get('DJANGO_SUPERUSER_EMAIL', 'admin@portfolio.com')
-password = os.environ.get('DJANGO_SUPERUSER_PASSWORD', 'admin123')
-
-if not User.objects.filter(username=username).exists():
-    User.objects.create_superuser(username=username, email=email, password=password)
-    print(f'Superuser {username} created successfully!')
-else:
-    print(f'Superuser {username} already exists.')
-END
+python manage.py bootstrap
 
 echo "Setup complete! Starting application..."
 
@@ -0,0 +1,68 @@
+"""
+Gunicorn configuration, read automatically from the working directory.
+
+The application is imported once in the master (``preload_app``) and warmed
+there before any worker is forked, so workers start with compiled templates,
+compiled spam patterns and filled homepage caches in memory they share
+copy-on-write. Every setting can be overridden with ``GUNICORN_*`` variables;
+``GUNICORN_WORKER_CLASS=gthread`` switches to the threaded profile.
+"""
+
+import gc
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def _cpu_count():
+    # The CPUs this container may actually run on, not the host's
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', '8001')}")
+
+# GUNICORN_WORKER_CLASS=gthread serves several requests per process, so a
+# slow client ties up a thread rather than a whole worker; fewer processes
+# are needed and each one's DB connection pool gets a slot per thread
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+if worker_class == 'gthread':
+    threads = _env_int('GUNICORN_THREADS', 4)
+    workers = _env_int('GUNICORN_WORKERS', _cpu_count() + 1)
+else:
+    threads = 1
+    workers = _env_int('GUNICORN_WORKERS', _cpu_count() * 2 + 1)
+# One more for the error reporter's thread (portfolio_app/error_reporter.py),
+# so recording an error never waits for, or starves, the request threads
+os.environ.setdefault('DB_POOL_SIZE', str(threads + 1))
+
+timeout = _env_int('GUNICORN_TIMEOUT', 120)
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+
+# Recycle workers now and then to bound slow leaks; the jitter keeps them
+# from all restarting at the same moment
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+    from portfolio_app.warmup import warm_up
+
+    timings = warm_up()
+    server.log.info('Warmed up before fork: %s', ', '.join(
+        f'{step} {elapsed:.0f}ms' for step, elapsed in timings.items()
+    ))
+    # Everything loaded so far lives for the life of the process; moving it
+    # out of the collector's reach stops workers from copying those pages
+    gc.collect()
+    gc.freeze()
@@ -46,13 +46,16 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
-    "django.contrib.staticfiles",
+    # Ahead of staticfiles so its collectstatic (with the size report) wins
     "portfolio_app",
+    "django.contrib.staticfiles",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "portfolio_app.edge_cache.EdgeCacheMiddleware",
+    "portfolio_app.routers.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -86,10 +89,81 @@ WSGI_APPLICATION = "portfolio.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# Per-process connection pool (see portfolio_app/db_backends); gunicorn.conf.py
+# sizes it to the worker's thread count plus one for the error reporter
+DB_POOL = {
+    'MAX_SIZE': env.int('DB_POOL_SIZE', default=4),
+    'TIMEOUT': env.float('DB_POOL_TIMEOUT', default=10.0),
+    'MAX_LIFETIME': env.int('DB_POOL_MAX_LIFETIME', default=60 * 60),
+}
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "portfolio_app.db_backends.sqlite3",
         "NAME": BASE_DIR / "data" / "db.sqlite3",
+        "POOL": DB_POOL,
+    }
+}
+
+# Pooled versions of the stock backends (see portfolio_app/db_backends)
+POOLED_ENGINES = {
+    'django.db.backends.postgresql': 'portfolio_app.db_backends.postgresql',
+    'django.db.backends.sqlite3': 'portfolio_app.db_backends.sqlite3',
+}
+
+
+def _pooled_database(url):
+    config = env.db_url_config(url)
+    config['ENGINE'] = POOLED_ENGINES.get(config['ENGINE'], config['ENGINE'])
+    config['POOL'] = DB_POOL
+    return config
+
+
+# PostgreSQL (or another database) from a URL, e.g.
+# DATABASE_URL=postgres://portfolio:secret@db:5432/portfolio
+if env('DATABASE_URL', default=''):
+    DATABASES['default'] = _pooled_database(env('DATABASE_URL'))
+    DATABASES['default'].update({
+        # Keep a thread's connection across requests; checked before reuse
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
+        # Server-side cursors stream large exports; PgBouncer in transaction
+        # mode can't keep them open, so they can be turned off
+        'DISABLE_SERVER_SIDE_CURSORS': env.bool('DB_DISABLE_SERVER_SIDE_CURSORS', default=False),
+    })
+
+# Read replicas for views marked @replica_reads (portfolio_app/routers.py),
+# e.g. DATABASE_REPLICA_URLS=postgres://...@replica-1/portfolio,postgres://...
+# A SQLite copy refreshed by `manage.py sync_sqlite_replica` works locally:
+# DATABASE_REPLICA_URLS=sqlite:////app/data/replica.sqlite3
+for index, url in enumerate(env.list('DATABASE_REPLICA_URLS', default=[]), start=1):
+    replica = _pooled_database(url)
+    if replica['ENGINE'] == POOLED_ENGINES['django.db.backends.sqlite3']:
+        replica['NAME'] = f"file:{replica['NAME']}?mode=ro"
+        replica['OPTIONS'] = {**replica.get('OPTIONS', {}), 'uri': True}
+    # Tests read and write the primary's test database through the replicas
+    replica['TEST'] = {'MIRROR': 'default'}
+    DATABASES[f'replica{index}'] = replica
+
+DATABASE_ROUTERS = ['portfolio_app.routers.ReplicaRouter']
+
+# How long a visitor's reads stay on the primary after they wrote; replicas
+# behind the latest content change are skipped until they catch up
+REPLICA_STICKY_SECONDS = env.int('REPLICA_STICKY_SECONDS', default=15)
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/ref/settings/#caches
+
+# Per process by default, which is all `runserver` needs. With several
+# worker processes the cache must be shared: the content version
+# (portfolio_app/versioning.py) has to be the same in all of them, or some
+# keep serving old pages. Use Redis, CACHE_URL=redis://redis:6379/1, or a
+# database table, CACHE_URL=dbcache://portfolio_cache (`migrate` creates it)
+CACHES = {
+    'default': {
+        **env.cache_url('CACHE_URL', default='locmemcache://'),
+        'KEY_PREFIX': 'portfolio',
     }
 }
 
@@ -139,7 +213,16 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
 # WhiteNoise configuration
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Minifies CSS/JS on top of WhiteNoise's hashing and gzip/Brotli compression
+STATICFILES_STORAGE = "portfolio_app.storage.OptimizedStaticFilesStorage"
+
+# Maximum gzipped size (bytes) per asset or glob; collectstatic fails when exceeded
+STATIC_ASSET_BUDGETS = {
+    'css/output.css': 16 * 1024,
+    'css/accessibility.css': 4 * 1024,
+    'js/*.js': 1 * 1024,
+    'js/modules/*.js': 2 * 1024,
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -165,6 +248,50 @@ EMAILJS_SERVICE_ID = env('EMAILJS_SERVICE_ID', default='')
 EMAILJS_TEMPLATE_ID = env('EMAILJS_TEMPLATE_ID', default='')
 EMAILJS_TO_EMAIL = env('EMAILJS_TO_EMAIL', default='')
 
+# Contact message retention (see `manage.py archive_messages`)
+CONTACT_ARCHIVE_DIR = env('CONTACT_ARCHIVE_DIR', default=str(BASE_DIR / 'data' / 'archive'))
+
+# Collect contact notifications and admin error mails into one email per
+# recipient per this many minutes, sent by `manage.py send_digests`; 0 mails
+# each one straight away
+NOTIFICATION_DIGEST_MINUTES = env.int('NOTIFICATION_DIGEST_MINUTES', default=0)
+
+# Each kind of server error is mailed to ADMINS at most once per
+# ERROR_MAIL_INTERVAL seconds, and at most ERROR_MAIL_MAX_PER_HOUR mails go out
+# in all; every occurrence is counted under Error Reports in the admin
+ERROR_MAIL_INTERVAL = env.int('ERROR_MAIL_INTERVAL', default=600)
+ERROR_MAIL_MAX_PER_HOUR = env.int('ERROR_MAIL_MAX_PER_HOUR', default=20)
+
+# Vendored Inter font files that manage.py subset_fonts reads from
+FONT_SOURCE_DIR = env('FONT_SOURCE_DIR', default=str(BASE_DIR / 'fonts' / 'inter'))
+
+# Rebuild the above-the-fold CSS inlined into base.html (STATIC_ROOT/critical.css)
+# on every collectstatic
+CRITICAL_CSS_ON_COLLECTSTATIC = env.bool('CRITICAL_CSS_ON_COLLECTSTATIC', default=True)
+
+# Offline-first service worker at /sw.js; when off, installed workers remove themselves
+SERVICE_WORKER_ENABLED = env.bool('SERVICE_WORKER_ENABLED', default=not DEBUG)
+
+# Stream the homepage section by section instead of rendering it in one go
+HOMEPAGE_STREAMING = env.bool('HOMEPAGE_STREAMING', default=False)
+
+# How long a CDN may serve public pages (portfolio_app/edge_cache.py), and
+# serve them stale while it refetches; 0 leaves caching headers alone
+EDGE_CACHE_SECONDS = env.int('EDGE_CACHE_SECONDS', default=300)
+EDGE_STALE_SECONDS = env.int('EDGE_STALE_SECONDS', default=60)
+
+# Called with the surrogate keys of changed content, e.g.
+# EDGE_CACHE_PURGE_HOOK=portfolio_app.edge_cache.fastly_purge
+EDGE_CACHE_PURGE_HOOK = env('EDGE_CACHE_PURGE_HOOK', default='')
+FASTLY_API_TOKEN = env('FASTLY_API_TOKEN', default='')
+FASTLY_SERVICE_ID = env('FASTLY_SERVICE_ID', default='')
+
+# Modules only management commands and collectstatic need; `manage.py
+# startup_profile --check` fails if a worker imports any of them at boot
+STARTUP_LAZY_IMPORTS = env.list('STARTUP_LAZY_IMPORTS', default=[
+    'fontTools', 'brotli', 'rcssmin', 'rjsmin', 'PIL', 'portfolio_app.storage',
+])
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -206,7 +333,9 @@ LOGGING = {
         'mail_admins': {
             'level': 'ERROR',
             'filters': ['require_debug_false'],
-            'class': 'django.utils.log.AdminEmailHandler',
+            # Deduplicated, rate-limited and sent from a background thread
+            # (portfolio_app/error_reporter.py)
+            'class': 'portfolio_app.error_reporter.ErrorReportHandler',
             'formatter': 'verbose',
         },
     },
@@ -1,6 +1,75 @@
+import csv
+from itertools import chain
+
 from django.contrib import admin
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from django.utils.html import format_html
-from .models import Profile, Skill, Experience, Project, ContactMessage
+from .models import (
+    Profile, Skill, Experience, Project, ContactMessage, NotificationDigest, DigestItem, ErrorReport,
+)
+from . import search
+from .notifications import send_due_digests
+from .inbox import EstimatedCountPaginator, KeysetChangeList, fts_available, search_messages
+from .versioning import versioned_key
+
+
+def get_request_profile(request):
+    """Return the only Profile (or None), looked up at most once per request"""
+    # get_form() runs several times per add/change page (fieldsets, form, ...)
+    if not hasattr(request, '_portfolio_profile'):
+        request._portfolio_profile = Profile.get_solo()
+    return request._portfolio_profile
+
+
+class EchoBuffer:
+    """File-like object that hands back what csv.writer writes to it"""
+    
+    def write(self, value):
+        return value
+
+
+def get_skill_choices():
+    """(pk, label) pairs for the technologies widget, cached per content version"""
+    key = versioned_key('admin_skill_choices')
+    choices = cache.get(key)
+    if choices is None:
+        choices = [(skill.pk, str(skill)) for skill in Skill.objects.order_by('category', 'name')]
+        cache.set(key, choices, 60 * 60 * 24)
+    return choices
+
+
+class FullTextSearchMixin:
+    """Route admin search through the site search index when it exists"""
+    
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and search.search_available(queryset.db):
+            ids = search.matching_ids(search.SEARCH_MODELS[self.model], search_term, using=queryset.db)
+            return queryset.filter(pk__in=ids), False
+        return super().get_search_results(request, queryset, search_term)
+
+
+class ProfileDefaultsMixin:
+    """Shared form tweaks for models that belong to the single Profile"""
+    
+    def get_form(self, request, obj=None, **kwargs):
+        form = super().get_form(request, obj, **kwargs)
+        # Auto-select the profile if only one exists
+        profile = get_request_profile(request)
+        if profile is not None and 'profile' in form.base_fields:
+            form.base_fields['profile'].initial = profile
+        return form
+    
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == "technologies":
+            kwargs["queryset"] = Skill.objects.all().order_by('category', 'name')
+        formfield = super().formfield_for_manytomany(db_field, request, **kwargs)
+        if db_field.name == "technologies" and formfield is not None:
+            # Render from the cached list; the queryset is only hit on submit
+            formfield.choices = get_skill_choices()
+        return formfield
 
 
 @admin.register(Profile)
@@ -36,7 +105,7 @@ class ProfileAdmin(admin.ModelAdmin):
 
 
 @admin.register(Skill)
-class SkillAdmin(admin.ModelAdmin):
+class SkillAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ['name', 'category', 'proficiency', 'years_experience', 'is_featured', 'order']
     list_filter = ['category', 'proficiency', 'is_featured']
     list_editable = ['proficiency', 'years_experience', 'is_featured', 'order']
@@ -61,7 +130,7 @@ class SkillInline(admin.TabularInline):
 
 
 @admin.register(Experience)
-class ExperienceAdmin(admin.ModelAdmin):
+class ExperienceAdmin(FullTextSearchMixin, ProfileDefaultsMixin, admin.ModelAdmin):
     list_display = ['position', 'company', 'start_date', 'end_date', 'is_current', 'order']
     list_filter = ['is_current', 'start_date']
     list_editable = ['order']
@@ -84,23 +153,10 @@ class ExperienceAdmin(admin.ModelAdmin):
     ]
     
     filter_horizontal = ['technologies']
-    
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        # Auto-select the profile if only one exists
-        if Profile.objects.count() == 1:
-            form.base_fields['profile'].initial = Profile.objects.first()
-        return form
-    
-    # Optimize technologies queryset
-    def formfield_for_manytomany(self, db_field, request, **kwargs):
-        if db_field.name == "technologies":
-            kwargs["queryset"] = Skill.objects.all().order_by('category', 'name')
-        return super().formfield_for_manytomany(db_field, request, **kwargs)
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(FullTextSearchMixin, ProfileDefaultsMixin, admin.ModelAdmin):
     list_display = ['title', 'created_date', 'is_featured', 'has_github', 'has_demo', 'order']
     list_filter = ['is_featured', 'created_date']
     list_editable = ['is_featured', 'order']
@@ -129,12 +185,6 @@ class ProjectAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('profile').prefetch_related('technologies')
     
-    # Limit the number of technologies shown in the widget
-    def formfield_for_manytomany(self, db_field, request, **kwargs):
-        if db_field.name == "technologies":
-            kwargs["queryset"] = Skill.objects.all().order_by('category', 'name')
-        return super().formfield_for_manytomany(db_field, request, **kwargs)
-    
     def has_github(self, obj):
         return bool(obj.github_url)
     has_github.boolean = True
@@ -144,30 +194,28 @@ class ProjectAdmin(admin.ModelAdmin):
         return bool(obj.demo_url)
     has_demo.boolean = True
     has_demo.short_description = 'Demo'
-    
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        # Auto-select the profile if only one exists
-        if Profile.objects.count() == 1:
-            form.base_fields['profile'].initial = Profile.objects.first()
-        return form
 
 
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
-    list_display = ['name', 'email', 'subject', 'created_at', 'is_read']
-    list_filter = ['is_read', 'created_at']
-    list_editable = ['is_read']
+    list_display = ['name', 'email', 'subject', 'created_at', 'is_read', 'is_archived']
+    list_filter = ['is_read', 'is_archived', 'created_at']
     search_fields = ['name', 'email', 'subject']
+    search_help_text = "Full-text search over name, email, subject and message"
     readonly_fields = ['name', 'email', 'subject', 'message', 'created_at']
     ordering = ['-created_at']
+    actions = ['mark_as_read', 'mark_as_unread', 'archive_messages', 'export_as_csv']
+    
+    # Large inboxes: bounded counts instead of two full COUNT(*) per page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = [
         ('Message Details', {
             'fields': ['name', 'email', 'subject', 'message', 'created_at']
         }),
         ('Status', {
-            'fields': ['is_read']
+            'fields': ['is_read', 'is_archived']
         }),
     ]
     
@@ -175,11 +223,148 @@ class ContactMessageAdmin(admin.ModelAdmin):
         # Don't allow adding messages through admin
         return False
     
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+    
+    def get_search_results(self, request, queryset, search_term):
+        # Use the FTS5 index when present, fall back to LIKE search elsewhere
+        if search_term and fts_available(queryset.db):
+            return search_messages(queryset, search_term), False
+        return super().get_search_results(request, queryset, search_term)
+    
+    def get_search_fields(self, request):
+        # The LIKE fallback covers the body too; on PostgreSQL each of these
+        # columns has a trigram index (migration 0005)
+        return [*self.search_fields, 'message']
+    
+    # Bulk actions run as a single UPDATE over the selected queryset
+    @admin.action(description="Mark selected messages as read")
+    def mark_as_read(self, request, queryset):
+        updated = queryset.update(is_read=True)
+        self.message_user(request, f"{updated} message(s) marked as read.")
+    
+    @admin.action(description="Mark selected messages as unread")
+    def mark_as_unread(self, request, queryset):
+        updated = queryset.update(is_read=False)
+        self.message_user(request, f"{updated} message(s) marked as unread.")
+    
+    @admin.action(description="Archive selected messages")
+    def archive_messages(self, request, queryset):
+        updated = queryset.update(is_archived=True, is_read=True)
+        self.message_user(request, f"{updated} message(s) archived.")
+    
+    @admin.action(description="Export selected messages as CSV")
+    def export_as_csv(self, request, queryset):
+        fields = ['id', 'created_at', 'name', 'email', 'subject', 'message', 'is_read', 'is_archived']
+        writer = csv.writer(EchoBuffer())
+        # iterator() reads through a server-side cursor on PostgreSQL, so
+        # memory stays flat however many rows are selected
+        rows = queryset.order_by('pk').values_list(*fields).iterator(chunk_size=2000)
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in chain([fields], rows)),
+            content_type='text/csv',
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="contact-messages-{timezone.now():%Y%m%d-%H%M%S}.csv"'
+        )
+        return response
+    
     def message_preview(self, obj):
         return obj.message[:100] + "..." if len(obj.message) > 100 else obj.message
     message_preview.short_description = 'Message Preview'
 
 
+class DigestItemInline(admin.TabularInline):
+    model = DigestItem
+    extra = 0
+    can_delete = False
+    fields = ['kind', 'subject', 'count', 'created_at', 'last_seen_at']
+    readonly_fields = fields
+    
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+class DigestStatusFilter(admin.SimpleListFilter):
+    title = 'status'
+    parameter_name = 'status'
+    
+    def lookups(self, request, model_admin):
+        return [('pending', 'Pending'), ('sent', 'Sent')]
+    
+    def queryset(self, request, queryset):
+        if self.value() == 'pending':
+            return queryset.filter(sent_at__isnull=True)
+        if self.value() == 'sent':
+            return queryset.filter(sent_at__isnull=False)
+        return queryset
+
+
+@admin.register(NotificationDigest)
+class NotificationDigestAdmin(admin.ModelAdmin):
+    list_display = ['recipient', 'created_at', 'due_at', 'item_count', 'notification_count', 'sent_at']
+    list_filter = [DigestStatusFilter, 'created_at']
+    search_fields = ['recipient']
+    readonly_fields = ['recipient', 'created_at', 'due_at', 'sent_at']
+    ordering = ['-created_at']
+    inlines = [DigestItemInline]
+    actions = ['send_now']
+    
+    def has_add_permission(self, request):
+        # Digests are opened by notifications, never by hand
+        return False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            item_count=Count('items'), notification_count=Sum('items__count')
+        )
+    
+    @admin.display(description='Items', ordering='item_count')
+    def item_count(self, obj):
+        return obj.item_count
+    
+    @admin.display(description='Notifications', ordering='notification_count')
+    def notification_count(self, obj):
+        return obj.notification_count or 0
+    
+    @admin.action(description="Send selected digests now")
+    def send_now(self, request, queryset):
+        queryset.filter(sent_at__isnull=True).update(due_at=timezone.now())
+        sent = send_due_digests()
+        self.message_user(request, f"{sent} digest(s) sent.")
+
+
+@admin.register(ErrorReport)
+class ErrorReportAdmin(admin.ModelAdmin):
+    list_display = [
+        'exception_type', 'location', 'count', 'unmailed_count', 'last_seen_at', 'first_seen_at', 'last_mailed_at',
+    ]
+    list_filter = ['last_seen_at', 'exception_type']
+    search_fields = ['exception_type', 'location', 'message', 'last_path']
+    ordering = ['-last_seen_at']
+    
+    fieldsets = [
+        ('Error', {
+            'fields': ['exception_type', 'location', 'message', 'last_path', 'traceback_display']
+        }),
+        ('Occurrences', {
+            'fields': ['count', 'unmailed_count', 'first_seen_at', 'last_seen_at', 'last_mailed_at', 'fingerprint']
+        }),
+    ]
+    readonly_fields = [
+        'exception_type', 'location', 'message', 'last_path', 'traceback_display',
+        'count', 'unmailed_count', 'first_seen_at', 'last_seen_at', 'last_mailed_at', 'fingerprint',
+    ]
+    
+    def has_add_permission(self, request):
+        # Recorded by portfolio_app.error_reporter; deleting one resets its count
+        return False
+    
+    @admin.display(description='Traceback')
+    def traceback_display(self, obj):
+        return format_html('<pre style="white-space: pre-wrap">{}</pre>', obj.traceback or '-')
+
+
 # Customize admin site
 admin.site.site_header = "AI Engineer Portfolio Admin"
 admin.site.site_title = "Portfolio Admin"
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def create_cache_table(using='default', **kwargs):
+    """Create the DatabaseCache table, if one is configured, along with the schema"""
+    from django.core.management import call_command
+    call_command('createcachetable', database=using, verbosity=0)
 
 
 class PortfolioAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portfolio_app"
+
+    def ready(self):
+        # Register cache invalidation signal handlers
+        from . import signals  # noqa: F401
+        # The cache table isn't a migration; a no-op once it exists
+        post_migrate.connect(create_cache_table, sender=self)
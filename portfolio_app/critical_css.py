@@ -0,0 +1,230 @@
+"""
+Above-the-fold ("critical") CSS extraction.
+
+The homepage is rendered and everything up to the end of the hero section
+(the navigation and the hero itself) is treated as the first viewport. Rules
+from the site stylesheets whose selectors only need the tags, classes and
+ids present there are kept; the result is inlined into ``base.html`` by the
+``critical_css`` template tag while the full stylesheets load asynchronously.
+
+Matching is deliberately conservative: pseudo-classes and the arguments
+of ``:not()`` and friends are ignored, so a rule is kept whenever its element
+could be in the first viewport in some state.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+
+from django.conf import settings
+
+# Stylesheets that block rendering in base.html, in page order
+CRITICAL_CSS_SOURCES = ('css/output.css', 'css/accessibility.css')
+
+# Classes toggled by JavaScript before first paint
+DEFAULT_SAFELIST = ('dark', 'hidden', 'active', 'visible')
+
+# Block at-rules whose contents are filtered rule by rule
+_GROUPING_AT_RULES = ('@media', '@supports')
+
+_CLASS_RE = re.compile(r'\.((?:\\.|[\w-])+)')
+_ID_RE = re.compile(r'#((?:\\.|[\w-])+)')
+_TAG_RE = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+# Escaped brackets belong to class names such as ``.w-\[300px\]``
+_ATTRIBUTE_RE = re.compile(r'(?<!\\)\[\s*([\w-]+)\s*(?:([~|^$*]?=)\s*("[^"]*"|\'[^\']*\'|[^\]\s]+)\s*[is]?\s*)?\]')
+_WHITESPACE_RE = re.compile(r'\s*')
+_ANIMATION_RE = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+
+
+class FoldParser(HTMLParser):
+    """Collects the tags, classes and ids used up to the end of the hero"""
+
+    def __init__(self, fold_id='home'):
+        super().__init__(convert_charrefs=True)
+        self.fold_id = fold_id
+        self.tags = {'html', 'body'}
+        self.classes = set()
+        self.ids = set()
+        self.attributes = set()
+        self.done = False
+        self._fold_depth = None
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attrs = dict(attrs)
+        self.tags.add(tag)
+        for name, value in attrs.items():
+            self.attributes.update([(name, None), (name, value)])
+        self.classes.update((attrs.get('class') or '').split())
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        if tag == 'section':
+            self._depth += 1
+            if attrs.get('id') == self.fold_id and self._fold_depth is None:
+                self._fold_depth = self._depth
+
+    def handle_endtag(self, tag):
+        if self.done or tag != 'section':
+            return
+        if self._depth == self._fold_depth:
+            self.done = True
+        self._depth -= 1
+
+
+def _unescape(name):
+    return re.sub(r'\\(.)', r'\1', name)
+
+
+def _strip_functional(selector):
+    """Drop the arguments of :not(), :is(), :where() etc."""
+    while '(' in selector:
+        stripped = re.sub(r'(?<!\\)\((?:\\.|[^()])*(?<!\\)\)', '', selector)
+        if stripped == selector:
+            break
+        selector = stripped
+    return selector
+
+
+def _split_top_level(text, separator=','):
+    parts, depth, current = [], 0, []
+    escaped = False
+    for char in text:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append(''.join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def selector_matches(selector, used):
+    """True if every tag, class and id in ``selector`` appears in ``used``"""
+    simple = _strip_functional(selector)
+    attributes = set()
+    for name, operator, value in _ATTRIBUTE_RE.findall(simple):
+        # Only exact matches can be checked; other operators just need the name
+        attributes.add((name, value.strip('\'"') if operator == '=' else None))
+    simple = _ATTRIBUTE_RE.sub('', simple)
+    # Pseudo-elements/-classes name no element, so cut them before scanning
+    simple = re.sub(r'(?<!\\)::?[\w-]+', '', simple)
+    classes = {_unescape(name) for name in _CLASS_RE.findall(simple)}
+    ids = {_unescape(name) for name in _ID_RE.findall(simple)}
+    tags = {tag.lower() for tag in _TAG_RE.findall(re.sub(r'[.#](?:\\.|[\w-])+', ' ', simple))}
+    return (
+        classes <= used['classes'] and ids <= used['ids']
+        and tags <= used['tags'] and attributes <= used['attributes']
+    )
+
+
+def _block_end(css, start):
+    """Index just past the ``}`` matching the ``{`` at ``start``"""
+    depth = 0
+    index = start
+    while index < len(css):
+        char = css[index]
+        if char in '"\'':
+            index = css.index(char, index + 1)
+        elif css.startswith('/*', index):
+            index = css.index('*/', index) + 1
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return len(css)
+
+
+def parse_rules(css):
+    """Yield ``(prelude, body)`` for each top-level rule; body is None for statements"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    index = 0
+    while index < len(css):
+        brace = css.find('{', index)
+        semicolon = css.find(';', index)
+        if brace == -1:
+            break
+        start = _WHITESPACE_RE.match(css, index).end()
+        if css.startswith('@', start) and semicolon != -1 and semicolon < brace:
+            yield css[index:semicolon].strip(), None
+            index = semicolon + 1
+            continue
+        end = _block_end(css, brace)
+        yield css[index:brace].strip(), css[brace + 1:end - 1].strip()
+        index = end
+
+
+def extract(css, used):
+    """Return the rules of ``css`` needed to paint the elements in ``used``"""
+    kept = []
+    keyframes = {}
+    for prelude, body in parse_rules(css):
+        if body is None:
+            if prelude.lower().startswith('@charset'):
+                kept.append(f'{prelude};')
+            continue
+        if prelude.startswith('@'):
+            lowered = prelude.lower()
+            if lowered.startswith(_GROUPING_AT_RULES):
+                inner = extract(body, used)
+                if inner:
+                    kept.append(f'{prelude}{{{inner}}}')
+            elif lowered.startswith(('@keyframes', '@-webkit-keyframes')):
+                keyframes[prelude.split(None, 1)[1].strip()] = f'{prelude}{{{body}}}'
+            continue
+        selectors = [selector for selector in _split_top_level(prelude) if selector_matches(selector, used)]
+        if selectors:
+            kept.append(f"{','.join(selectors)}{{{body}}}")
+
+    # Animations used above the fold need their keyframes too
+    critical = ''.join(kept)
+    animations = set()
+    for value in _ANIMATION_RE.findall(critical):
+        animations.update(re.findall(r'[\w-]+', value))
+    critical += ''.join(rule for name, rule in keyframes.items() if name in animations)
+    return critical
+
+
+def used_selectors(html, safelist=DEFAULT_SAFELIST, fold_id='home'):
+    parser = FoldParser(fold_id=fold_id)
+    parser.feed(html)
+    parser.close()
+    return {
+        'tags': parser.tags,
+        'classes': parser.classes | set(safelist),
+        'ids': parser.ids,
+        'attributes': parser.attributes,
+    }
+
+
+def critical_css_path():
+    return os.fspath(getattr(settings, 'CRITICAL_CSS_FILE', os.path.join(settings.STATIC_ROOT, 'critical.css')))
+
+
+_cached = {}
+
+
+def get_critical_css():
+    """Contents of the built critical CSS file, or '' if it was not built"""
+    path = critical_css_path()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return ''
+    if _cached.get('key') != (path, mtime):
+        with open(path, encoding='utf-8') as handle:
+            _cached['css'] = handle.read()
+        _cached['key'] = (path, mtime)
+    return _cached['css']
@@ -0,0 +1,10 @@
+"""
+Database backends with a per-process connection pool.
+
+``portfolio_app.db_backends.sqlite3`` and ``portfolio_app.db_backends.postgresql``
+are drop-in ``ENGINE`` values. Django still opens and closes a connection per
+request (and per thread under gunicorn's ``gthread`` workers); the close hands
+the driver connection back to a bounded pool instead of tearing it down, and
+the next request reuses it. Pool settings live in the ``POOL`` key of the
+database settings; see ``pool.py``.
+"""
@@ -0,0 +1,39 @@
+from .pool import get_pool
+
+
+class PooledDatabaseWrapperMixin:
+    """Take driver connections from the process pool and give them back on close"""
+
+    def pool_options(self):
+        return self.settings_dict.get('POOL') or {}
+
+    def connection_is_alive(self, connection):
+        return True
+
+    def create_connection(self, conn_params):
+        """A brand-new driver connection; only the pool calls this"""
+        return super().get_new_connection(conn_params)
+
+    def get_pool(self, conn_params):
+        key = repr(sorted(conn_params.items()))
+        return get_pool(
+            self.alias, key, self.pool_options(),
+            lambda: self.create_connection(conn_params), self.connection_is_alive,
+        )
+
+    def get_new_connection(self, conn_params):
+        self._pool = self.get_pool(conn_params)
+        return self._pool.acquire()
+
+    def _close(self):
+        if self.connection is None:
+            return
+        reusable = not self.errors_occurred or self.is_usable()
+        if reusable:
+            try:
+                # Never hand a half-finished transaction to the next request
+                with self.wrap_database_errors:
+                    self.connection.rollback()
+            except Exception:
+                reusable = False
+        self._pool.release(self.connection, reusable=reusable)
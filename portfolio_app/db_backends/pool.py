@@ -0,0 +1,200 @@
+"""
+A small thread-safe pool of DB-API connections.
+
+Each process keeps one pool per database. At most ``MAX_SIZE`` connections
+exist at a time; a thread that finds them all in use waits up to ``TIMEOUT``
+seconds for one to be returned before failing with ``OperationalError``.
+Connections older than ``MAX_LIFETIME`` seconds are replaced when they come
+back. Every pool counts how often and how long threads waited, which
+``pool_stats()`` reports (see the health check).
+
+Forked children (gunicorn workers) start with empty pools: idle connections
+are closed before the fork and nothing the parent opened is ever reused.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_SIZE': 4,
+    'TIMEOUT': 10.0,
+    'MAX_LIFETIME': 60 * 60,
+    # Waits longer than this are logged
+    'SLOW_WAIT': 0.1,
+}
+
+
+class PoolTimeout(OperationalError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, name, connect, is_alive=None, max_size=4, timeout=10.0, max_lifetime=3600, slow_wait=0.1):
+        self.name = name
+        self.connect = connect
+        self.is_alive = is_alive or (lambda connection: True)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.slow_wait = slow_wait
+        self._lock = threading.Condition()
+        self._idle = deque()
+        self._born = {}
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self._idle.clear()
+        self._born.clear()
+        self.size = 0
+        self.acquired = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+
+    def acquire(self):
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        with self._lock:
+            while True:
+                while self._idle:
+                    # Most recently used first: it is the likeliest to be alive
+                    connection = self._idle.pop()
+                    if self.is_alive(connection):
+                        return self._checked_out(connection, started, waited)
+                    self._discard(connection)
+                if self.size < self.max_size:
+                    self.size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout(
+                        f"No connection in pool '{self.name}' became free within {self.timeout}s "
+                        f"({self.max_size} in use)"
+                    )
+                waited = True
+                self._lock.wait(remaining)
+
+        # Connect outside the lock so a slow server doesn't block releases
+        try:
+            connection = self.connect()
+        except BaseException:
+            with self._lock:
+                self.size -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._born[id(connection)] = time.monotonic()
+            return self._checked_out(connection, started, waited)
+
+    def _checked_out(self, connection, started, waited):
+        self.acquired += 1
+        if waited:
+            elapsed = time.monotonic() - started
+            self.waits += 1
+            self.wait_time += elapsed
+            self.max_wait = max(self.max_wait, elapsed)
+            if elapsed >= self.slow_wait:
+                logger.warning(f"Waited {elapsed * 1000:.0f}ms for a connection from pool '{self.name}'")
+        return connection
+
+    def release(self, connection, reusable=True):
+        with self._lock:
+            if id(connection) not in self._born:
+                # Opened before a fork or after a reset; not ours to keep
+                reusable = False
+            elif time.monotonic() - self._born[id(connection)] > self.max_lifetime:
+                reusable = False
+            if reusable:
+                self._idle.append(connection)
+            else:
+                self._discard(connection)
+            self._lock.notify()
+
+    def _discard(self, connection):
+        if self._born.pop(id(connection), None) is not None:
+            self.size -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close_idle(self):
+        with self._lock:
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def reset(self):
+        """Forget every connection without touching it (they belong to the parent)"""
+        with self._lock:
+            self._reset_counters()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'max_size': self.max_size,
+                'open': self.size,
+                'idle': len(self._idle),
+                'in_use': self.size - len(self._idle),
+                'acquired': self.acquired,
+                'waits': self.waits,
+                'wait_ms_total': round(self.wait_time * 1000, 1),
+                'wait_ms_max': round(self.max_wait * 1000, 1),
+                'timeouts': self.timeouts,
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, key, options, connect, is_alive=None):
+    """The pool for ``alias``; ``key`` identifies the connection parameters"""
+    with _pools_lock:
+        pool = _pools.get((alias, key))
+        if pool is None:
+            settings = {**DEFAULTS, **(options or {})}
+            pool = ConnectionPool(
+                alias, connect, is_alive,
+                max_size=settings['MAX_SIZE'],
+                timeout=settings['TIMEOUT'],
+                max_lifetime=settings['MAX_LIFETIME'],
+                slow_wait=settings['SLOW_WAIT'],
+            )
+            _pools[(alias, key)] = pool
+        return pool
+
+
+def pool_stats():
+    """``{alias: stats}`` for every pool in this process"""
+    with _pools_lock:
+        return {alias: pool.stats() for (alias, _), pool in _pools.items()}
+
+
+def close_idle_connections():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_idle()
+
+
+def _reset_after_fork():
+    # A fork can happen while another thread holds the locks
+    global _pools_lock
+    _pools_lock = threading.Lock()
+    for pool in _pools.values():
+        pool._lock = threading.Condition()
+        pool.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=close_idle_connections, after_in_child=_reset_after_fork)
@@ -0,0 +1,11 @@
+"""Pooled PostgreSQL backend"""
+
+from django.db.backends.postgresql import base
+
+from ..mixins import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    def connection_is_alive(self, connection):
+        # Both psycopg 2 and 3 flag connections the server has dropped
+        return not connection.closed
@@ -0,0 +1,56 @@
+"""
+Pooled SQLite backend in WAL mode.
+
+Write-ahead logging lets readers carry on while a write is in progress, which
+is what makes several threads per worker useful on SQLite; ``busy_timeout``
+makes a writer wait for the lock instead of failing at once.
+
+Read-only replica copies are replaced whole by ``manage.py
+sync_sqlite_replica``; a pooled connection still reading the replaced file is
+dropped when it is next taken from the pool.
+"""
+
+import os
+
+from django.db.backends.sqlite3 import base
+
+from ..mixins import PooledDatabaseWrapperMixin
+
+
+class ReplicaConnection(base.Database.Connection):
+    # (device, inode) of the file when the connection was opened
+    file_id = None
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    def is_read_only_copy(self):
+        return 'mode=ro' in str(self.settings_dict['NAME'])
+
+    def database_file_id(self):
+        path = str(self.settings_dict['NAME']).removeprefix('file:').split('?', 1)[0]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def connection_is_alive(self, connection):
+        file_id = getattr(connection, 'file_id', None)
+        return file_id is None or file_id == self.database_file_id()
+
+    def create_connection(self, conn_params):
+        if self.is_read_only_copy():
+            # Before connecting: if the file is replaced in between, the
+            # connection is merely reopened once more
+            file_id = self.database_file_id()
+            connection = super().create_connection({**conn_params, 'factory': ReplicaConnection})
+            connection.file_id = file_id
+        else:
+            connection = super().create_connection(conn_params)
+        # Read-only replica copies (mode=ro) can't change their journal mode
+        if not self.is_in_memory_db() and not self.is_read_only_copy():
+            connection.execute('PRAGMA journal_mode = WAL')
+            # Durable at checkpoints; safe with WAL and much cheaper per commit
+            connection.execute('PRAGMA synchronous = NORMAL')
+        connection.execute(f"PRAGMA busy_timeout = {int(self.pool_options().get('BUSY_TIMEOUT', 5) * 1000)}")
+        return connection
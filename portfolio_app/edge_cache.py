@@ -0,0 +1,117 @@
+"""
+Shared (CDN) caching of public pages.
+
+Views decorated with ``@edge_cache('project', ...)`` let a CDN keep their
+responses for ``EDGE_CACHE_SECONDS`` and serve a stale copy for up to
+``EDGE_STALE_SECONDS`` more while it refetches in the background. Each
+response carries a ``Surrogate-Key`` header naming the models it shows (by
+``model_name``); saving or deleting one of those calls
+``EDGE_CACHE_PURGE_HOOK`` with its key once the change is committed, so the
+CDN drops exactly the pages that show it.
+
+``EdgeCacheMiddleware`` decides once every other middleware has run: a
+response that sets a cookie or varies on ``Cookie`` may hold one visitor's
+data (a session, flash messages, a CSRF token) and is marked ``private``
+instead.
+"""
+
+import logging
+import urllib.request
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.cache import get_max_age, has_vary_header, patch_cache_control
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# On every shared response, so a deploy can purge the whole site at once
+SURROGATE_KEY_ALL = 'portfolio'
+
+SHAREABLE_STATUSES = (200, 304)
+
+
+def edge_cache(*keys):
+    """Mark a view whose anonymous responses a CDN may share, tagged with ``keys``"""
+    def decorator(view):
+        view.surrogate_keys = keys
+        return view
+    return decorator
+
+
+def is_shareable(request, response):
+    return (
+        request.method in ('GET', 'HEAD')
+        and response.status_code in SHAREABLE_STATUSES
+        and not response.cookies
+        and not has_vary_header(response, 'Cookie')
+    )
+
+
+class EdgeCacheMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        keys = getattr(request, 'surrogate_keys', None)
+        if keys is None or not settings.EDGE_CACHE_SECONDS:
+            return response
+        if is_shareable(request, response):
+            if get_max_age(response) is None:
+                # Browsers revalidate (with the ETag); only the CDN keeps it
+                patch_cache_control(response, max_age=0)
+            patch_cache_control(
+                response, public=True,
+                s_maxage=settings.EDGE_CACHE_SECONDS,
+                stale_while_revalidate=settings.EDGE_STALE_SECONDS,
+            )
+            response['Surrogate-Key'] = ' '.join((SURROGATE_KEY_ALL, *keys))
+        else:
+            patch_cache_control(response, private=True)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.surrogate_keys = getattr(view_func, 'surrogate_keys', None)
+
+
+def exclude_from_edge_cache(request, response):
+    """Keep ``response`` out of shared caches, e.g. one answering unknown query values"""
+    request.surrogate_keys = None
+    patch_cache_control(response, private=True)
+    return response
+
+
+def surrogate_key(model):
+    return model._meta.model_name
+
+
+def purge_surrogate_keys(*keys):
+    """Have the CDN drop every response tagged with ``keys`` once the current transaction commits"""
+    if not settings.EDGE_CACHE_PURGE_HOOK or not settings.EDGE_CACHE_SECONDS:
+        return
+    transaction.on_commit(lambda: _run_purge_hook(keys))
+
+
+def _run_purge_hook(keys):
+    # A CDN outage must never fail the save that triggered the purge; the
+    # pages then simply expire after EDGE_CACHE_SECONDS
+    try:
+        import_string(settings.EDGE_CACHE_PURGE_HOOK)(keys)
+    except Exception as e:
+        logger.error(f"Purging surrogate keys {' '.join(keys)} failed: {str(e)}")
+
+
+def fastly_purge(keys):
+    """``EDGE_CACHE_PURGE_HOOK`` for Fastly, using FASTLY_API_TOKEN and FASTLY_SERVICE_ID"""
+    request = urllib.request.Request(
+        f'https://api.fastly.com/service/{settings.FASTLY_SERVICE_ID}/purge',
+        method='POST',
+        headers={
+            'Fastly-Key': settings.FASTLY_API_TOKEN,
+            'Surrogate-Key': ' '.join(keys),
+            # Mark stale rather than evict, so stale-while-revalidate applies
+            'Fastly-Soft-Purge': '1',
+        },
+    )
+    urllib.request.urlopen(request, timeout=5).close()
@@ -0,0 +1,290 @@
+"""
+Rate-limited, deduplicated server error reports.
+
+``ErrorReportHandler`` takes the place of Django's ``AdminEmailHandler``.
+Inside the failing request it only fingerprints the error (exception type
+plus the innermost frame in project code), formats the traceback and queues
+it. A background thread per process then does the slow part:
+
+- every occurrence is counted in ``ErrorReport``, one row per fingerprint,
+  which the admin lists as the error index; a burst costs one write per
+  fingerprint per batch, not one per failing request;
+- admins are mailed about a fingerprint at most once per
+  ``ERROR_MAIL_INTERVAL`` seconds, across all workers, with the number of
+  occurrences since the previous mail, and no more than
+  ``ERROR_MAIL_MAX_PER_HOUR`` mails are sent in all. In digest mode (see
+  ``notifications.py``) the mail joins the admins' digest instead.
+
+If the queue fills up during a storm, further reports are dropped and
+counted, never blocking the request. If the database itself is failing, so
+that nothing can be recorded, admins are still mailed straight away, with
+the same limits kept in process memory instead.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import traceback
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.mail import mail_admins
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .notifications import ERROR, digest_enabled, make_fingerprint, notify
+
+logger = logging.getLogger(__name__)
+
+def error_location(tb):
+    """``path:line in function`` of the innermost frame in project code"""
+    frames = traceback.extract_tb(tb)
+    base_dir = str(settings.BASE_DIR)
+    for frame in reversed(frames):
+        if frame.filename.startswith(base_dir) and 'site-packages' not in frame.filename:
+            break
+    else:
+        frame = frames[-1]
+    filename = frame.filename
+    if filename.startswith(base_dir):
+        filename = str(Path(filename).relative_to(base_dir))
+    return f'{filename}:{frame.lineno} in {frame.name}'
+
+
+def build_report(record):
+    """Everything the reporter thread needs, taken from the log record while it is current"""
+    exc_type, exc, tb = record.exc_info or (None, None, None)
+    if exc_type is not None and tb is not None:
+        exception_type = f'{exc_type.__module__}.{exc_type.__qualname__}'.removeprefix('builtins.')
+        location = error_location(tb)
+        message = str(exc)
+        text = ''.join(traceback.format_exception(exc_type, exc, tb))
+    else:
+        exception_type = record.levelname
+        location = f'{record.pathname}:{record.lineno} in {record.funcName}'
+        message = record.getMessage()
+        text = ''
+    request = getattr(record, 'request', None)
+    return {
+        'fingerprint': make_fingerprint(exception_type, location),
+        'exception_type': exception_type[:255],
+        'location': location[:255],
+        'message': message,
+        'path': getattr(request, 'path', '')[:255],
+        'traceback': text,
+        'time': timezone.now(),
+    }
+
+
+class ErrorReporter:
+    def __init__(self, max_queue=1000, batch_wait=0.5):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.batch_wait = batch_wait
+        self.dropped = 0
+        # For errors that couldn't be recorded: fingerprint -> when last
+        # mailed (monotonic), and [hour, mails sent in it]
+        self.unrecorded_mailed = {}
+        self.unrecorded_hour = [None, 0]
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def report(self, data):
+        self._ensure_thread()
+        try:
+            self.queue.put_nowait(data)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='error-reporter', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self.drain()
+            try:
+                self.process(batch)
+            except Exception as e:
+                logger.error(f"Recording {len(batch)} error report(s) failed: {str(e)}")
+            finally:
+                # Hand this thread's connection back to the pool between batches
+                connections.close_all()
+
+    def drain(self, block=True):
+        """Queued reports; waits for the first one, then gathers a burst for ``batch_wait`` seconds"""
+        batch = [self.queue.get()] if block else []
+        deadline = time.monotonic() + self.batch_wait
+        while True:
+            remaining = deadline - time.monotonic() if block else 0
+            try:
+                batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def process(self, batch):
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            logger.warning(f"Dropped {dropped} error report(s); the report queue was full")
+
+        # The latest details of each fingerprint, with how often it occurred
+        groups = {}
+        for data in batch:
+            group = groups.get(data['fingerprint'])
+            if group is None:
+                groups[data['fingerprint']] = {**data, 'occurrences': 1, 'first_time': data['time']}
+            else:
+                group.update(data, occurrences=group['occurrences'] + 1, first_time=group['first_time'])
+
+        for group in groups.values():
+            try:
+                report = self.record(group)
+            except Exception as e:
+                logger.error(f"Recording error {group['exception_type']} failed: {str(e)}")
+                self.mail_unrecorded(group)
+                continue
+            self.mail(report)
+
+    def record(self, group):
+        """Add a group of occurrences to its ErrorReport row"""
+        from .models import ErrorReport
+
+        latest = {
+            'exception_type': group['exception_type'],
+            'location': group['location'],
+            'message': group['message'],
+            'last_path': group['path'],
+            'traceback': group['traceback'],
+            'last_seen_at': group['time'],
+        }
+        counted = ErrorReport.objects.filter(fingerprint=group['fingerprint'])
+        if not counted.update(
+            count=F('count') + group['occurrences'], unmailed_count=F('unmailed_count') + group['occurrences'], **latest
+        ):
+            try:
+                return ErrorReport.objects.create(
+                    fingerprint=group['fingerprint'], count=group['occurrences'],
+                    unmailed_count=group['occurrences'], first_seen_at=group['first_time'], **latest
+                )
+            except IntegrityError:
+                # Another worker recorded the first occurrence at the same moment
+                counted.update(
+                    count=F('count') + group['occurrences'],
+                    unmailed_count=F('unmailed_count') + group['occurrences'], **latest
+                )
+        return counted.get()
+
+    def mail(self, report):
+        """Mail admins about ``report`` unless it was mailed recently or the hourly budget is spent"""
+        from .models import ErrorReport
+
+        if not settings.ADMINS:
+            return
+        now = timezone.now()
+        with transaction.atomic():
+            # Claimed with a conditional UPDATE, so only one worker mails each
+            # interval; only the winner spends a slot of the hourly budget
+            claimed = ErrorReport.objects.filter(pk=report.pk).filter(
+                Q(last_mailed_at__isnull=True)
+                | Q(last_mailed_at__lte=now - timedelta(seconds=settings.ERROR_MAIL_INTERVAL))
+            )
+            if not claimed.update(last_mailed_at=now, unmailed_count=0):
+                return
+            if not self.take_mail_slot(now):
+                # Over budget: leave the occurrences unmailed for a later email
+                transaction.set_rollback(True)
+                return
+
+        subject = f'Error: {report.exception_type} at {report.location}'
+        summary = f'{report.unmailed_count} occurrence(s) since the last email'
+        if report.last_mailed_at:
+            summary += f' at {report.last_mailed_at:%Y-%m-%d %H:%M:%S}'
+        body = (
+            f'{summary}; {report.count} since {report.first_seen_at:%Y-%m-%d %H:%M:%S}.\n'
+            f'Last request: {report.last_path or "-"}\n'
+            f'Message: {report.message}\n\n'
+            f'{report.traceback}'
+        )
+        if digest_enabled():
+            notify([email for _, email in settings.ADMINS], subject, body, kind=ERROR, fingerprint=report.fingerprint)
+        else:
+            mail_admins(subject, body, fail_silently=True)
+
+    def mail_unrecorded(self, group):
+        """Mail admins about a group the database couldn't take, within this process's limits"""
+        if not settings.ADMINS:
+            return
+        mailed_at = self.unrecorded_mailed.get(group['fingerprint'])
+        if mailed_at is not None and time.monotonic() - mailed_at < settings.ERROR_MAIL_INTERVAL:
+            return
+        hour = int(time.time() // 3600)
+        if self.unrecorded_hour[0] != hour:
+            self.unrecorded_hour = [hour, 0]
+        if self.unrecorded_hour[1] >= settings.ERROR_MAIL_MAX_PER_HOUR:
+            return
+        self.unrecorded_hour[1] += 1
+        self.unrecorded_mailed[group['fingerprint']] = time.monotonic()
+
+        body = (
+            f'{group["occurrences"]} occurrence(s) since {group["first_time"]:%Y-%m-%d %H:%M:%S}; '
+            f'not recorded, the database is unavailable.\n'
+            f'Last request: {group["path"] or "-"}\n'
+            f'Message: {group["message"]}\n\n'
+            f'{group["traceback"]}'
+        )
+        mail_admins(f'Error: {group["exception_type"]} at {group["location"]}', body, fail_silently=True)
+
+    def take_mail_slot(self, now):
+        """Count one email against this hour's ERROR_MAIL_MAX_PER_HOUR; False if it is spent"""
+        from .models import ErrorMailHour
+
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        _, created = ErrorMailHour.objects.get_or_create(hour=hour)
+        if created:
+            ErrorMailHour.objects.filter(hour__lt=hour - timedelta(days=1)).delete()
+        # A conditional UPDATE, so workers can't overrun the budget together
+        return bool(
+            ErrorMailHour.objects.filter(hour=hour, sent__lt=settings.ERROR_MAIL_MAX_PER_HOUR)
+            .update(sent=F('sent') + 1)
+        )
+
+
+_reporter = None
+_reporter_lock = threading.Lock()
+
+
+def get_reporter():
+    global _reporter
+    if _reporter is None:
+        with _reporter_lock:
+            if _reporter is None:
+                _reporter = ErrorReporter()
+    return _reporter
+
+
+def _reset_after_fork():
+    # The parent's thread doesn't exist in the child; start afresh
+    global _reporter, _reporter_lock
+    _reporter = None
+    _reporter_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class ErrorReportHandler(logging.Handler):
+    """Logging handler that queues errors for the reporter thread"""
+
+    def emit(self, record):
+        try:
+            get_reporter().report(build_report(record))
+        except Exception:
+            self.handleError(record)
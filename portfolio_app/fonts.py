@@ -0,0 +1,55 @@
+"""
+Self-hosted web fonts.
+
+``manage.py subset_fonts`` subsets the vendored Inter files to the glyphs the
+site renders and writes content-hashed WOFF2 files plus ``fonts.json`` into
+``static/fonts/``. The ``font_faces`` template tag turns that manifest into
+preload hints and ``@font-face`` rules; until the command has been run,
+pages fall back to the system font (``tailwind.config.js``).
+"""
+
+import json
+import os
+
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+FONT_FAMILY = 'Inter'
+FONT_WEIGHTS = (300, 400, 500, 600, 700)
+FONT_MANIFEST = 'fonts/fonts.json'
+
+# Weights the first viewport needs; the others are fetched when used
+DEFAULT_PRELOAD_WEIGHTS = (400, 700)
+
+
+_cached = {}
+
+
+def load_manifest():
+    """The ``fonts.json`` written by ``subset_fonts``, or None"""
+    path = finders.find(FONT_MANIFEST)
+    if not path:
+        return None
+    mtime = os.stat(path).st_mtime_ns
+    if _cached.get('key') != (path, mtime):
+        with open(path, encoding='utf-8') as handle:
+            _cached['manifest'] = json.load(handle)
+        _cached['key'] = (path, mtime)
+    return _cached['manifest']
+
+
+def font_face_markup(manifest):
+    """Preload links and an inline ``@font-face`` block for ``manifest``"""
+    faces = manifest['faces']
+    preloads = format_html_join(
+        '\n', '<link rel="preload" href="{}" as="font" type="font/woff2" crossorigin>',
+        ((static(face['file']),) for face in faces if face['preload']),
+    )
+    rules = format_html_join(
+        '',
+        "@font-face{{font-family:'{}';font-style:{};font-weight:{};font-display:swap;"
+        "src:url('{}') format('woff2')}}",
+        ((manifest['family'], face['style'], face['weight'], static(face['file'])) for face in faces),
+    )
+    return format_html('{}\n<style>{}</style>', preloads, rules)
@@ -0,0 +1,114 @@
+"""
+Helpers that keep the contact-message admin usable once the inbox grows
+into the tens of thousands of rows.
+
+- ``search_messages`` routes admin search through the SQLite FTS5 index
+  created in migration 0002 instead of ``LIKE '%...%'`` scans.
+- ``EstimatedCountPaginator`` bounds the ``COUNT(*)`` the admin runs on
+  every changelist page.
+- ``KeysetChangeList`` pages through the default newest-first ordering with
+  a ``(created_at, id)`` cursor, so deep pages cost the same as the first.
+"""
+
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR, PAGE_VAR
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.functional import cached_property
+
+from .search import build_fts_query, fts_table_exists
+
+FTS_TABLE = 'portfolio_app_contactmessage_fts'
+
+# Query-string parameter carrying the keyset cursor (id of the last row seen)
+CURSOR_VAR = 'before'
+
+
+def fts_available(using='default'):
+    """Return True if the contact-message FTS5 index exists on this database"""
+    return fts_table_exists(FTS_TABLE, using)
+
+
+def search_messages(queryset, term):
+    """Filter a ContactMessage queryset by an FTS5 match on ``term``"""
+    fts_query = build_fts_query(term)
+    if not fts_query:
+        return queryset
+    return queryset.filter(pk__in=RawSQL(
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+        [fts_query],
+    ))
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator whose count stops at ``count_cap`` rows.
+
+    Counting through a LIMITed subquery keeps the cost bounded no matter how
+    large the table is; ``is_estimated`` tells templates to render "N+".
+    """
+    count_cap = 10000
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        capped = self.object_list[:self.count_cap + 1].count()
+        self.is_estimated = capped > self.count_cap
+        return min(capped, self.count_cap)
+
+
+class KeysetChangeList(ChangeList):
+    """
+    ChangeList that seeks instead of using OFFSET for the default ordering.
+
+    Keyset mode is only used when the list is in its default newest-first
+    order and no explicit page number was requested; any column sort falls
+    back to the stock offset pagination.
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        self.cursor = request.GET.get(CURSOR_VAR)
+        self.next_cursor = None
+        self.keyset = ORDER_VAR not in request.GET and PAGE_VAR not in request.GET and not self.show_all
+        if not self.keyset:
+            return super().get_results(request)
+
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        queryset = self.queryset
+        if self.cursor:
+            queryset = self.seek(queryset, self.cursor)
+
+        rows = list(queryset[:self.list_per_page + 1])
+        if len(rows) > self.list_per_page:
+            rows = rows[:self.list_per_page]
+            self.next_cursor = rows[-1].pk
+
+        self.result_count = paginator.count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows
+        self.can_show_all = False
+        self.multi_page = self.next_cursor is not None or bool(self.cursor)
+        self.paginator = paginator
+        self.newest_url = self.get_query_string(remove=[CURSOR_VAR])
+        self.older_url = self.get_query_string({CURSOR_VAR: self.next_cursor}) if self.next_cursor else None
+
+    def seek(self, queryset, cursor):
+        """Return rows strictly older than the row identified by ``cursor``"""
+        try:
+            pk = int(cursor)
+        except (TypeError, ValueError):
+            return queryset
+        created_at = self.model.objects.filter(pk=pk).values_list('created_at', flat=True).first()
+        if created_at is None:
+            # The anchor row was archived away; the id alone still orders correctly
+            return queryset.filter(pk__lt=pk)
+        return queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+        )
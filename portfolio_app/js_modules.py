@@ -0,0 +1,58 @@
+"""
+Static import graph of the JavaScript modules under ``static/js``.
+
+Pages load a single module entry point (``js/site.js``, ``js/home.js``);
+``modulepreload`` links for everything it imports statically let the
+browser fetch the whole graph in parallel instead of one level at a time.
+Dynamic ``import()`` targets are left out on purpose, they load on first use.
+"""
+
+import posixpath
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+# import x from './a.js'; import './a.js'; export { x } from './a.js';
+STATIC_IMPORT_RE = re.compile(
+    r"""^\s*(?:import|export)\b(?:[\s\w{},*]*?\bfrom)?\s*['"](?P<path>\.{1,2}/[^'"]+)['"]""",
+    re.MULTILINE,
+)
+
+
+def static_imports(name):
+    """Static names of the modules ``name`` imports directly"""
+    path = finders.find(name)
+    if not path:
+        return []
+    with open(path, encoding='utf-8') as handle:
+        source = handle.read()
+    directory = posixpath.dirname(name)
+    return [
+        posixpath.normpath(posixpath.join(directory, match.group('path')))
+        for match in STATIC_IMPORT_RE.finditer(source)
+    ]
+
+
+def _module_graph(name):
+    seen = []
+    pending = [name]
+    while pending:
+        current = pending.pop(0)
+        for dependency in static_imports(current):
+            if dependency not in seen and dependency != name:
+                seen.append(dependency)
+                pending.append(dependency)
+    return seen
+
+
+_cached_module_graph = lru_cache(maxsize=None)(_module_graph)
+
+
+def module_graph(name):
+    """Every module ``name`` depends on statically, breadth first"""
+    # Re-read the sources on every request while developing
+    if settings.DEBUG:
+        return _module_graph(name)
+    return list(_cached_module_graph(name))
@@ -0,0 +1,142 @@
+import gzip
+import io
+import json
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from portfolio_app.models import ContactMessage
+
+
+class Command(BaseCommand):
+    help = 'Move old contact messages out of the database into compressed NDJSON archives'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=180,
+            help='Archive messages older than this many days (default: 180)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows written and deleted per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--archive-dir',
+            default=None,
+            help='Directory for archive files (default: CONTACT_ARCHIVE_DIR)',
+        )
+        parser.add_argument(
+            '--include-unread',
+            action='store_true',
+            help='Also archive messages nobody has read or archived yet',
+        )
+        parser.add_argument(
+            '--full-vacuum',
+            action='store_true',
+            help='Switch SQLite to incremental auto-vacuum with a one-off full VACUUM',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be archived without changing anything',
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 0:
+            raise CommandError('--days must be zero or positive')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        queryset = ContactMessage.objects.filter(created_at__lt=cutoff)
+        if not options['include_unread']:
+            queryset = queryset.filter(Q(is_read=True) | Q(is_archived=True))
+
+        if options['dry_run']:
+            self.stdout.write(f"{queryset.count()} message(s) older than {cutoff:%Y-%m-%d} would be archived")
+            return
+
+        archive_dir = Path(options['archive_dir'] or settings.CONTACT_ARCHIVE_DIR)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_path = archive_dir / f"contact_messages_{timezone.now():%Y%m%dT%H%M%S%f}.ndjson.gz"
+
+        archived = self.archive(queryset, archive_path, options['batch_size'])
+        if archived:
+            self.stdout.write(self.style.SUCCESS(f'Archived {archived} message(s) to {archive_path}'))
+        else:
+            self.stdout.write('No messages to archive')
+
+        self.vacuum(options['full_vacuum'])
+
+    def archive(self, queryset, archive_path, batch_size):
+        """Write and delete matching rows in bounded, oldest-first batches"""
+        fields = [field.attname for field in ContactMessage._meta.concrete_fields]
+        archived = 0
+        last_pk = 0
+        raw = handle = None
+        try:
+            while True:
+                rows = list(
+                    queryset.filter(pk__gt=last_pk).order_by('pk').values(*fields)[:batch_size]
+                )
+                if not rows:
+                    break
+                if handle is None:
+                    # 'x' fails instead of overwriting another run's archive
+                    raw = open(archive_path, 'xb')
+                    handle = io.TextIOWrapper(
+                        gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=9), encoding='utf-8'
+                    )
+                for row in rows:
+                    handle.write(json.dumps(row, cls=DjangoJSONEncoder) + '\n')
+                # Make sure the batch is on disk before the rows disappear
+                handle.flush()
+                os.fsync(raw.fileno())
+
+                pks = [row['id'] for row in rows]
+                with transaction.atomic():
+                    ContactMessage.objects.filter(pk__in=pks).delete()
+                archived += len(pks)
+                last_pk = pks[-1]
+                self.stdout.write(f'  archived {archived} message(s)...')
+        finally:
+            if handle is not None:
+                handle.close()
+            if raw is not None:
+                # GzipFile leaves a file object it was given open
+                raw.close()
+        return archived
+
+    def vacuum(self, full):
+        """Give freed pages back to the filesystem on SQLite"""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            if full:
+                cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                cursor.execute('VACUUM')
+                self.stdout.write(self.style.SUCCESS('Database vacuumed, incremental auto-vacuum enabled'))
+                return
+
+            cursor.execute('PRAGMA auto_vacuum')
+            mode = cursor.fetchone()[0]
+            if mode != 2:
+                self.stdout.write(self.style.WARNING(
+                    'Incremental auto-vacuum is off; run once with --full-vacuum to enable it'
+                ))
+                return
+            cursor.execute('PRAGMA freelist_count')
+            free_pages = cursor.fetchone()[0]
+            cursor.execute('PRAGMA incremental_vacuum')
+            self.stdout.write(f'Released {free_pages} free page(s)')
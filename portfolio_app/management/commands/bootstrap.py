@@ -0,0 +1,106 @@
+import io
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+from portfolio_app import critical_css
+from portfolio_app.storage import collected_is_current
+
+STEPS = ('migrate', 'static', 'data', 'superuser')
+
+
+class Command(BaseCommand):
+    help = 'Prepare a container in one process: migrate, collect static files, load data and create the superuser'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skip',
+            nargs='+',
+            choices=STEPS,
+            default=[],
+            help='Steps to leave out',
+        )
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            choices=STEPS,
+            default=None,
+            help='Run just these steps, e.g. "--only static" in an image build',
+        )
+        parser.add_argument(
+            '--force-static',
+            action='store_true',
+            help='Collect static files even if STATIC_ROOT is already current',
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Database alias to migrate (default: "default")',
+        )
+
+    def handle(self, *args, **options):
+        steps = [
+            step for step in (options['only'] or STEPS)
+            if step not in options['skip']
+        ]
+        # Sub-commands only report problems; the timings say what happened
+        self.quiet = {'verbosity': max(options['verbosity'] - 1, 0)}
+
+        timings = []
+        started = time.perf_counter()
+        for step in steps:
+            step_started = time.perf_counter()
+            outcome = getattr(self, f'step_{step}')(options)
+            timings.append((step, outcome, time.perf_counter() - step_started))
+            self.stdout.write(f'  {step:<10} {outcome:<40} {timings[-1][2]:>7.2f}s')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Bootstrap finished in {time.perf_counter() - started:.2f}s'
+        ))
+
+    def step_migrate(self, options):
+        connection = connections[options['database']]
+        executor = MigrationExecutor(connection)
+        # The same plan ``migrate --check`` looks at
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        # The DatabaseCache table isn't a migration; a no-op once it exists
+        call_command('createcachetable', database=options['database'], **self.quiet)
+        if not plan:
+            return 'up to date, skipped'
+        call_command('migrate', database=options['database'], interactive=False, **self.quiet)
+        return f'applied {len(plan)} migration(s)'
+
+    def step_static(self, options):
+        if not options['force_static'] and collected_is_current(staticfiles_storage):
+            # An image built without a database has no critical CSS yet
+            if settings.CRITICAL_CSS_ON_COLLECTSTATIC and not critical_css.get_critical_css():
+                staticfiles_storage.build_critical_css()
+                return 'current, built critical CSS'
+            return 'current, skipped'
+        call_command('collectstatic', interactive=False, **self.quiet)
+        return 'collected'
+
+    def step_data(self, options):
+        # populate_sample_data narrates every row it touches
+        output = self.stdout if options['verbosity'] > 1 else io.StringIO()
+        call_command('populate_sample_data', stdout=output)
+        return 'loaded'
+
+    def step_superuser(self, options):
+        User = get_user_model()
+        username = os.environ.get('DJANGO_SUPERUSER_USERNAME', 'admin')
+        if User.objects.filter(username=username).exists():
+            return f'{username} exists'
+        User.objects.create_superuser(
+            username=username,
+            email=os.environ.get('DJANGO_SUPERUSER_EMAIL', 'admin@portfolio.com'),
+            password=os.environ.get('DJANGO_SUPERUSER_PASSWORD', 'admin123'),
+        )
+        return f'created {username}'
@@ -0,0 +1,66 @@
+import gzip
+import os
+
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app import critical_css
+from portfolio_app.prerender import render_homepage
+from portfolio_app.storage import minify
+
+
+class Command(BaseCommand):
+    help = 'Extract above-the-fold CSS from the rendered homepage for inlining into base.html'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='File to write the critical CSS to (default: CRITICAL_CSS_FILE)',
+        )
+        parser.add_argument(
+            '--seed',
+            action='store_true',
+            help='Render against sample data even if the database has content',
+        )
+        parser.add_argument(
+            '--safelist',
+            nargs='*',
+            default=list(critical_css.DEFAULT_SAFELIST),
+            help='Classes to treat as above the fold even if absent from the markup',
+        )
+
+    def handle(self, *args, **options):
+        html = render_homepage(seed=options['seed'])
+        used = critical_css.used_selectors(html, safelist=options['safelist'])
+
+        parts = []
+        report = []
+        for name in critical_css.CRITICAL_CSS_SOURCES:
+            source = finders.find(name)
+            if not source:
+                raise CommandError(f'Stylesheet {name} not found')
+            with open(source, 'rb') as handle:
+                full = minify(name, handle.read())
+            extracted = minify(name, critical_css.extract(full.decode('utf-8'), used).encode('utf-8'))
+            parts.append(extracted)
+            report.append((name, full, extracted))
+
+        output = options['output'] or critical_css.critical_css_path()
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        with open(output, 'wb') as handle:
+            handle.write(b''.join(parts))
+
+        if options['verbosity'] >= 1:
+            self.print_report(report)
+            self.stdout.write(self.style.SUCCESS(f'Critical CSS written to {output}'))
+
+    def print_report(self, report):
+        """Bytes that stop blocking first paint, per stylesheet"""
+        self.stdout.write(f"\n{'Stylesheet':<28} {'Full':>8} {'Inlined':>8} {'Deferred':>9} {'Gzip saved':>11}")
+        for name, full, extracted in report:
+            gzip_saved = len(gzip.compress(full, mtime=0)) - len(gzip.compress(extracted, mtime=0))
+            self.stdout.write(
+                f"{name:<28} {len(full):>8} {len(extracted):>8} "
+                f"{len(full) - len(extracted):>9} {gzip_saved:>11}"
+            )
@@ -0,0 +1,17 @@
+from django.contrib.staticfiles.management.commands.collectstatic import Command as CollectStaticCommand
+
+from portfolio_app.storage import format_size_report
+
+
+class Command(CollectStaticCommand):
+    """collectstatic that prints the asset size report (see portfolio_app/storage.py)"""
+
+    def collect(self):
+        self.storage.size_report = None
+        try:
+            return super().collect()
+        finally:
+            # Also when an asset is over budget: the table shows by how much
+            report = getattr(self.storage, 'size_report', None)
+            if report and self.verbosity >= 1:
+                self.stdout.write('\n' + '\n'.join(format_size_report(report)))
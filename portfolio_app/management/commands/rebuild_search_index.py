@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over projects, experiences and skills'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Documents inserted per statement batch (default: 500)',
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias to rebuild (default: "default")',
+        )
+
+    def handle(self, *args, **options):
+        if not search.search_available(options['database']):
+            raise CommandError('The search index table does not exist; run "manage.py migrate" on SQLite first')
+
+        written = search.rebuild_index(batch_size=options['batch_size'], using=options['database'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {written} document(s)'))
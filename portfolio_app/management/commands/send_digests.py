@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from portfolio_app.models import NotificationDigest
+from portfolio_app.notifications import send_due_digests
+
+
+class Command(BaseCommand):
+    help = 'Send notification digests whose window has closed (see NOTIFICATION_DIGEST_MINUTES)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--watch',
+            type=int,
+            default=0,
+            metavar='SECONDS',
+            help='Keep running and check every SECONDS instead of exiting (for a scheduler container)',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Send every pending digest now, including those still inside their window',
+        )
+
+    def handle(self, *args, **options):
+        if options['watch'] < 0:
+            raise CommandError('--watch must be zero or positive')
+
+        while True:
+            if options['all']:
+                NotificationDigest.objects.filter(sent_at__isnull=True).update(due_at=timezone.now())
+            sent = send_due_digests()
+            if sent or not options['watch']:
+                self.stdout.write(self.style.SUCCESS(f'Sent {sent} digest(s)') if sent else 'No digests due')
+            if not options['watch']:
+                return
+            time.sleep(options['watch'])
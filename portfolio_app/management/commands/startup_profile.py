@@ -0,0 +1,207 @@
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+RESULT_MARKER = 'STARTUP_PROFILE '
+
+# Runs in a fresh interpreter under ``-X importtime`` so nothing this command
+# has already imported skews the numbers. It boots Django the way a gunicorn
+# worker does and serves the same request twice.
+PROBE = '''
+import json, os, resource, sys, time
+from io import BytesIO
+
+def lap(name):
+    global started
+    now = time.perf_counter()
+    phases.append((name, (now - started) * 1000, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    started = now
+
+phases = []
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio.settings')
+from django.conf import settings
+settings.INSTALLED_APPS
+lap('settings')
+
+import django
+django.setup()
+lap('app registry')
+
+from django.urls import get_resolver
+get_resolver().reverse_dict
+lap('urlconf')
+
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+lap('wsgi handler')
+boot_modules = sorted(sys.modules)
+
+path, host = sys.argv[1], sys.argv[2]
+def request():
+    status = []
+    environ = {
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SERVER_NAME': host,
+        'SERVER_PORT': '80', 'HTTP_HOST': host, 'SERVER_PROTOCOL': 'HTTP/1.1', 'REMOTE_ADDR': '127.0.0.1',
+        'wsgi.url_scheme': 'http', 'wsgi.input': BytesIO(), 'wsgi.errors': sys.stderr,
+        'wsgi.multithread': False, 'wsgi.multiprocess': True, 'wsgi.run_once': False,
+    }
+    response = application(environ, lambda code, headers, exc_info=None: status.append(code))
+    body = b''.join(response)
+    getattr(response, 'close', lambda: None)()
+    return status[0], len(body)
+
+first = request()
+lap('first request')
+request()
+lap('warm request')
+
+print(%r + json.dumps({
+    'phases': phases,
+    'status': first[0],
+    'bytes': first[1],
+    'boot_modules': boot_modules,
+    'request_modules': sorted(set(sys.modules) - set(boot_modules)),
+}))
+''' % RESULT_MARKER
+
+IMPORT_TIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+
+def parse_importtime(lines):
+    """``{module: (self_us, cumulative_us, depth)}`` from ``-X importtime`` output"""
+    modules = {}
+    for line in lines:
+        match = IMPORT_TIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+class Command(BaseCommand):
+    help = 'Profile worker startup: import costs, app registry and URLconf load, first-request latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default='/',
+            help='Path of the first request (default: /)',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help='Rows in the import tables (default: 15)',
+        )
+        parser.add_argument(
+            '--lazy',
+            nargs='*',
+            default=None,
+            help='Modules that should not be imported at boot (default: STARTUP_LAZY_IMPORTS)',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Fail if any of the lazy modules is imported before the first request',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the raw measurements as JSON',
+        )
+
+    def handle(self, *args, **options):
+        lazy = options['lazy'] if options['lazy'] is not None else settings.STARTUP_LAZY_IMPORTS
+        profile = self.run_probe(options['path'])
+        imports = profile['imports']
+
+        if options['json']:
+            self.stdout.write(json.dumps(profile, indent=2))
+        else:
+            self.print_phases(profile)
+            self.print_imports(imports, options['top'])
+            self.print_packages(imports, profile['boot_modules'], options['top'])
+            self.print_lazy(lazy, imports, profile)
+
+        eager = [name for name in lazy if name in profile['boot_modules']]
+        if options['check'] and eager:
+            raise CommandError(f"Imported at boot but listed as lazy: {', '.join(eager)}")
+
+    def run_probe(self, path):
+        hosts = [host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*']
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'portfolio.settings')}
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE, path, hosts[0] if hosts else 'localhost'],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        line = next((line for line in result.stdout.splitlines() if line.startswith(RESULT_MARKER)), None)
+        if result.returncode or line is None:
+            raise CommandError(f'Startup probe failed:\n{result.stderr[-2000:]}')
+        profile = json.loads(line[len(RESULT_MARKER):])
+        profile['imports'] = parse_importtime(result.stderr.splitlines())
+        return profile
+
+    def print_phases(self, profile):
+        self.stdout.write(f"{'Phase':<16} {'ms':>9} {'Max RSS (MB)':>13}")
+        boot = 0
+        for name, elapsed, max_rss in profile['phases']:
+            self.stdout.write(f'{name:<16} {elapsed:>9.1f} {max_rss / 1024:>13.1f}')
+            if name not in ('first request', 'warm request'):
+                boot += elapsed
+        self.stdout.write(f"{'boot total':<16} {boot:>9.1f}")
+        self.stdout.write(f"First request: HTTP {profile['status']}, {profile['bytes']} bytes")
+        self.stdout.write('')
+
+    def print_imports(self, imports, top):
+        self.stdout.write(f"{'Slowest modules (self)':<48} {'self ms':>8} {'cumul. ms':>10}")
+        for name, (self_us, cumulative_us, _) in sorted(imports.items(), key=lambda item: -item[1][0])[:top]:
+            self.stdout.write(f'{name:<48} {self_us / 1000:>8.1f} {cumulative_us / 1000:>10.1f}')
+        self.stdout.write('')
+
+    def print_packages(self, imports, boot_modules, top):
+        """Import cost per top-level package, split into boot and first request"""
+        boot_modules = set(boot_modules)
+        totals = defaultdict(lambda: [0, 0])
+        for name, (self_us, _, _) in imports.items():
+            totals[name.partition('.')[0]][0 if name in boot_modules else 1] += self_us
+        self.stdout.write(f"{'Package':<28} {'boot ms':>8} {'request ms':>11}")
+        for package, (boot_us, request_us) in sorted(totals.items(), key=lambda item: -sum(item[1]))[:top]:
+            self.stdout.write(f'{package:<28} {boot_us / 1000:>8.1f} {request_us / 1000:>11.1f}')
+        self.stdout.write('')
+
+    def print_lazy(self, lazy, imports, profile):
+        """Where each lazy module was loaded, plus third-party boot imports worth deferring"""
+        boot_modules = set(profile['boot_modules'])
+        request_modules = set(profile['request_modules'])
+        if lazy:
+            self.stdout.write(f"{'Lazy import':<28} {'loaded':<14} {'cumul. ms':>10}")
+            for name in lazy:
+                # importlib.import_module() calls are not timed by -X importtime
+                cumulative = f'{imports[name][1] / 1000:.1f}' if name in imports else '-'
+                if name in boot_modules:
+                    self.stdout.write(self.style.ERROR(f"{name:<28} {'at boot':<14} {cumulative:>10}"))
+                else:
+                    loaded = 'first request' if name in request_modules else 'not loaded'
+                    self.stdout.write(f'{name:<28} {loaded:<14} {cumulative:>10}')
+            self.stdout.write('')
+
+        # Top-level third-party packages imported at boot are the candidates
+        candidates = sorted(
+            (
+                (name, cumulative_us) for name, (_, cumulative_us, _) in imports.items()
+                if '.' not in name and not name.startswith('_') and name in boot_modules and name not in lazy
+                and name not in sys.stdlib_module_names and name not in ('django', 'portfolio', 'portfolio_app')
+            ),
+            key=lambda item: -item[1],
+        )
+        if candidates:
+            self.stdout.write('Third-party packages imported at boot (lazy-import candidates):')
+            for name, cumulative_us in candidates:
+                self.stdout.write(f'  {name:<26} {cumulative_us / 1000:>10.1f} ms')
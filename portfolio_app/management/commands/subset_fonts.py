@@ -0,0 +1,157 @@
+import hashlib
+import io
+import json
+import string
+from html.parser import HTMLParser
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app import fonts
+from portfolio_app.prerender import render_homepage
+
+# Always kept so dynamic text (project cards, form messages) never falls back
+DEFAULT_TEXT = string.printable.strip() + ' \u00a0–—‘’“”…•·©®™→←×'
+
+# Attributes whose values are shown to users or read by assistive technology
+TEXT_ATTRIBUTES = ('alt', 'title', 'aria-label', 'placeholder', 'value')
+
+
+class TextCollector(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = set()
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip += 1
+        for name, value in attrs:
+            if name in TEXT_ATTRIBUTES and value:
+                self.text.update(value)
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.text.update(data)
+
+
+class Command(BaseCommand):
+    help = 'Subset the vendored Inter fonts to the glyphs the site renders and write hashed WOFF2 files'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source-dir',
+            default=None,
+            help='Directory with the Inter .ttf/.otf/.woff2 files (default: FONT_SOURCE_DIR)',
+        )
+        parser.add_argument(
+            '--output-dir',
+            default=None,
+            help='Static directory to write the fonts to (default: static/fonts)',
+        )
+        parser.add_argument(
+            '--weights',
+            nargs='+',
+            type=int,
+            default=list(fonts.FONT_WEIGHTS),
+            help='Weights to emit (default: 300 400 500 600 700)',
+        )
+        parser.add_argument(
+            '--preload',
+            nargs='*',
+            type=int,
+            default=list(fonts.DEFAULT_PRELOAD_WEIGHTS),
+            help='Weights to preload from base.html (default: 400 700)',
+        )
+        parser.add_argument(
+            '--text',
+            default='',
+            help='Extra characters to keep in the subset',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from fontTools.ttLib import TTFont
+        except ImportError:
+            raise CommandError('fonttools is required: pip install fonttools')
+
+        source_dir = Path(options['source_dir'] or settings.FONT_SOURCE_DIR)
+        output_dir = Path(options['output_dir'] or Path(settings.STATICFILES_DIRS[0]) / 'fonts')
+        sources = sorted(
+            path for path in source_dir.glob('*')
+            if path.suffix.lower() in ('.ttf', '.otf', '.woff2')
+        )
+        if not sources:
+            raise CommandError(f'No font files found in {source_dir}')
+
+        codepoints = self.collect_codepoints(options['text'])
+        self.stdout.write(f'Subsetting to {len(codepoints)} characters')
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        previous = set(output_dir.glob('inter-*.woff2'))
+        faces = []
+        for weight in options['weights']:
+            font = self.load_weight(TTFont, sources, weight)
+            if font is None:
+                raise CommandError(f'No upright Inter source for weight {weight} in {source_dir}')
+            data = self.subset(font, codepoints)
+            filename = f'inter-{weight}.{hashlib.md5(data).hexdigest()[:12]}.woff2'
+            (output_dir / filename).write_bytes(data)
+            previous.discard(output_dir / filename)
+            faces.append({
+                'weight': weight,
+                'style': 'normal',
+                'file': f'fonts/{filename}',
+                'preload': weight in options['preload'],
+            })
+            self.stdout.write(f'  {filename:<36} {len(data):>8} bytes')
+
+        # Files from earlier runs would otherwise be collected forever
+        for stale in previous:
+            stale.unlink()
+
+        manifest = {'family': fonts.FONT_FAMILY, 'faces': faces}
+        (output_dir / 'fonts.json').write_text(json.dumps(manifest, indent=2) + '\n')
+        self.stdout.write(self.style.SUCCESS(f'Wrote {len(faces)} font(s) to {output_dir}'))
+
+    def collect_codepoints(self, extra_text):
+        collector = TextCollector()
+        collector.feed(render_homepage())
+        collector.close()
+        text = collector.text | set(DEFAULT_TEXT) | set(extra_text)
+        return sorted({ord(char) for char in text if not char.isspace() or char in ' \u00a0'})
+
+    def load_weight(self, TTFont, sources, weight):
+        """A TTFont for ``weight``: a matching static file or a variable font instance"""
+        for path in sources:
+            if 'italic' in path.stem.lower():
+                continue
+            font = TTFont(path)
+            if 'fvar' in font:
+                wght = next((axis for axis in font['fvar'].axes if axis.axisTag == 'wght'), None)
+                if wght and wght.minValue <= weight <= wght.maxValue:
+                    from fontTools.varLib import instancer
+                    return instancer.instantiateVariableFont(font, {'wght': weight})
+            # fsSelection bit 0 marks italic faces
+            elif font['OS/2'].usWeightClass == weight and not font['OS/2'].fsSelection & 1:
+                return font
+        return None
+
+    def subset(self, font, codepoints):
+        from fontTools import subset
+
+        options = subset.Options()
+        options.flavor = 'woff2'
+        options.desubroutinize = True
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        font.flavor = 'woff2'
+        buffer = io.BytesIO()
+        font.save(buffer)
+        return buffer.getvalue()
@@ -0,0 +1,46 @@
+import os
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from portfolio_app.routers import replica_aliases
+
+
+class Command(BaseCommand):
+    help = 'Refresh the read-only SQLite replica copies from the primary database'
+
+    def handle(self, *args, **options):
+        primary = connections['default']
+        if primary.vendor != 'sqlite':
+            raise CommandError('The primary database is not SQLite; replicate it with the database server')
+        targets = [
+            alias for alias in replica_aliases() if connections[alias].vendor == 'sqlite'
+        ]
+        if not targets:
+            raise CommandError('No SQLite replicas configured (see DATABASE_REPLICA_URLS)')
+
+        for alias in targets:
+            started = time.perf_counter()
+            path = self.replica_path(connections[alias].settings_dict['NAME'])
+            self.copy(primary.settings_dict['NAME'], path)
+            self.stdout.write(f'  {alias:<10} {path} {time.perf_counter() - started:>7.2f}s')
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {len(targets)} replica(s)'))
+
+    def replica_path(self, name):
+        """The file behind a ``file:...?mode=ro`` URI name"""
+        return str(name).removeprefix('file:').split('?', 1)[0]
+
+    def copy(self, source, destination):
+        temporary = f'{destination}.tmp'
+        os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+        with sqlite3.connect(source) as source_db, sqlite3.connect(temporary) as copy_db:
+            # A consistent snapshot, even while the site is writing
+            source_db.backup(copy_db)
+            # Read-only connections can't use WAL without the primary's -shm file
+            copy_db.execute('PRAGMA journal_mode = DELETE')
+        source_db.close()
+        copy_db.close()
+        # Pooled readers notice the new file and reconnect (see db_backends/sqlite3)
+        os.replace(temporary, destination)
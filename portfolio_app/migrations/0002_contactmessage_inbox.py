@@ -0,0 +1,85 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:26
+
+from django.db import migrations, models
+
+
+# External-content FTS5 index over the inbox. Triggers keep it in step with
+# the base table so the admin never has to fall back to LIKE '%...%' scans.
+FTS_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS portfolio_app_contactmessage_fts USING fts5(
+        name, email, subject, message,
+        content='portfolio_app_contactmessage', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS portfolio_app_contactmessage_fts_ai
+    AFTER INSERT ON portfolio_app_contactmessage BEGIN
+        INSERT INTO portfolio_app_contactmessage_fts(rowid, name, email, subject, message)
+        VALUES (new.id, new.name, new.email, new.subject, new.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS portfolio_app_contactmessage_fts_ad
+    AFTER DELETE ON portfolio_app_contactmessage BEGIN
+        INSERT INTO portfolio_app_contactmessage_fts(portfolio_app_contactmessage_fts, rowid, name, email, subject, message)
+        VALUES ('delete', old.id, old.name, old.email, old.subject, old.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS portfolio_app_contactmessage_fts_au
+    AFTER UPDATE OF name, email, subject, message ON portfolio_app_contactmessage BEGIN
+        INSERT INTO portfolio_app_contactmessage_fts(portfolio_app_contactmessage_fts, rowid, name, email, subject, message)
+        VALUES ('delete', old.id, old.name, old.email, old.subject, old.message);
+        INSERT INTO portfolio_app_contactmessage_fts(rowid, name, email, subject, message)
+        VALUES (new.id, new.name, new.email, new.subject, new.message);
+    END
+    """,
+    "INSERT INTO portfolio_app_contactmessage_fts(portfolio_app_contactmessage_fts) VALUES ('rebuild')",
+]
+
+FTS_REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS portfolio_app_contactmessage_fts_au",
+    "DROP TRIGGER IF EXISTS portfolio_app_contactmessage_fts_ad",
+    "DROP TRIGGER IF EXISTS portfolio_app_contactmessage_fts_ai",
+    "DROP TABLE IF EXISTS portfolio_app_contactmessage_fts",
+]
+
+
+def create_fts_index(apps, schema_editor):
+    # FTS5 is SQLite-only; other backends keep the regular admin search
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in FTS_FORWARD_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in FTS_REVERSE_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactmessage',
+            name='is_archived',
+            field=models.BooleanField(default=False, help_text='Set by the bulk archive action in the admin'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at', '-id'], name='contact_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_archived', 'is_read'], name='contact_status_idx'),
+        ),
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0002_contactmessage_inbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_date', 'order', 'id'], name='project_listing_idx'),
+        ),
+    ]
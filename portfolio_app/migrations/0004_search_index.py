@@ -0,0 +1,57 @@
+from django.db import migrations
+
+
+SEARCH_TABLE = 'portfolio_app_search_fts'
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 is SQLite-only; other backends fall back to plain lookups
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        "kind UNINDEXED, object_id UNINDEXED, title, body, "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+
+    Project = apps.get_model('portfolio_app', 'Project')
+    Experience = apps.get_model('portfolio_app', 'Experience')
+    Skill = apps.get_model('portfolio_app', 'Skill')
+
+    rows = []
+    for project in Project.objects.prefetch_related('technologies'):
+        technologies = ' '.join(tech.name for tech in project.technologies.all())
+        rows.append(('project', project.pk, project.title,
+                     ' '.join([project.description, project.detailed_description, technologies])))
+    for experience in Experience.objects.prefetch_related('technologies'):
+        achievements = ' '.join(str(item) for item in experience.achievements or [])
+        technologies = ' '.join(tech.name for tech in experience.technologies.all())
+        rows.append(('experience', experience.pk, f'{experience.position} at {experience.company}',
+                     ' '.join([experience.description, achievements, technologies])))
+    for skill in Skill.objects.all():
+        rows.append(('skill', skill.pk, skill.name, skill.get_category_display()))
+
+    if not rows:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE}(kind, object_id, title, body) VALUES (%s, %s, %s, %s)",
+            rows,
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0003_project_listing_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
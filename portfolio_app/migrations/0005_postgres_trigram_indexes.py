@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+# On PostgreSQL the admin searches (contact messages, skills) and the site
+# search fallback use icontains, which Django renders as
+# UPPER("column"::text) LIKE UPPER(%s). Trigram GIN indexes on exactly that
+# expression turn those '%term%' scans into index lookups. SQLite has the
+# FTS5 tables from migrations 0002 and 0004 instead.
+TRIGRAM_INDEXES = {
+    'contact_name_trgm_idx': ('portfolio_app_contactmessage', 'name'),
+    'contact_email_trgm_idx': ('portfolio_app_contactmessage', 'email'),
+    'contact_subject_trgm_idx': ('portfolio_app_contactmessage', 'subject'),
+    'contact_message_trgm_idx': ('portfolio_app_contactmessage', 'message'),
+    'skill_name_trgm_idx': ('portfolio_app_skill', 'name'),
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0005_postgres_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recipient', models.EmailField(max_length=254)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('due_at', models.DateTimeField(help_text='Sent by `manage.py send_digests` once this has passed')),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Notification Digest',
+                'verbose_name_plural': 'Notification Digests',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['sent_at', 'due_at'], name='digest_pending_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DigestItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('contact', 'Contact message'), ('error', 'Error report')], max_length=20)),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('fingerprint', models.CharField(blank=True, max_length=64)),
+                ('count', models.PositiveIntegerField(default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_seen_at', models.DateTimeField(auto_now=True)),
+                ('digest', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='portfolio_app.notificationdigest')),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['digest', 'fingerprint'], name='digest_item_fingerprint_idx')],
+            },
+        ),
+    ]
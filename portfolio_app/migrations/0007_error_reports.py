@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0006_notification_digests'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ErrorReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('exception_type', models.CharField(max_length=255)),
+                ('location', models.CharField(max_length=255)),
+                ('message', models.TextField(blank=True)),
+                ('last_path', models.CharField(blank=True, max_length=255)),
+                ('traceback', models.TextField(blank=True, help_text='From the most recent occurrence')),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('unmailed_count', models.PositiveIntegerField(default=0, help_text='Occurrences since the last email')),
+                ('first_seen_at', models.DateTimeField()),
+                ('last_seen_at', models.DateTimeField(db_index=True)),
+                ('last_mailed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Error Report',
+                'verbose_name_plural': 'Error Reports',
+                'ordering': ['-last_seen_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:24
+
+from django.db import migrations, models
+
+
+def create_marker(apps, schema_editor):
+    ReplicationMarker = apps.get_model('portfolio_app', 'ReplicationMarker')
+    ReplicationMarker.objects.using(schema_editor.connection.alias).create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0007_error_reports'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReplicationMarker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_marker, migrations.RunPython.noop),
+    ]
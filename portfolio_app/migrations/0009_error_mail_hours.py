@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0008_replication_marker'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ErrorMailHour',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(unique=True)),
+                ('sent', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
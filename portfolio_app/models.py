@@ -1,5 +1,12 @@
 from django.db import models
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .versioning import get_content_version, versioned_key
+
+# Process-local copy of the singleton profile: (content version, instance).
+# Only used while the shared content version still matches, so an edit made
+# through any worker retires it in all of them
+_solo_profile = (None, None)
 
 
 class Profile(models.Model):
@@ -34,6 +41,36 @@ class Profile(models.Model):
     
     def __str__(self):
         return self.full_name
+    
+    @classmethod
+    def get_solo(cls):
+        """
+        Return the portfolio's single Profile, or None if it doesn't exist yet.
+        
+        The instance is kept in process memory and in the shared cache for the
+        current content version, so it is fetched from the database once per
+        content change instead of once per request. Treat it as read-only.
+        """
+        global _solo_profile
+        version = get_content_version()
+        cached_version, profile = _solo_profile
+        if cached_version == version:
+            return profile
+        
+        key = versioned_key('profile_solo')
+        profile = cache.get(key)
+        if profile is None:
+            profile = cls.objects.order_by('pk').first()
+            if profile is not None:
+                cache.set(key, profile, 60 * 60 * 24)
+        _solo_profile = (version, profile)
+        return profile
+    
+    @classmethod
+    def clear_solo_cache(cls):
+        """Drop the process-local copy of the singleton profile"""
+        global _solo_profile
+        _solo_profile = (None, None)
 
 
 class Skill(models.Model):
@@ -139,6 +176,10 @@ class Project(models.Model):
     
     class Meta:
         ordering = ['-created_date', 'order']
+        indexes = [
+            # Matches the keyset used by the paginated project listing
+            models.Index(fields=['-created_date', 'order', 'id'], name='project_listing_idx'),
+        ]
         verbose_name = "Project"
         verbose_name_plural = "Projects"
     
@@ -154,11 +195,110 @@ class ContactMessage(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     is_read = models.BooleanField(default=False)
+    is_archived = models.BooleanField(default=False, help_text="Set by the bulk archive action in the admin")
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination walks (created_at, id) newest first
+            models.Index(fields=['-created_at', '-id'], name='contact_created_id_idx'),
+            models.Index(fields=['is_archived', 'is_read'], name='contact_status_idx'),
+        ]
         verbose_name = "Contact Message"
         verbose_name_plural = "Contact Messages"
     
     def __str__(self):
-        return f"Message from {self.name} - {self.subject}"
\ No newline at end of file
+        return f"Message from {self.name} - {self.subject}"
+
+
+class NotificationDigest(models.Model):
+    """Notification emails to one recipient, sent together once ``due_at`` has passed"""
+    recipient = models.EmailField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    due_at = models.DateTimeField(help_text="Sent by `manage.py send_digests` once this has passed")
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Both the open digest lookup and the sender filter on these
+            models.Index(fields=['sent_at', 'due_at'], name='digest_pending_idx'),
+        ]
+        verbose_name = "Notification Digest"
+        verbose_name_plural = "Notification Digests"
+    
+    def __str__(self):
+        return f"Digest for {self.recipient} due {self.due_at:%Y-%m-%d %H:%M}"
+
+
+class DigestItem(models.Model):
+    """One notification in a digest; repeats with the same fingerprint only bump ``count``"""
+    KIND_CHOICES = [
+        ('contact', 'Contact message'),
+        ('error', 'Error report'),
+    ]
+    
+    digest = models.ForeignKey(NotificationDigest, on_delete=models.CASCADE, related_name='items')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    fingerprint = models.CharField(max_length=64, blank=True)
+    count = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['digest', 'fingerprint'], name='digest_item_fingerprint_idx'),
+        ]
+    
+    def __str__(self):
+        return self.subject
+
+
+class ErrorReport(models.Model):
+    """One kind of server error (exception type and where it was raised) and how often it happened"""
+    fingerprint = models.CharField(max_length=64, unique=True)
+    exception_type = models.CharField(max_length=255)
+    location = models.CharField(max_length=255)
+    message = models.TextField(blank=True)
+    last_path = models.CharField(max_length=255, blank=True)
+    traceback = models.TextField(blank=True, help_text="From the most recent occurrence")
+    count = models.PositiveIntegerField(default=0)
+    unmailed_count = models.PositiveIntegerField(default=0, help_text="Occurrences since the last email")
+    first_seen_at = models.DateTimeField()
+    last_seen_at = models.DateTimeField(db_index=True)
+    last_mailed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-last_seen_at']
+        verbose_name = "Error Report"
+        verbose_name_plural = "Error Reports"
+    
+    def __str__(self):
+        return f"{self.exception_type} at {self.location}"
+
+
+class ReplicationMarker(models.Model):
+    """
+    A single row bumped to a new sequence number after every content change.
+    
+    It is written once the change has committed, so a replica whose copy
+    holds at least the number the replicas are fenced at (see ``routers.py``)
+    has that change too.
+    """
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Replicated up to v{self.version}"
+
+
+class ErrorMailHour(models.Model):
+    """How many error emails went out in one clock hour, shared by every worker"""
+    hour = models.DateTimeField(unique=True)
+    sent = models.PositiveIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.sent} error email(s) at {self.hour:%Y-%m-%d %H:00}"
@@ -0,0 +1,142 @@
+"""
+Notification emails, optionally coalesced into digests.
+
+With ``NOTIFICATION_DIGEST_MINUTES`` set, contact-form notifications and
+admin error mails (see ``error_reporter.py``) are queued as ``DigestItem``
+rows instead of each opening its own SMTP session. A recipient has at most
+one open ``NotificationDigest`` at a time; ``manage.py send_digests`` sends
+every digest whose window has closed, all over a single connection. Items
+that share a fingerprint (the same error again) are counted rather than
+repeated.
+
+Models are imported inside the functions: the error reporter's logging
+handler imports this module before the app registry is ready.
+"""
+
+import hashlib
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CONTACT = 'contact'
+ERROR = 'error'
+
+
+def digest_enabled():
+    return settings.NOTIFICATION_DIGEST_MINUTES > 0
+
+
+def make_fingerprint(*parts):
+    return hashlib.sha1('\x00'.join(parts).encode()).hexdigest()
+
+
+def notify(recipients, subject, body, kind=CONTACT, fingerprint=''):
+    """Email ``recipients`` straight away, or add to each one's open digest"""
+    if not digest_enabled():
+        send_mail(
+            subject=subject,
+            message=body,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=recipients,
+            fail_silently=True,
+        )
+        return
+    for recipient in recipients:
+        enqueue(recipient, kind, subject, body, fingerprint)
+
+
+def enqueue(recipient, kind, subject, body, fingerprint=''):
+    from .models import NotificationDigest
+
+    now = timezone.now()
+    with transaction.atomic():
+        # Only unclaimed digests still inside their window take new items.
+        # A no-op write locks them first, so the sender's claim waits until
+        # this item is in; once a digest is claimed it matches no longer.
+        open_digests = NotificationDigest.objects.filter(recipient=recipient, sent_at__isnull=True, due_at__gt=now)
+        digest = None
+        if open_digests.update(due_at=F('due_at')):
+            digest = open_digests.order_by('created_at').first()
+        if digest is None:
+            digest = NotificationDigest.objects.create(
+                recipient=recipient, due_at=now + timedelta(minutes=settings.NOTIFICATION_DIGEST_MINUTES)
+            )
+        if fingerprint and digest.items.filter(fingerprint=fingerprint).update(
+            count=F('count') + 1, last_seen_at=now
+        ):
+            return digest
+        digest.items.create(kind=kind, subject=subject[:255], body=body, fingerprint=fingerprint)
+    return digest
+
+
+def build_digest_email(digest, connection=None):
+    items = list(digest.items.all())
+    totals = {}
+    for item in items:
+        totals[item.get_kind_display()] = totals.get(item.get_kind_display(), 0) + item.count
+    summary = ', '.join(f'{count} × {label.lower()}' for label, count in totals.items())
+
+    sections = []
+    for item in items:
+        heading = f'[{item.get_kind_display()}] {item.subject}'
+        if item.count > 1:
+            heading += f' (×{item.count}, last {item.last_seen_at:%Y-%m-%d %H:%M:%S})'
+        sections.append(f'{heading}\n{"-" * min(len(heading), 72)}\n{item.body}')
+
+    return EmailMessage(
+        subject=f'{settings.EMAIL_SUBJECT_PREFIX}Portfolio digest: {summary}',
+        body='\n\n'.join(sections),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[digest.recipient],
+        connection=connection,
+    )
+
+
+def send_due_digests(now=None):
+    """Send every digest whose window has closed; returns how many were sent"""
+    from .models import NotificationDigest
+
+    now = now or timezone.now()
+    due = list(
+        NotificationDigest.objects.filter(sent_at__isnull=True, due_at__lte=now)
+        .order_by('due_at').values_list('pk', flat=True)
+    )
+    if not due:
+        return 0
+
+    # One SMTP session for the whole batch
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        # e.g. the server is down or refuses the login; everything stays
+        # pending for the next run, and `send_digests --watch` keeps going
+        logger.error(f"Opening a mail connection for {len(due)} digest(s) failed: {str(e)}")
+        return 0
+
+    sent = 0
+    with connection:
+        for pk in due:
+            # Claimed before it is read, so no item can join it unsent and no
+            # other sender (another --watch, the admin action) mails it too
+            claimed_at = timezone.now()
+            if not NotificationDigest.objects.filter(pk=pk, sent_at__isnull=True).update(sent_at=claimed_at):
+                continue
+            digest = NotificationDigest.objects.get(pk=pk)
+            try:
+                build_digest_email(digest, connection).send()
+            except Exception as e:
+                # Released again, so the next run retries it
+                NotificationDigest.objects.filter(pk=pk, sent_at=claimed_at).update(sent_at=None)
+                logger.error(f"Sending digest {digest.pk} to {digest.recipient} failed: {str(e)}")
+                continue
+            sent += 1
+    return sent
+
@@ -0,0 +1,35 @@
+"""
+Render pages outside a request cycle for build-time tooling
+(``build_critical_css``, ``subset_fonts``).
+"""
+
+import os
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+
+from .models import Profile
+from .signals import content_signals_muted
+
+# Nothing rendered here may outlive the render: the sample data is rolled
+# back, but cache writes would not be
+UNCACHED = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+
+def render_homepage(seed=False):
+    """
+    Return the buffered homepage HTML. When ``seed`` is set or the database
+    has no profile, sample data is loaded inside a transaction that is rolled
+    back once the page is rendered, without retiring caches or indexing it.
+    """
+    from .views import home
+
+    with override_settings(CACHES=UNCACHED, HOMEPAGE_STREAMING=False), transaction.atomic():
+        if seed or not Profile.objects.exists():
+            with open(os.devnull, 'w') as devnull, content_signals_muted():
+                call_command('populate_sample_data', sample=True, stdout=devnull)
+        request = RequestFactory().get('/')
+        html = home(request).content.decode('utf-8')
+        transaction.set_rollback(True)
+    return html
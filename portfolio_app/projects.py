@@ -0,0 +1,93 @@
+"""
+Keyset-paginated, technology-filterable project listing.
+
+Projects are ordered like ``Project.Meta.ordering`` (newest ``created_date``
+first, then ``order``) with ``id`` as the tie-breaker. A cursor encodes the
+``(created_date, order, id)`` of the last project on a page, so fetching the
+next page is an index seek rather than an OFFSET scan.
+"""
+
+from datetime import date
+
+from django.db.models import BooleanField, ExpressionWrapper, Q
+
+from .models import Project
+from .tech_index import PROJECT, get_technology_index
+from .versioning import versioned_key
+
+DEFAULT_PAGE_SIZE = 6
+MAX_PAGE_SIZE = 24
+# Technologies one listing can filter by; part of the page cache key
+MAX_FILTER_TECHNOLOGIES = 5
+PAGE_CACHE_TIMEOUT = 60 * 60
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(project):
+    return f"{project.created_date.isoformat()}.{project.order}.{project.pk}"
+
+
+def decode_cursor(cursor):
+    """Return ``(created_date, order, id)`` from a cursor string"""
+    try:
+        created, order, pk = cursor.split('.')
+        return date.fromisoformat(created), int(order), int(pk)
+    except (AttributeError, ValueError):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+
+
+def card_queryset():
+    """Projects with just what a card needs; the modal fetches the rest"""
+    return (
+        Project.objects
+        .defer('detailed_description')
+        .annotate(has_details=ExpressionWrapper(~Q(detailed_description=''), output_field=BooleanField()))
+        .prefetch_related('technologies')
+        .order_by('-created_date', 'order', 'pk')
+    )
+
+
+def filter_projects(queryset, technologies=(), match='any', featured=False):
+    if featured:
+        queryset = queryset.filter(is_featured=True)
+    if technologies:
+        project_ids = get_technology_index().query(technologies, kind=PROJECT, match=match)
+        queryset = queryset.filter(pk__in=project_ids)
+    return queryset
+
+
+def seek(queryset, cursor):
+    """Rows that come strictly after ``cursor`` in listing order"""
+    created_date, order, pk = decode_cursor(cursor)
+    return queryset.filter(
+        Q(created_date__lt=created_date)
+        | Q(created_date=created_date, order__gt=order)
+        | Q(created_date=created_date, order=order, pk__gt=pk)
+    )
+
+
+def paginate(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """Return ``(projects, next_cursor)`` for one page of ``queryset``"""
+    if cursor:
+        queryset = seek(queryset, cursor)
+    projects = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(projects) > page_size:
+        projects = projects[:page_size]
+        next_cursor = encode_cursor(projects[-1])
+    return projects, next_cursor
+
+
+def get_project_page(technologies=(), match='any', featured=False, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """One page of projects and the next cursor, without caching"""
+    queryset = filter_projects(card_queryset(), technologies=technologies, match=match, featured=featured)
+    return paginate(queryset, cursor=cursor, page_size=page_size)
+
+
+def page_cache_key(kind, technologies, match, featured, page_size):
+    """Key for a first page; pages further on aren't cached, cursors are endless"""
+    technologies = ','.join(sorted(technologies)) or '-'
+    return versioned_key(f"project_page:{kind}:{technologies}:{match}:{int(featured)}:{page_size}")
@@ -0,0 +1,169 @@
+"""
+Read-replica routing.
+
+Every ``DATABASES`` alias starting with ``replica`` is a read-only copy of
+``default``. Queries made by views decorated with ``@replica_reads`` go to
+one of them (picked once per request); everything else, including all
+writes and the admin, uses ``default``.
+
+Two things send a would-be replica read back to the primary:
+
+- the request carries the sticky cookie set after any request that wrote,
+  so a visitor who just submitted a form reads their own write;
+- the replica has not caught up with the latest content change. Once a
+  change has committed, a new sequence number (from the clock, like content
+  versions) is written to the ``ReplicationMarker`` row and the fence in
+  the shared cache is raised to it; a replica is used again once its copy
+  of the marker reaches the fence. Replicas apply commits in order, so by
+  then it has the change too. Until then the versioned caches are refilled
+  from the primary, never with a replica's older rows.
+"""
+
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+REPLICA_PREFIX = 'replica'
+STICKY_COOKIE = 'db_primary'
+PRIMARY_FENCE_KEY = 'replica_fence_version'
+# Model label of django.core.cache.backends.db.DatabaseCache entries
+CACHE_APP_LABEL = 'django_cache'
+
+_request_state = ContextVar('replica_routing', default=None)
+
+
+class RoutingState:
+    def __init__(self):
+        self.replica = None
+        self.wrote = False
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias.startswith(REPLICA_PREFIX)]
+
+
+def replica_reads(view):
+    """Mark a view whose queries may be served by a read replica"""
+    view.replica_reads = True
+    return view
+
+
+def fence_replicas():
+    """Route replica reads to the primary until replicas have every write committed so far"""
+    from .models import ReplicationMarker
+
+    if not replica_aliases():
+        return
+    sequence = time.time_ns() // 1000
+    ReplicationMarker.objects.using('default').filter(pk=1).update(version=Greatest(F('version'), sequence))
+    if sequence > (cache.get(PRIMARY_FENCE_KEY) or 0):
+        cache.set(PRIMARY_FENCE_KEY, sequence, None)
+
+
+# alias -> the highest marker version seen on it; replicas never go back
+_replica_positions = {}
+
+
+def replica_position(alias):
+    """The sequence number a replica's copy of the marker row has reached"""
+    from .models import ReplicationMarker
+
+    try:
+        return ReplicationMarker.objects.using(alias).filter(pk=1).values_list('version', flat=True).first() or 0
+    except DatabaseError:
+        # e.g. a replica copied before the marker's migration
+        return 0
+
+
+def replica_caught_up(alias):
+    fence = cache.get(PRIMARY_FENCE_KEY)
+    if not fence or _replica_positions.get(alias, 0) >= fence:
+        return True
+    position = replica_position(alias)
+    if position >= fence:
+        _replica_positions[alias] = position
+        return True
+    return False
+
+
+class ReplicaRouter:
+    def __init__(self):
+        self.replicas = replica_aliases()
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == CACHE_APP_LABEL:
+            # A DatabaseCache reads what it just wrote (see versioning.py)
+            return None
+        state = _request_state.get()
+        if state is not None and state.replica and not state.wrote:
+            return state.replica
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        # Filling the cache on a miss isn't a content write to read back
+        if state is not None and model._meta.app_label != CACHE_APP_LABEL:
+            state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema from the primary
+        return False if db in self.replicas else None
+
+
+def routed_stream(state, content):
+    """Iterate ``content`` with the request's routing state in place for each chunk"""
+    iterator = iter(content)
+    while True:
+        token = _request_state.set(state)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _request_state.reset(token)
+        yield chunk
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.replicas = replica_aliases()
+
+    def __call__(self, request):
+        state = RoutingState()
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        if response.streaming and not response.is_async:
+            # The body is rendered after this returns, e.g. stream_home's sections
+            response.streaming_content = routed_stream(state, response.streaming_content)
+        if state.wrote and self.replicas:
+            response.set_cookie(
+                STICKY_COOKIE, '1',
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                secure=request.is_secure(), httponly=True, samesite='Lax',
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = _request_state.get()
+        if (
+            state is not None and self.replicas and getattr(view_func, 'replica_reads', False)
+            and STICKY_COOKIE not in request.COOKIES
+        ):
+            caught_up = [alias for alias in self.replicas if replica_caught_up(alias)]
+            if caught_up:
+                state.replica = random.choice(caught_up)
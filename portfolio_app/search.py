@@ -0,0 +1,216 @@
+"""
+Site search over projects, experiences and skills.
+
+Documents live in the ``portfolio_app_search_fts`` SQLite FTS5 table created
+in migration 0004. Signal handlers in ``signals.py`` keep it in sync, and
+``manage.py rebuild_search_index`` rebuilds it in bulk. Results are ranked
+with BM25 (title matches weigh more than body matches), every query term is
+a prefix match, and each hit carries a highlighted snippet.
+"""
+
+import re
+
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Q
+from django.utils.html import escape
+
+from .models import Experience, Project, Skill
+
+SEARCH_TABLE = 'portfolio_app_search_fts'
+
+PROJECT = 'project'
+EXPERIENCE = 'experience'
+SKILL = 'skill'
+
+SEARCH_MODELS = {
+    Project: PROJECT,
+    Experience: EXPERIENCE,
+    Skill: SKILL,
+}
+
+# BM25 column weights: kind and object_id are UNINDEXED, then title, body
+BM25_WEIGHTS = '0.0, 0.0, 10.0, 1.0'
+
+INSERT_DOCUMENT = f"INSERT INTO {SEARCH_TABLE}(kind, object_id, title, body) VALUES (%s, %s, %s, %s)"
+
+# Control characters mark highlights so the snippet can be escaped safely
+_MARK_START, _MARK_END = '\x02', '\x03'
+
+# Only short searches, typed in their normal form, have their results cached
+CACHED_TERM_MAX_WORDS = 3
+CACHED_TERM_MAX_LENGTH = 40
+RESULTS_CACHE_TIMEOUT = 5 * 60
+
+
+def search_tokens(term):
+    return re.findall(r'\w+', term.lower())
+
+
+def build_fts_query(term):
+    """Turn free-form input into a safe FTS5 query of prefix terms"""
+    # Quote every token so FTS5 operators typed by the user are inert
+    return ' '.join(f'"{token}"*' for token in search_tokens(term))
+
+
+def cacheable_term(term):
+    """
+    Return True if results for ``term`` may be cached.
+    
+    That is a few lowercase words separated by single spaces, the one
+    spelling of a query; any other free text would give every variation
+    its own cache entry.
+    """
+    tokens = search_tokens(term)
+    return (
+        term == ' '.join(tokens)
+        and len(tokens) <= CACHED_TERM_MAX_WORDS
+        and len(term) <= CACHED_TERM_MAX_LENGTH
+    )
+
+
+def fts_table_exists(table, using='default'):
+    """Return True if the FTS5 table ``table`` exists on this database"""
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [table],
+            )
+            return cursor.fetchone() is not None
+    except DatabaseError:
+        return False
+
+
+def search_available(using='default'):
+    return fts_table_exists(SEARCH_TABLE, using)
+
+
+def build_document(instance):
+    """Return ``(title, body)`` for a searchable instance"""
+    if isinstance(instance, Project):
+        technologies = ' '.join(tech.name for tech in instance.technologies.all())
+        return instance.title, ' '.join([instance.description, instance.detailed_description, technologies])
+    if isinstance(instance, Experience):
+        achievements = ' '.join(str(item) for item in instance.achievements or [])
+        technologies = ' '.join(tech.name for tech in instance.technologies.all())
+        return (
+            f'{instance.position} at {instance.company}',
+            ' '.join([instance.description, achievements, technologies]),
+        )
+    return instance.name, instance.get_category_display()
+
+
+def index_object(instance, using='default'):
+    """Insert or replace the search document for ``instance``"""
+    index_objects([instance], using)
+
+
+def index_objects(instances, using='default'):
+    """
+    Insert or replace the search documents for ``instances`` in two statements.
+    
+    Prefetch ``technologies`` on projects and experiences first, or building
+    each document costs a query.
+    """
+    rows = [(SEARCH_MODELS[type(instance)], instance.pk, *build_document(instance)) for instance in instances]
+    if not rows:
+        return
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {SEARCH_TABLE} WHERE kind = %s AND object_id = %s",
+            [(kind, pk) for kind, pk, _, _ in rows],
+        )
+        cursor.executemany(INSERT_DOCUMENT, rows)
+
+
+def remove_object(model, pk, using='default'):
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_TABLE} WHERE kind = %s AND object_id = %s",
+            [SEARCH_MODELS[model], pk],
+        )
+
+
+def rebuild_index(batch_size=500, using='default'):
+    """Replace the whole index; returns the number of documents written"""
+    querysets = [
+        Project.objects.prefetch_related('technologies'),
+        Experience.objects.prefetch_related('technologies'),
+        Skill.objects.all(),
+    ]
+    written = 0
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        for queryset in querysets:
+            kind = SEARCH_MODELS[queryset.model]
+            batch = []
+            for instance in queryset.using(using).iterator(chunk_size=batch_size):
+                batch.append((kind, instance.pk, *build_document(instance)))
+                if len(batch) >= batch_size:
+                    cursor.executemany(INSERT_DOCUMENT, batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(INSERT_DOCUMENT, batch)
+                written += len(batch)
+        # Merge the b-tree segments written above into one
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+    return written
+
+
+def highlight(snippet):
+    """Escape a snippet and turn the FTS5 markers into <mark> tags"""
+    return escape(snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+
+def search(term, kinds=None, limit=20, using='default'):
+    """
+    Ranked matches for ``term`` as a list of dicts with ``kind``, ``id``,
+    ``title`` and an HTML-safe ``snippet``.
+    """
+    fts_query = build_fts_query(term)
+    if not fts_query:
+        return []
+    sql = (
+        f"SELECT kind, object_id, title, "
+        f"snippet({SEARCH_TABLE}, 3, %s, %s, '…', 16), bm25({SEARCH_TABLE}, {BM25_WEIGHTS}) AS rank "
+        f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s"
+    )
+    params = [_MARK_START, _MARK_END, fts_query]
+    if kinds:
+        sql += f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+        params.extend(kinds)
+    sql += " ORDER BY rank LIMIT %s"
+    params.append(limit)
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        {'kind': kind, 'id': int(object_id), 'title': title, 'snippet': highlight(snippet)}
+        for kind, object_id, title, snippet, _ in rows
+    ]
+
+
+def matching_ids(kind, term, limit=1000, using='default'):
+    """Ids of ``kind`` documents matching ``term``, best match first"""
+    return [hit['id'] for hit in search(term, kinds=[kind], limit=limit, using=using)]
+
+
+def fallback_search(term, kinds=None, limit=20):
+    """Unranked title lookups for databases without the FTS5 table"""
+    lookups = {
+        PROJECT: (Project, Q(title__icontains=term) | Q(description__icontains=term), 'title'),
+        EXPERIENCE: (Experience, Q(position__icontains=term) | Q(company__icontains=term), 'position'),
+        SKILL: (Skill, Q(name__icontains=term), 'name'),
+    }
+    results = []
+    for kind, (model, condition, title_field) in lookups.items():
+        if kinds and kind not in kinds:
+            continue
+        for pk, title in model.objects.filter(condition).values_list('pk', title_field)[:limit]:
+            results.append({'kind': kind, 'id': pk, 'title': title, 'snippet': ''})
+    return results[:limit]
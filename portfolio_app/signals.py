@@ -0,0 +1,115 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Profile, Skill, Experience, Project
+from . import search
+from .edge_cache import purge_surrogate_keys, surrogate_key
+from .routers import fence_replicas
+from .tech_index import apply_m2m_change
+from .versioning import bump_content_version, get_content_version
+
+CONTENT_MODELS = (Profile, Skill, Experience, Project)
+
+_muted = ContextVar('content_signals_muted', default=False)
+
+
+@contextmanager
+def content_signals_muted():
+    """Skip every handler here, e.g. for sample data that is rolled back"""
+    token = _muted.set(True)
+    try:
+        yield
+    finally:
+        _muted.reset(token)
+
+
+def retire_cached_content(*models):
+    """Fence replicas, retire versioned caches and purge the CDN for ``models``"""
+    # Fenced first, so no lagging replica refills the new version
+    fence_replicas()
+    version = bump_content_version()
+    purge_surrogate_keys(*(surrogate_key(model) for model in models))
+    if Profile in models:
+        Profile.clear_solo_cache()
+    return version
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def content_changed(sender, using='default', **kwargs):
+    """Retire versioned caches whenever portfolio content changes"""
+    if sender in CONTENT_MODELS and not _muted.get():
+        # Only once the change is committed: until then other requests still
+        # read the old rows, and would cache them under the new version
+        transaction.on_commit(lambda: retire_cached_content(sender), using=using)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Experience)
+@receiver(post_save, sender=Skill)
+def update_search_document(sender, instance, raw=False, using='default', **kwargs):
+    if raw or _muted.get() or not search.search_available(using):
+        return
+    search.index_object(instance, using)
+    if sender is Skill:
+        # Project and experience documents include their technology names;
+        # rebuilt together once the rename is committed
+        transaction.on_commit(lambda: reindex_technology_users(instance.pk, using), using=using)
+
+
+def reindex_technology_users(skill_pk, using='default'):
+    """Rebuild the search documents of every project and experience using a skill"""
+    search.index_objects([
+        *Project.objects.using(using).filter(technologies=skill_pk).prefetch_related('technologies'),
+        *Experience.objects.using(using).filter(technologies=skill_pk).prefetch_related('technologies'),
+    ], using)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Experience)
+@receiver(post_delete, sender=Skill)
+def remove_search_document(sender, instance, using='default', **kwargs):
+    if not _muted.get() and search.search_available(using):
+        search.remove_object(sender, instance.pk, using)
+
+
+@receiver(m2m_changed, sender=Experience.technologies.through)
+@receiver(m2m_changed, sender=Project.technologies.through)
+def technologies_changed(sender, instance, action, reverse, pk_set, using='default', **kwargs):
+    if _muted.get():
+        return
+    model = Project if sender is Project.technologies.through else Experience
+    if action == 'pre_clear' and reverse and search.search_available(using):
+        # post_clear gets no pk_set; remember which objects lose this skill
+        # so their search documents can be rebuilt without it
+        instance._cleared_technology_pks = {
+            **getattr(instance, '_cleared_technology_pks', {}),
+            sender: set(model.objects.using(using).filter(technologies=instance).values_list('pk', flat=True)),
+        }
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if action == 'post_clear' and reverse:
+        pk_set = getattr(instance, '_cleared_technology_pks', {}).pop(sender, None)
+
+    pk_set = set(pk_set or ())
+
+    def committed():
+        previous_version = get_content_version()
+        version = retire_cached_content(model, Skill)
+        # Keep this process's technology index current without a rebuild
+        apply_m2m_change(sender, instance, action, reverse, pk_set, previous_version, version)
+
+    transaction.on_commit(committed, using=using)
+
+    # Search documents include technology names
+    if search.search_available(using):
+        if reverse:
+            search.index_objects(
+                model.objects.using(using).filter(pk__in=pk_set).prefetch_related('technologies'), using
+            )
+        else:
+            search.index_object(instance, using)
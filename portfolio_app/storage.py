@@ -0,0 +1,173 @@
+"""
+Static files storage used by ``collectstatic``.
+
+On top of WhiteNoise's hashed, gzip + Brotli compressed output (gzip level 9,
+Brotli quality 11) this minifies CSS and JavaScript before it is written,
+records a per-asset size report and fails the build when an asset exceeds
+its entry (a name or glob) in ``STATIC_ASSET_BUDGETS``. Afterwards it runs
+``build_critical_css`` so the inlined above-the-fold CSS matches the
+stylesheets just collected. Finally it records a fingerprint of the source
+files next to the manifest so ``manage.py bootstrap`` can tell when a
+collected tree is already current and skip collectstatic.
+"""
+
+import fnmatch
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import DatabaseError
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - Brotli is in requirements.txt
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+SIZE_REPORT_NAME = 'staticfiles-report.json'
+SOURCE_FINGERPRINT_NAME = 'staticfiles-source.json'
+
+
+class AssetBudgetExceeded(Exception):
+    pass
+
+
+def minify(name, data):
+    """Return minified bytes for CSS/JS files, anything else unchanged"""
+    if name.endswith(('.min.css', '.min.js')):
+        return data
+    if name.endswith('.css'):
+        import rcssmin
+        return rcssmin.cssmin(data)
+    if name.endswith('.js'):
+        import rjsmin
+        return rjsmin.jsmin(data)
+    return data
+
+
+def source_fingerprint():
+    """Hash of every file collectstatic would copy, keyed by its collected name"""
+    ignore_patterns = apps.get_app_config('staticfiles').ignore_patterns
+    found = {}
+    for finder in finders.get_finders():
+        for path, storage in finder.list(ignore_patterns):
+            prefix = getattr(storage, 'prefix', None)
+            name = os.path.join(prefix, path) if prefix else path
+            # Like collectstatic, the first finder to provide a name wins
+            found.setdefault(name, (storage, path))
+
+    digest = hashlib.md5()
+    digest.update(settings.STATIC_URL.encode())
+    for name, (storage, path) in sorted(found.items()):
+        digest.update(name.encode())
+        with storage.open(path) as handle:
+            digest.update(hashlib.md5(handle.read()).digest())
+    return digest.hexdigest()
+
+
+def collected_is_current(storage=None):
+    """True if STATIC_ROOT was collected from the current sources"""
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    storage = storage or staticfiles_storage
+    try:
+        with storage.open(SOURCE_FINGERPRINT_NAME) as handle:
+            recorded = json.load(handle)
+    except (OSError, ValueError):
+        return False
+    # The manifest hash guards against a manifest replaced by hand since
+    manifest_hash = storage.load_manifest()[1]
+    return (
+        bool(manifest_hash) and recorded.get('manifest_hash') == manifest_hash
+        and recorded.get('source') == source_fingerprint()
+    )
+
+
+def format_size_report(report):
+    """The size report as table lines"""
+    lines = [f"{'Asset':<40} {'Source':>9} {'Minified':>9} {'Gzip':>8} {'Brotli':>8}"]
+    for name, entry in report.items():
+        lines.append(
+            f"{name:<40} {entry['source'] or '-':>9} {entry['minified']:>9} "
+            f"{entry['gzip']:>8} {entry['brotli'] or '-':>8}"
+        )
+    return lines
+
+
+class OptimizedStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """CompressedManifestStaticFilesStorage that minifies and enforces budgets"""
+
+    # Rewrite ES module imports (static and dynamic) to the hashed names
+    support_js_module_import_aggregation = True
+
+    # Only the site's own assets are reported on; admin files are left alone
+    report_extensions = ('.css', '.js')
+    report_exclude_prefixes = ('admin/',)
+
+    def _save(self, name, content):
+        if name.endswith(self.report_extensions) and not name.startswith(self.report_exclude_prefixes):
+            content.seek(0)
+            content = ContentFile(minify(name, content.read()))
+        return super()._save(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        # collectstatic prints it as a table (see its override in this app)
+        self.size_report = report = self.build_size_report()
+        with open(self.path(SIZE_REPORT_NAME), 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+
+        budgets = getattr(settings, 'STATIC_ASSET_BUDGETS', {})
+        for name, entry in sorted(report.items()):
+            # fnmatch's ``*`` crosses directories, so the longest pattern wins
+            patterns = [pattern for pattern in budgets if fnmatch.fnmatch(name, pattern)]
+            if not patterns:
+                continue
+            limit = budgets[max(patterns, key=len)]
+            if entry['gzip'] > limit:
+                yield name, None, AssetBudgetExceeded(
+                    f"{name} is {entry['gzip']} bytes gzipped, over its budget of {limit} bytes"
+                )
+
+        if getattr(settings, 'CRITICAL_CSS_ON_COLLECTSTATIC', False):
+            self.build_critical_css()
+
+        with open(self.path(SOURCE_FINGERPRINT_NAME), 'w') as handle:
+            json.dump({'source': source_fingerprint(), 'manifest_hash': self.manifest_hash}, handle, indent=2)
+
+    def build_critical_css(self, verbosity=0):
+        try:
+            call_command('build_critical_css', verbosity=verbosity)
+        except DatabaseError as exc:
+            # e.g. collectstatic in an image build before the database exists
+            logger.warning(f"Skipped critical CSS, the homepage could not be rendered: {str(exc)}")
+
+    def build_size_report(self):
+        """Source, minified, gzip and Brotli sizes for every reported asset"""
+        report = {}
+        for name, hashed_name in sorted(self.hashed_files.items()):
+            if not name.endswith(self.report_extensions) or name.startswith(self.report_exclude_prefixes):
+                continue
+            with self.open(hashed_name) as handle:
+                data = handle.read()
+            source = finders.find(name)
+            report[name] = {
+                'hashed_name': hashed_name,
+                'source': os.path.getsize(source) if source else None,
+                'minified': len(data),
+                'gzip': len(gzip.compress(data, compresslevel=9, mtime=0)),
+                'brotli': len(brotli.compress(data)) if brotli else None,
+            }
+        return report
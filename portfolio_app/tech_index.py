@@ -0,0 +1,153 @@
+"""
+In-memory inverted index from technology (Skill name slug) to the sorted ids
+of the projects and experiences that use it.
+
+The index is built once per content version and patched in place by the
+``m2m_changed`` handler in ``signals.py``, so technology filters never walk
+the ``technologies`` M2M per card. Queries combine the posting lists with
+``match='any'`` (OR) or ``match='all'`` (AND) and only touch the ids
+involved in the result.
+"""
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+
+from django.utils.text import slugify
+
+from .models import Experience, Project, Skill
+from .versioning import get_content_version
+
+PROJECT = 'project'
+EXPERIENCE = 'experience'
+
+THROUGH_MODELS = {
+    Project.technologies.through: (PROJECT, 'project_id'),
+    Experience.technologies.through: (EXPERIENCE, 'experience_id'),
+}
+
+
+def _contains(sorted_ids, pk):
+    position = bisect_left(sorted_ids, pk)
+    return position < len(sorted_ids) and sorted_ids[position] == pk
+
+
+class TechnologyIndex:
+    def __init__(self, version, skill_slugs, postings):
+        self.version = version
+        # skill id -> slug; several skills may share a slug
+        self.skill_slugs = skill_slugs
+        self.slugs = frozenset(skill_slugs.values())
+        # kind -> slug -> sorted list of ids
+        self.postings = postings
+
+    @classmethod
+    def build(cls, version):
+        skill_slugs = {pk: slugify(name) for pk, name in Skill.objects.values_list('pk', 'name')}
+        postings = {PROJECT: {}, EXPERIENCE: {}}
+        for through, (kind, column) in THROUGH_MODELS.items():
+            for skill_id, object_id in through.objects.values_list('skill_id', column):
+                slug = skill_slugs.get(skill_id)
+                if slug:
+                    postings[kind].setdefault(slug, set()).add(object_id)
+        for kind in postings:
+            postings[kind] = {slug: sorted(ids) for slug, ids in postings[kind].items()}
+        return cls(version, skill_slugs, postings)
+
+    def query(self, slugs, kind=PROJECT, match='any'):
+        """Sorted ids of ``kind`` objects tagged with any/all of ``slugs``"""
+        lists = [self.postings[kind].get(slug, []) for slug in slugs]
+        if not lists:
+            return []
+        if match == 'all':
+            # Probe the shortest posting list against the others
+            lists.sort(key=len)
+            return [pk for pk in lists[0] if all(_contains(ids, pk) for ids in lists[1:])]
+        result = []
+        for pk in heapq.merge(*lists):
+            if not result or result[-1] != pk:
+                result.append(pk)
+        return result
+
+    def technologies(self, kind=PROJECT):
+        """Slugs that tag at least one object of ``kind``, most used first"""
+        postings = self.postings[kind]
+        return sorted(postings, key=lambda slug: (-len(postings[slug]), slug))
+
+    # Updates swap in new lists rather than mutating, so concurrent readers
+    # in other threads always see a consistent posting list
+
+    def add(self, kind, skill_id, object_id):
+        slug = self.skill_slugs.get(skill_id)
+        if slug is None:
+            return False
+        ids = self.postings[kind].get(slug, [])
+        if not _contains(ids, object_id):
+            ids = list(ids)
+            insort(ids, object_id)
+            self.postings[kind][slug] = ids
+        return True
+
+    def remove(self, kind, skill_id, object_id):
+        slug = self.skill_slugs.get(skill_id)
+        if slug is None:
+            return False
+        ids = self.postings[kind].get(slug, [])
+        # Another skill with the same slug may still tag this object
+        if _contains(ids, object_id) and not self._still_tagged(kind, slug, skill_id, object_id):
+            self.postings[kind][slug] = [pk for pk in ids if pk != object_id]
+        return True
+
+    def _still_tagged(self, kind, slug, removed_skill_id, object_id):
+        siblings = [pk for pk, other in self.skill_slugs.items() if other == slug and pk != removed_skill_id]
+        if not siblings:
+            return False
+        through, column = next(
+            (through, column) for through, (through_kind, column) in THROUGH_MODELS.items()
+            if through_kind == kind
+        )
+        return through.objects.filter(skill_id__in=siblings, **{column: object_id}).exists()
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def get_technology_index():
+    """Return the index for the current content version, rebuilding if stale"""
+    global _index
+    version = get_content_version()
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _lock:
+        if _index is None or _index.version != version:
+            _index = TechnologyIndex.build(version)
+        return _index
+
+
+def apply_m2m_change(sender, instance, action, reverse, pk_set, previous_version, version):
+    """
+    Patch the local index for a technologies M2M change.
+
+    Only applies when the index was current right before the change;
+    otherwise it is left stale and rebuilt on next use.
+    """
+    global _index
+    kind, _ = THROUGH_MODELS[sender]
+    with _lock:
+        index = _index
+        if index is None or index.version != previous_version or action == 'post_clear':
+            _index = None
+            return
+        if reverse:
+            # instance is the Skill, pk_set holds project/experience ids
+            pairs = [(instance.pk, object_id) for object_id in pk_set]
+        else:
+            pairs = [(skill_id, instance.pk) for skill_id in pk_set]
+        apply = index.add if action == 'post_add' else index.remove
+        for skill_id, object_id in pairs:
+            if not apply(kind, skill_id, object_id):
+                _index = None
+                return
+        index.version = version
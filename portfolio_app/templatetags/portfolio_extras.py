@@ -0,0 +1,40 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from ..critical_css import get_critical_css
+from ..fonts import font_face_markup, load_manifest
+from ..js_modules import module_graph
+
+register = template.Library()
+
+
+@register.simple_tag
+def critical_css():
+    """Above-the-fold CSS built by ``manage.py build_critical_css``, or ''"""
+    return mark_safe(get_critical_css())
+
+
+@register.simple_tag
+def font_faces():
+    """Self-hosted font preloads and @font-face rules, or '' before ``subset_fonts`` has run"""
+    manifest = load_manifest()
+    return font_face_markup(manifest) if manifest else ''
+
+
+@register.simple_tag
+def module_script(name):
+    """A module entry point plus modulepreload links for its static imports"""
+    preloads = format_html_join(
+        '\n', '<link rel="modulepreload" href="{}">', ((static(dependency),) for dependency in module_graph(name))
+    )
+    return format_html('{}\n<script type="module" src="{}"></script>', preloads, static(name))
+
+
+@register.simple_tag
+def service_worker_url():
+    """URL for site.js to register the service worker at, or '' when it is disabled"""
+    return reverse('portfolio:service_worker') if settings.SERVICE_WORKER_ENABLED else ''
@@ -1,12 +1,17 @@
+import json
+import re
+
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.core import mail
-from .models import ContactMessage, Profile
+from .models import ContactMessage, Experience, Profile, Project, Skill
 from .forms import ContactForm
 
 
 class ContactFormTests(TestCase):
     def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
         self.client = Client()
         self.contact_url = reverse('portfolio:contact')
         
@@ -182,3 +187,1486 @@ class ContactMessageModelTests(TestCase):
         # Second message should come first (newest first)
         self.assertEqual(messages[0], message2)
         self.assertEqual(messages[1], message1)
+
+
+class ContactMessageAdminTests(TestCase):
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        self.admin_user = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='password'
+        )
+        self.client.force_login(self.admin_user)
+        self.changelist_url = reverse('admin:portfolio_app_contactmessage_changelist')
+    
+    def create_messages(self, count, **kwargs):
+        return [
+            ContactMessage.objects.create(
+                name=f'Sender {i}',
+                email=f'sender{i}@example.com',
+                subject=kwargs.get('subject', f'Subject {i}'),
+                message=kwargs.get('message', 'A perfectly ordinary message body.')
+            )
+            for i in range(count)
+        ]
+    
+    def test_full_text_search_matches_message_body(self):
+        """Test that admin search uses the FTS index over the message body"""
+        self.create_messages(2)
+        ContactMessage.objects.create(
+            name='Grace', email='grace@example.com',
+            subject='Collaboration', message='Interested in your retrieval pipeline work.'
+        )
+        
+        response = self.client.get(self.changelist_url, {'q': 'retriev'})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([m.name for m in response.context['cl'].result_list], ['Grace'])
+    
+    def test_keyset_pagination_walks_all_messages(self):
+        """Test that following the 'older' cursor visits every message once"""
+        self.create_messages(250)
+        seen = []
+        params = {}
+        
+        while True:
+            response = self.client.get(self.changelist_url, params)
+            cl = response.context['cl']
+            seen.extend(m.pk for m in cl.result_list)
+            if not cl.next_cursor:
+                break
+            params = {'before': cl.next_cursor}
+        
+        self.assertEqual(len(seen), 250)
+        self.assertEqual(len(set(seen)), 250)
+    
+    def test_bulk_actions_update_selected_messages(self):
+        """Test mark-read and archive actions"""
+        messages = self.create_messages(3)
+        selected = [str(m.pk) for m in messages[:2]]
+        
+        self.client.post(self.changelist_url, {'action': 'mark_as_read', '_selected_action': selected})
+        self.assertEqual(ContactMessage.objects.filter(is_read=True).count(), 2)
+        
+        self.client.post(self.changelist_url, {'action': 'archive_messages', '_selected_action': selected})
+        self.assertEqual(ContactMessage.objects.filter(is_archived=True).count(), 2)
+
+    def test_export_action_streams_selected_messages_as_csv(self):
+        import csv
+        messages = self.create_messages(3, message='Line one,\nline "two"')
+        selected = [str(m.pk) for m in messages[:2]]
+
+        response = self.client.post(self.changelist_url, {'action': 'export_as_csv', '_selected_action': selected})
+
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment; filename="contact-messages-', response['Content-Disposition'])
+        rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines(keepends=True)))
+        self.assertEqual(rows[0][:3], ['id', 'created_at', 'name'])
+        self.assertEqual([row[0] for row in rows[1:]], selected)
+        self.assertEqual(rows[1][5], 'Line one,\nline "two"')
+
+
+class ArchiveMessagesCommandTests(TestCase):
+    def test_old_read_messages_are_archived(self):
+        """Test that old read messages move to a gzip NDJSON archive"""
+        import gzip
+        import json
+        import tempfile
+        from io import StringIO
+        from datetime import timedelta
+        from pathlib import Path
+        from django.core.management import call_command
+        from django.utils import timezone
+        
+        for i in range(5):
+            ContactMessage.objects.create(
+                name=f'User {i}', email=f'user{i}@example.com',
+                subject='Old', message='An old message body.', is_read=i < 4
+            )
+        recent = ContactMessage.objects.create(
+            name='Recent', email='recent@example.com',
+            subject='New', message='A recent message body.', is_read=True
+        )
+        ContactMessage.objects.exclude(pk=recent.pk).update(created_at=timezone.now() - timedelta(days=400))
+        
+        with tempfile.TemporaryDirectory() as archive_dir:
+            call_command('archive_messages', days=180, batch_size=3, archive_dir=archive_dir, stdout=StringIO())
+            
+            archives = list(Path(archive_dir).glob('*.ndjson.gz'))
+            self.assertEqual(len(archives), 1)
+            with gzip.open(archives[0], 'rt') as handle:
+                rows = [json.loads(line) for line in handle]
+        
+        self.assertEqual(len(rows), 4)
+        # Unread old message and the recent one stay in the inbox
+        self.assertEqual(ContactMessage.objects.count(), 2)
+        self.assertTrue(ContactMessage.objects.filter(pk=recent.pk).exists())
+    
+    def test_archive_never_overwrites_an_existing_file(self):
+        import tempfile
+        from io import StringIO
+        from datetime import timedelta
+        from pathlib import Path
+        from unittest import mock
+        from django.core.management import call_command
+        from django.utils import timezone
+        
+        message = ContactMessage.objects.create(
+            name='Old', email='old@example.com', subject='Old', message='An old message body.', is_read=True
+        )
+        ContactMessage.objects.update(created_at=timezone.now() - timedelta(days=400))
+        
+        with tempfile.TemporaryDirectory() as archive_dir:
+            frozen = timezone.now()
+            existing = Path(archive_dir, f"contact_messages_{frozen:%Y%m%dT%H%M%S%f}.ndjson.gz")
+            existing.write_bytes(b'earlier run')
+            with mock.patch('django.utils.timezone.now', return_value=frozen), self.assertRaises(FileExistsError):
+                call_command('archive_messages', days=180, archive_dir=archive_dir, stdout=StringIO())
+            self.assertEqual(existing.read_bytes(), b'earlier run')
+        
+        # Nothing was deleted without being archived
+        self.assertTrue(ContactMessage.objects.filter(pk=message.pk).exists())
+
+
+class ContentAdminFormTests(TestCase):
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        from django.core.cache import cache
+        cache.clear()
+        self.profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        for i in range(5):
+            Skill.objects.create(name=f'Skill {i}', category='programming', proficiency='advanced')
+        admin_user = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='password'
+        )
+        self.client.force_login(admin_user)
+    
+    def test_add_page_reuses_profile_and_skill_choices(self):
+        """Test that add pages look up the profile once and cache skill choices"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        add_url = reverse('admin:portfolio_app_project_add')
+        self.client.get(add_url)  # warm the skill choices cache
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(add_url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Skill 4 (Programming Languages)')
+        self.assertEqual(response.context['adminform'].form.fields['profile'].initial, self.profile)
+        sql = [q['sql'] for q in queries.captured_queries]
+        self.assertFalse([q for q in sql if 'FROM "portfolio_app_skill"' in q])
+        # The profile comes from Profile.get_solo()'s cache, not a fresh query
+        self.assertFalse([q for q in sql if '"portfolio_app_profile"."bio"' in q and 'LIMIT' in q])
+    
+    def test_skill_choices_refresh_after_skill_change(self):
+        """Test that saving a skill invalidates the cached choices"""
+        self.client.get(reverse('admin:portfolio_app_project_add'))
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='Brand New', category='tools', proficiency='beginner')
+        
+        response = self.client.get(reverse('admin:portfolio_app_project_add'))
+        
+        self.assertContains(response, 'Brand New (Engineering Tools)')
+
+
+class ProfileSoloTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        Profile.clear_solo_cache()
+    
+    def test_get_solo_is_cached_until_profile_changes(self):
+        """Test that the singleton is fetched once and refreshed on save"""
+        self.assertIsNone(Profile.get_solo())
+        with self.captureOnCommitCallbacks(execute=True):
+            profile = Profile.objects.create(
+                full_name="Test User", title="AI Engineer", bio="Test bio",
+                location="Test Location", email="test@example.com"
+            )
+        
+        self.assertEqual(Profile.get_solo(), profile)
+        # Only the content version is read from the cache, not the profile
+        with self.assertNumQueries(0):
+            Profile.get_solo()
+        
+        profile.title = "ML Engineer"
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        
+        self.assertEqual(Profile.get_solo().title, "ML Engineer")
+    
+    def test_get_solo_follows_a_version_bumped_by_another_worker(self):
+        """Test that the process-local copy is checked against the shared version"""
+        from .versioning import bump_content_version
+        profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        self.assertEqual(Profile.get_solo().title, "AI Engineer")
+        
+        # Another worker's edit: no signal runs in this process
+        Profile.objects.filter(pk=profile.pk).update(title="ML Engineer")
+        bump_content_version()
+        
+        self.assertEqual(Profile.get_solo().title, "ML Engineer")
+
+
+class StaticAssetPipelineTests(TestCase):
+    def test_collectstatic_minifies_reports_and_enforces_budgets(self):
+        """Test minification, the size report and the budget check"""
+        import json
+        import tempfile
+        from contextlib import redirect_stdout
+        from io import StringIO
+        from pathlib import Path
+        from django.core.management import call_command
+        from django.test import override_settings
+        from .storage import AssetBudgetExceeded, SIZE_REPORT_NAME
+        
+        with tempfile.TemporaryDirectory() as static_root:
+            with override_settings(
+                STATIC_ROOT=static_root,
+                STATIC_ASSET_BUDGETS={'js/*.js': 100},
+                # Project assets only; the admin's files aren't under budget
+                STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            ):
+                out, stray = StringIO(), StringIO()
+                with self.assertRaises(AssetBudgetExceeded), redirect_stdout(stray):
+                    call_command('collectstatic', interactive=False, verbosity=1, stdout=out, stderr=StringIO())
+            
+            # The table goes through the command's output, even on failure
+            self.assertRegex(out.getvalue(), r'Asset +Source +Minified +Gzip +Brotli')
+            self.assertIn('js/site.js', out.getvalue())
+            self.assertEqual(stray.getvalue(), '')
+            report = json.loads((Path(static_root) / SIZE_REPORT_NAME).read_text())
+            site_js = report['js/site.js']
+            self.assertLess(site_js['minified'], site_js['source'])
+            self.assertLess(site_js['brotli'], site_js['minified'])
+            self.assertTrue((Path(static_root) / (site_js['hashed_name'] + '.br')).exists())
+
+
+class CriticalCssTests(TestCase):
+    def test_extract_keeps_only_above_the_fold_rules(self):
+        from .critical_css import extract, used_selectors
+        
+        html = (
+            '<nav class="nav-link"></nav>'
+            '<section id="home" class="hero md:flex"><button type="button"></button></section>'
+            '<section id="contact" class="contact-form"></section>'
+        )
+        css = (
+            '.nav-link{color:red}.contact-form{color:blue}'
+            '@media (min-width:768px){.md\\:flex:hover{display:flex}.contact-form{display:grid}}'
+            "[type='button']{cursor:pointer}[type='checkbox']{color:blue}"
+            '.hero{animation:fade 1s}@keyframes fade{to{opacity:1}}@keyframes spin{to{opacity:0}}'
+        )
+        critical = extract(css, used_selectors(html))
+        
+        self.assertIn('.nav-link{color:red}', critical)
+        self.assertIn('@media (min-width:768px){.md\\:flex:hover{display:flex}}', critical)
+        self.assertIn("[type='button']", critical)
+        self.assertIn('@keyframes fade', critical)
+        self.assertNotIn('contact-form', critical)
+        self.assertNotIn('checkbox', critical)
+        self.assertNotIn('spin', critical)
+    
+    def test_base_template_inlines_built_css(self):
+        import tempfile
+        from io import StringIO
+        from pathlib import Path
+        from django.core.management import call_command
+        from django.test import override_settings
+        
+        with tempfile.TemporaryDirectory() as build_dir:
+            critical_file = Path(build_dir) / 'critical.css'
+            with override_settings(CRITICAL_CSS_FILE=critical_file):
+                call_command('build_critical_css', stdout=StringIO())
+                critical = critical_file.read_text()
+                response = self.client.get(reverse('portfolio:home'))
+        
+        self.assertIn('.nav-link', critical)
+        # Rendering seeds sample data only inside a rolled back transaction
+        self.assertFalse(Profile.objects.exists())
+        self.assertContains(response, f'<style>{critical}</style>')
+        self.assertContains(response, 'as="style" onload="this.onload=null;this.rel=\'stylesheet\'"', count=2)
+
+
+class PrerenderTests(TestCase):
+    def test_sample_homepage_render_leaves_nothing_behind(self):
+        """Test that seeded sample data is neither cached, indexed nor kept"""
+        from unittest import mock
+        from django.core.cache import cache
+        from .prerender import render_homepage
+        from .versioning import get_content_version
+        
+        cache.clear()
+        version = get_content_version()
+        with mock.patch('portfolio_app.search.index_objects') as index_objects:
+            html = render_homepage(seed=True)
+        
+        self.assertIn('Alex Chen', html)
+        index_objects.assert_not_called()
+        self.assertFalse(Profile.objects.exists())
+        self.assertEqual(get_content_version(), version)
+        self.assertNotContains(self.client.get(reverse('portfolio:home')), 'Alex Chen')
+
+
+class SubsetFontsTests(TestCase):
+    def build_font(self, path, weight, characters):
+        from fontTools.fontBuilder import FontBuilder
+        from fontTools.pens.ttGlyphPen import TTGlyphPen
+        
+        names = ['.notdef'] + [f'uni{ord(char):04X}' for char in characters]
+        pen = TTGlyphPen(None)
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500))
+        pen.lineTo((500, 0))
+        pen.closePath()
+        glyph = pen.glyph()
+        builder = FontBuilder(1000, isTTF=True)
+        builder.setupGlyphOrder(names)
+        builder.setupCharacterMap({ord(char): f'uni{ord(char):04X}' for char in characters})
+        builder.setupGlyf({name: glyph for name in names})
+        builder.setupHorizontalMetrics({name: (600, 0) for name in names})
+        builder.setupHorizontalHeader(ascent=800, descent=-200)
+        builder.setupNameTable({'familyName': 'Inter', 'styleName': 'Regular'})
+        builder.setupOS2(usWeightClass=weight)
+        builder.setupPost()
+        builder.save(path)
+    
+    def test_subsets_to_rendered_glyphs_and_switches_templates(self):
+        import json
+        import tempfile
+        from io import StringIO
+        from pathlib import Path
+        from django.core.management import call_command
+        from django.test import override_settings
+        from fontTools.ttLib import TTFont
+        
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as static_dir:
+            # Ж is neither on the page nor in the default character set
+            self.build_font(Path(source_dir) / 'Inter-Regular.ttf', 400, 'AIaiЖ')
+            output_dir = Path(static_dir) / 'fonts'
+            call_command(
+                'subset_fonts', source_dir=source_dir, output_dir=str(output_dir),
+                weights=[400], stdout=StringIO(),
+            )
+            
+            manifest = json.loads((output_dir / 'fonts.json').read_text())
+            face = manifest['faces'][0]
+            self.assertRegex(face['file'], r'^fonts/inter-400\.[0-9a-f]{12}\.woff2$')
+            font = TTFont(Path(static_dir) / face['file'])
+            self.assertEqual(font.flavor, 'woff2')
+            self.assertIn(ord('A'), font.getBestCmap())
+            self.assertNotIn(ord('Ж'), font.getBestCmap())
+            
+            with override_settings(
+                STATICFILES_DIRS=[static_dir],
+                STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage',
+            ):
+                response = self.client.get(reverse('portfolio:home'))
+        
+        self.assertContains(response, f'<link rel="preload" href="/static/{face["file"]}" as="font"')
+        self.assertContains(response, 'font-display:swap')
+        self.assertNotContains(response, 'fonts.googleapis.com')
+    
+    def test_pages_never_load_third_party_fonts(self):
+        """Test that without a manifest the system font is used, not Google Fonts"""
+        from unittest import mock
+        
+        with mock.patch('portfolio_app.templatetags.portfolio_extras.load_manifest', return_value=None):
+            response = self.client.get(reverse('portfolio:home'))
+        
+        self.assertNotContains(response, '@font-face')
+        self.assertNotContains(response, 'fonts.googleapis.com')
+        self.assertNotContains(response, 'fonts.gstatic.com')
+
+
+class PageScriptTests(TestCase):
+    def test_module_graph_excludes_dynamic_imports(self):
+        from .js_modules import module_graph
+        
+        graph = module_graph('js/home.js')
+        self.assertIn('js/site.js', graph)
+        self.assertIn('js/modules/projects.js', graph)
+        self.assertIn('js/modules/utils.js', graph)
+        self.assertNotIn('js/modules/project-modal.js', graph)
+        self.assertNotIn('js/modules/project-filter.js', graph)
+    
+    def test_pages_load_only_their_entry_point(self):
+        home = self.client.get(reverse('portfolio:home')).content.decode()
+        contact = self.client.get(reverse('portfolio:contact')).content.decode()
+        
+        self.assertRegex(home, r'<script type="module" src="/static/js/home\.[0-9a-f]+\.js">')
+        self.assertRegex(home, r'<link rel="modulepreload" href="/static/js/modules/animations\.[0-9a-f]+\.js">')
+        self.assertRegex(contact, r'<script type="module" src="/static/js/site\.[0-9a-f]+\.js">')
+        self.assertNotIn('js/home', contact)
+        self.assertNotIn('modules/animations', contact)
+
+    def test_skill_bars_carry_server_widths(self):
+        from .js_modules import module_graph
+
+        Skill.objects.create(name='PyTorch', category='ai_ml', proficiency='expert', is_featured=True)
+        Skill.objects.create(name='Go', category='backend', proficiency='intermediate', is_featured=True)
+
+        home = self.client.get(reverse('portfolio:home')).content.decode()
+        widths = re.findall(r'skill-progress[^>]*data-width="(\d+)"', home, re.S)
+        self.assertEqual(sorted(widths), ['100', '60'])
+        self.assertIn('js/modules/scheduler.js', module_graph('js/home.js'))
+
+
+class ServiceWorkerTests(TestCase):
+    def test_worker_precaches_hashed_site_assets(self):
+        with self.settings(SERVICE_WORKER_ENABLED=True):
+            response = self.client.get(reverse('portfolio:service_worker'))
+        
+        self.assertEqual(response['Content-Type'], 'application/javascript')
+        self.assertIn('no-cache', response['Cache-Control'])
+        body = response.content.decode()
+        precache = json.loads(re.search(r'const PRECACHE_URLS = (\[.*?\]);', body).group(1))
+        self.assertTrue(any(re.match(r'/static/css/output\.[0-9a-f]+\.css$', url) for url in precache))
+        self.assertTrue(any(re.match(r'/static/js/home\.[0-9a-f]+\.js$', url) for url in precache))
+        self.assertFalse(any('/admin/' in url for url in precache))
+    
+    def test_disabled_worker_unregisters_itself(self):
+        with self.settings(SERVICE_WORKER_ENABLED=False):
+            response = self.client.get(reverse('portfolio:service_worker'))
+            home = self.client.get(reverse('portfolio:home'))
+        
+        self.assertContains(response, 'self.registration.unregister()')
+        self.assertContains(home, 'data-service-worker=""')
+    
+    def test_homepage_revalidates_with_content_version_etag(self):
+        response = self.client.get(reverse('portfolio:home'))
+        etag = response['ETag']
+        
+        unchanged = self.client.get(reverse('portfolio:home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(unchanged.status_code, 304)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='PyTorch', category='ai_ml', proficiency='expert')
+        changed = self.client.get(reverse('portfolio:home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], etag)
+
+
+class ProjectDetailTests(TestCase):
+    def setUp(self):
+        from datetime import date
+        from django.core.cache import cache
+        cache.clear()
+        self.profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        self.skill = Skill.objects.create(name='PyTorch', category='ai_ml', proficiency='expert')
+        self.project = Project.objects.create(
+            profile=self.profile, title='RAG Assistant', description='Short card text',
+            detailed_description='A very long write-up that only the modal needs.',
+            is_featured=True, created_date=date(2024, 5, 1)
+        )
+        self.project.technologies.add(self.skill)
+        self.detail_url = reverse('portfolio:project_detail', args=[self.project.pk])
+    
+    def test_project_detail_returns_json(self):
+        """Test the on-demand project detail endpoint"""
+        response = self.client.get(self.detail_url)
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['title'], 'RAG Assistant')
+        self.assertEqual(data['technologies'], ['PyTorch'])
+        self.assertEqual(data['created_date'], 'May 2024')
+    
+    def test_project_detail_honours_etag(self):
+        """Test that a matching If-None-Match yields 304 until content changes"""
+        etag = self.client.get(self.detail_url)['ETag']
+        
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        
+        self.project.title = 'RAG Assistant v2'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'RAG Assistant v2')
+    
+    def test_missing_project_returns_404(self):
+        response = self.client.get(reverse('portfolio:project_detail', args=[9999]))
+        self.assertEqual(response.status_code, 404)
+    
+    def test_missing_project_is_never_304(self):
+        """Test that a conditional request for a missing project still gets a 404"""
+        from .versioning import get_content_version
+        url = reverse('portfolio:project_detail', args=[9999])
+        
+        for etag in (f'"project-9999-v{get_content_version()}"', '*'):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 404)
+    
+    def test_homepage_does_not_embed_detailed_description(self):
+        """Test that the homepage links to the endpoint instead of inlining details"""
+        response = self.client.get(reverse('portfolio:home'))
+        
+        self.assertContains(response, self.detail_url)
+        self.assertNotContains(response, 'only the modal needs')
+
+
+class ProjectListTests(TestCase):
+    def setUp(self):
+        from datetime import date, timedelta
+        from django.core.cache import cache
+        cache.clear()
+        profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        self.pytorch = Skill.objects.create(name='PyTorch', category='ai_ml', proficiency='expert')
+        self.django = Skill.objects.create(name='Django', category='backend', proficiency='expert')
+        for i in range(15):
+            project = Project.objects.create(
+                profile=profile, title=f'Project {i}', description='Card text',
+                # Pairs share a date so the order/id tie-breakers are exercised
+                is_featured=True, created_date=date(2024, 1, 1) + timedelta(days=i // 2), order=i % 3
+            )
+            project.technologies.add(self.pytorch if i % 3 == 0 else self.django)
+        self.list_url = reverse('portfolio:project_list')
+    
+    def test_cursor_pagination_returns_every_project_in_order(self):
+        """Test that walking the cursor matches the model's ordering"""
+        titles = []
+        params = {'page_size': 4}
+        while True:
+            data = self.client.get(self.list_url, params).json()
+            titles.extend(item['title'] for item in data['results'])
+            if not data['next_cursor']:
+                break
+            params['cursor'] = data['next_cursor']
+        
+        expected = list(Project.objects.order_by('-created_date', 'order', 'pk').values_list('title', flat=True))
+        self.assertEqual(titles, expected)
+    
+    def test_filter_by_technology(self):
+        data = self.client.get(self.list_url, {'tech': 'pytorch', 'page_size': 24}).json()
+        
+        self.assertEqual(len(data['results']), 5)
+        self.assertTrue(all(item['technologies'] == ['PyTorch'] for item in data['results']))
+    
+    def test_only_first_pages_are_cached(self):
+        """Test that pages reached by cursor don't each get a cache entry"""
+        from unittest import mock
+        
+        first = self.client.get(self.list_url, {'page_size': 2}).json()
+        self.assertTrue(first['next_cursor'])
+        with mock.patch('portfolio_app.views.cache.set') as cache_set:
+            self.client.get(self.list_url, {'page_size': 2})
+            self.client.get(self.list_url, {'page_size': 2, 'cursor': first['next_cursor']})
+        cache_set.assert_not_called()
+    
+    def test_html_fragment_exposes_next_cursor(self):
+        response = self.client.get(self.list_url, {'format': 'html', 'featured': '1'})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode().count('class="project-card'), 6)
+        self.assertIn('X-Next-Cursor', response)
+    
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.list_url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_unknown_technologies_stay_out_of_the_page_cache(self):
+        """Test that only known skill slugs reach cache keys"""
+        from django.core.cache import cache
+        from .projects import DEFAULT_PAGE_SIZE, page_cache_key
+        
+        # Dropped from an ``any`` filter: the page is the one for pytorch alone
+        response = self.client.get(self.list_url, {'tech': 'pytorch,no-such-tech', 'page_size': 24})
+        self.assertEqual(len(response.json()['results']), 5)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIsNotNone(cache.get(page_cache_key('json', ['pytorch'], 'any', False, 24)))
+        self.assertIsNone(cache.get(page_cache_key('json', ['no-such-tech', 'pytorch'], 'any', False, 24)))
+        
+        # Under ``all`` nothing matches, and nothing is cached
+        response = self.client.get(self.list_url, {'tech': 'pytorch,no-such-tech', 'match': 'all'})
+        self.assertEqual(response.json(), {'next_cursor': None, 'results': []})
+        self.assertIsNone(cache.get(page_cache_key('json', ['pytorch'], 'all', False, DEFAULT_PAGE_SIZE)))
+    
+    def test_technology_filter_is_clamped(self):
+        from .projects import MAX_FILTER_TECHNOLOGIES
+        
+        techs = ['django'] * MAX_FILTER_TECHNOLOGIES + ['pytorch']
+        data = self.client.get(self.list_url, {'tech': ','.join(techs), 'page_size': 24}).json()
+        
+        self.assertEqual(len(data['results']), 10)
+
+
+class HomepageStreamingTests(TestCase):
+    def setUp(self):
+        from datetime import date
+        from django.core.cache import cache
+        cache.clear()
+        profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        skill = Skill.objects.create(name='PyTorch', category='ai_ml', proficiency='expert', is_featured=True)
+        project = Project.objects.create(
+            profile=profile, title='Streamed Project', description='Card text',
+            is_featured=True, created_date=date(2024, 1, 1)
+        )
+        project.technologies.add(skill)
+    
+    def test_streaming_matches_buffered_render(self):
+        """Test that the streamed homepage has the same markup as render()"""
+        buffered = self.client.get(reverse('portfolio:home'))
+        with self.settings(HOMEPAGE_STREAMING=True):
+            streamed = self.client.get(reverse('portfolio:home'))
+        
+        self.assertTrue(streamed.streaming)
+        content = b''.join(streamed.streaming_content).decode()
+        # The section includes add blank lines
+        def normalize(html):
+            return re.sub(r'\s+', ' ', html)
+        self.assertEqual(normalize(content), normalize(buffered.content.decode()))
+        self.assertIn('Streamed Project', content)
+    
+    def test_streaming_sends_head_first_without_cookies(self):
+        with self.settings(HOMEPAGE_STREAMING=True):
+            response = self.client.get(reverse('portfolio:home'))
+        
+        self.assertFalse(response.cookies)
+        first_chunk = next(iter(response.streaming_content)).decode()
+        self.assertIn('</head>', first_chunk)
+        self.assertNotIn('Streamed Project', first_chunk)
+
+
+class TechnologyIndexTests(TestCase):
+    def setUp(self):
+        from datetime import date
+        from django.core.cache import cache
+        cache.clear()
+        profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        self.pytorch = Skill.objects.create(name='PyTorch', category='ai_ml', proficiency='expert')
+        self.django = Skill.objects.create(name='Django', category='backend', proficiency='expert')
+        self.both = Project.objects.create(profile=profile, title='Both', description='x', created_date=date(2024, 1, 1))
+        self.only_torch = Project.objects.create(profile=profile, title='Torch', description='x', created_date=date(2024, 1, 2))
+        self.both.technologies.add(self.pytorch, self.django)
+        self.only_torch.technologies.add(self.pytorch)
+        self.experience = Experience.objects.create(
+            profile=profile, company='Acme', position='Engineer', location='Remote',
+            start_date=date(2023, 1, 1), description='Work'
+        )
+        self.experience.technologies.add(self.django)
+    
+    def test_and_or_queries(self):
+        from .tech_index import get_technology_index
+        index = get_technology_index()
+        
+        self.assertEqual(index.query(['pytorch', 'django'], match='any'), sorted([self.both.pk, self.only_torch.pk]))
+        self.assertEqual(index.query(['pytorch', 'django'], match='all'), [self.both.pk])
+        self.assertEqual(index.query(['django'], kind='experience'), [self.experience.pk])
+        self.assertEqual(index.query(['unknown']), [])
+    
+    def test_m2m_change_is_applied_incrementally(self):
+        """Test that a committed technologies change patches the index in place"""
+        from .tech_index import get_technology_index
+        index = get_technology_index()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.only_torch.technologies.add(self.django)
+        
+        self.assertIs(get_technology_index(), index)
+        self.assertEqual(index.query(['pytorch', 'django'], match='all'), sorted([self.both.pk, self.only_torch.pk]))
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pytorch.project_set.remove(self.both)
+        
+        self.assertIs(get_technology_index(), index)
+        self.assertEqual(index.query(['pytorch']), [self.only_torch.pk])
+    
+    def test_technology_filter_endpoint(self):
+        response = self.client.get(reverse('portfolio:technology_filter'), {'tech': 'django,pytorch', 'match': 'all'})
+        
+        self.assertEqual(response.json(), {'match': 'all', 'projects': [self.both.pk], 'experiences': []})
+    
+    def test_technology_filter_with_unknown_slug_is_not_shared(self):
+        url = reverse('portfolio:technology_filter')
+        
+        response = self.client.get(url, {'tech': 'django,nope', 'match': 'all'})
+        self.assertEqual(response.json(), {'match': 'all', 'projects': [], 'experiences': []})
+        self.assertIn('private', response['Cache-Control'])
+        self.assertNotIn('Surrogate-Key', response)
+        
+        response = self.client.get(url, {'tech': 'django,nope'})
+        self.assertEqual(response.json()['projects'], [self.both.pk])
+
+
+class SiteSearchTests(TestCase):
+    def setUp(self):
+        from datetime import date
+        from django.core.cache import cache
+        cache.clear()
+        profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        self.langchain = Skill.objects.create(name='LangChain', category='ai_ml', proficiency='expert')
+        self.rag = Project.objects.create(
+            profile=profile, title='Retrieval Assistant', description='Answers questions over documents',
+            detailed_description='Hybrid retrieval with reranking', created_date=date(2024, 1, 1)
+        )
+        self.other = Project.objects.create(
+            profile=profile, title='Dashboard', description='Shows retrieval metrics',
+            created_date=date(2024, 2, 1)
+        )
+        self.rag.technologies.add(self.langchain)
+    
+    def test_prefix_query_ranks_title_matches_first(self):
+        from . import search
+        results = search.search('retriev', kinds=['project'])
+        
+        self.assertEqual([r['id'] for r in results], [self.rag.pk, self.other.pk])
+        self.assertIn('<mark>', results[1]['snippet'])
+    
+    def test_index_follows_saves_deletes_and_technologies(self):
+        from . import search
+        self.assertEqual(search.matching_ids('project', 'langchain'), [self.rag.pk])
+        
+        self.langchain.name = 'LlamaIndex'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.langchain.save()
+        self.assertEqual(search.matching_ids('project', 'llamaindex'), [self.rag.pk])
+        
+        self.rag.technologies.clear()
+        self.assertEqual(search.matching_ids('project', 'llamaindex'), [])
+        
+        self.other.delete()
+        self.assertEqual(search.matching_ids('project', 'dashboard'), [])
+    
+    def test_skill_rename_reindexes_its_projects_in_a_fixed_number_of_queries(self):
+        """Test that a skill's projects are reindexed in one batch after commit"""
+        from datetime import date
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from . import search
+        for i in range(5):
+            project = Project.objects.create(
+                profile=self.rag.profile, title=f'Agent {i}', description='x', created_date=date(2024, 3, 1)
+            )
+            project.technologies.add(self.langchain)
+        
+        self.langchain.name = 'LlamaIndex'
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.langchain.save()
+        self.assertEqual(search.matching_ids('project', 'llamaindex'), [])
+        
+        retire, reindex = callbacks
+        retire()
+        with CaptureQueriesContext(connection) as queries:
+            reindex()
+        self.assertEqual(len(search.matching_ids('project', 'llamaindex')), 6)
+        self.assertLessEqual(len(queries), 8)
+    
+    def test_clearing_a_skills_projects_reindexes_them(self):
+        """Test that a reverse clear, which has no pk_set, still updates documents"""
+        from . import search
+        self.assertEqual(search.matching_ids('project', 'langchain'), [self.rag.pk])
+        
+        self.langchain.project_set.clear()
+        
+        self.assertEqual(search.matching_ids('project', 'langchain'), [])
+        # Nothing is left stashed on the skill
+        self.assertEqual(self.langchain._cleared_technology_pks, {})
+    
+    def test_endpoint_searches_the_database_it_was_routed_to(self):
+        from unittest import mock
+        
+        def db_for_read(model, **hints):
+            return 'replica1' if model is Project else 'default'
+        
+        with mock.patch('portfolio_app.views.router.db_for_read', side_effect=db_for_read), \
+                mock.patch('portfolio_app.search.search_available', return_value=True) as available, \
+                mock.patch('portfolio_app.search.search', return_value=[]) as run_search:
+            self.client.get(reverse('portfolio:search'), {'q': 'retrieval'})
+        
+        available.assert_called_once_with('replica1')
+        self.assertEqual(run_search.call_args.kwargs['using'], 'replica1')
+    
+    def test_only_short_normalised_queries_are_cached(self):
+        """Test that free-text variations don't each get a cache entry"""
+        from unittest import mock
+        from . import search
+        
+        url = reverse('portfolio:search')
+        with mock.patch('portfolio_app.search.search', wraps=search.search) as run_search:
+            self.client.get(url, {'q': 'hybrid'})
+            self.client.get(url, {'q': 'hybrid'})
+            self.assertEqual(run_search.call_count, 1)
+            
+            for term in ('Hybrid', 'hybrid  rerank', 'hybrid rerank retrieval agents', 'no such thing'):
+                response = self.client.get(url, {'q': term})
+                self.client.get(url, {'q': term})
+            self.assertEqual(run_search.call_count, 9)
+        self.assertIn('private', response['Cache-Control'])
+    
+    def test_rebuild_command_and_endpoint(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.db import connection
+        from . import search
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.SEARCH_TABLE}")
+        
+        call_command('rebuild_search_index', stdout=StringIO())
+        response = self.client.get(reverse('portfolio:search'), {'q': 'hybrid rerank'})
+        
+        results = response.json()['results']
+        self.assertEqual(results[0]['id'], self.rag.pk)
+        self.assertEqual(results[0]['url'], reverse('portfolio:project_detail', args=[self.rag.pk]))
+        self.assertIn('<mark>Hybrid</mark>', results[0]['snippet'])
+
+
+class BootstrapCommandTests(TestCase):
+    def test_skips_work_that_is_already_done(self):
+        import os
+        from io import StringIO
+        from unittest import mock
+        from django.contrib.auth import get_user_model
+        from django.core.management import call_command
+        
+        env = {'DJANGO_SUPERUSER_USERNAME': 'owner', 'DJANGO_SUPERUSER_PASSWORD': 'secret-pass'}
+        with mock.patch.dict(os.environ, env):
+            out = StringIO()
+            call_command('bootstrap', only=['migrate', 'superuser'], stdout=out)
+            call_command('bootstrap', only=['superuser'], stdout=out)
+        
+        output = out.getvalue()
+        self.assertRegex(output, r'migrate\s+up to date, skipped')
+        self.assertRegex(output, r'superuser\s+created owner')
+        self.assertRegex(output, r'superuser\s+owner exists')
+        self.assertTrue(get_user_model().objects.get(username='owner').check_password('secret-pass'))
+    
+    def test_collected_tree_is_current_until_sources_change(self):
+        import tempfile
+        from io import StringIO
+        from django.core.management import call_command
+        from django.test import override_settings
+        from .storage import collected_is_current
+        
+        with tempfile.TemporaryDirectory() as static_root:
+            with override_settings(
+                STATIC_ROOT=static_root,
+                CRITICAL_CSS_ON_COLLECTSTATIC=False,
+                STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            ):
+                self.assertFalse(collected_is_current())
+                call_command('collectstatic', interactive=False, verbosity=0, stdout=StringIO())
+                self.assertTrue(collected_is_current())
+                with override_settings(STATIC_URL='/assets/'):
+                    self.assertFalse(collected_is_current())
+    
+    def test_migrate_creates_a_configured_cache_table(self):
+        """Test that `migrate` alone is enough for CACHE_URL=dbcache://..."""
+        from io import StringIO
+        from django.core.management import call_command
+        from django.db import connection
+        from django.test import override_settings
+        
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'migrated_cache'}}
+        with override_settings(CACHES=caches):
+            call_command('migrate', verbosity=0, stdout=StringIO())
+        
+        self.assertIn('migrated_cache', connection.introspection.table_names())
+
+
+class StartupProfileTests(TestCase):
+    def test_reports_phases_and_flags_eager_lazy_imports(self):
+        from io import StringIO
+        from unittest import mock
+        from django.core.management import CommandError, call_command
+        from .management.commands import startup_profile
+        
+        stderr = [
+            'import time: self [us] | cumulative | imported package',
+            'import time:       300 |        300 |   _brotli',
+            'import time:       100 |        400 | brotli',
+            'import time:      2000 |       2500 | portfolio_app.views',
+        ]
+        imports = startup_profile.parse_importtime(stderr)
+        self.assertEqual(imports['brotli'], (100, 400, 0))
+        self.assertEqual(imports['_brotli'], (300, 300, 1))
+        
+        profile = {
+            'phases': [['settings', 50.0, 40000], ['app registry', 120.0, 45000], ['first request', 80.0, 46000]],
+            'status': '200 OK',
+            'bytes': 1024,
+            'boot_modules': ['brotli', 'portfolio_app.views'],
+            'request_modules': [],
+            'imports': imports,
+        }
+        with mock.patch.object(startup_profile.Command, 'run_probe', return_value=profile):
+            out = StringIO()
+            call_command('startup_profile', lazy=['fontTools'], check=True, stdout=out)
+            self.assertRegex(out.getvalue(), r'boot total\s+170\.0')
+            self.assertRegex(out.getvalue(), r'fontTools\s+not loaded')
+            
+            with self.assertRaisesMessage(CommandError, 'brotli'):
+                call_command('startup_profile', lazy=['brotli'], check=True, stdout=StringIO())
+
+
+class WarmUpTests(TestCase):
+    def test_warm_up_fills_homepage_caches_and_closes_connections(self):
+        from unittest import mock
+        from django.template import engines
+        from . import models, warmup
+        
+        Profile.objects.create(full_name='Test User', title='Engineer', bio='Bio', email='test@example.com')
+        models.Profile.clear_solo_cache()
+        
+        with mock.patch.object(warmup.connections, 'close_all') as close_all:
+            timings = warmup.warm_up()
+        
+        self.assertEqual(set(timings), {'templates', 'homepage'})
+        close_all.assert_called_once()
+        self.assertEqual(models._solo_profile[1].full_name, 'Test User')
+        loader = engines['django'].engine.template_loaders[0]
+        self.assertIn('portfolio/home.html', {key.split('-')[0] for key in loader.get_template_cache})
+
+
+class ConnectionPoolTests(TestCase):
+    def test_pool_bounds_connections_and_records_waits(self):
+        import threading
+        import time
+        from unittest import mock
+        from .db_backends.pool import ConnectionPool, PoolTimeout
+        
+        opened = []
+        def connect():
+            opened.append(mock.Mock())
+            return opened[-1]
+        pool = ConnectionPool('test', connect, max_size=2, timeout=0.05)
+        
+        first, second = pool.acquire(), pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        
+        # A release wakes a waiting thread, which reuses that connection
+        timer = threading.Timer(0.02, pool.release, args=[first])
+        pool.timeout = 2
+        timer.start()
+        self.assertIs(pool.acquire(), first)
+        timer.join()
+        
+        pool.release(second, reusable=False)
+        second.close.assert_called_once()
+        stats = pool.stats()
+        self.assertEqual(len(opened), 2)
+        self.assertEqual((stats['open'], stats['in_use'], stats['waits'], stats['timeouts']), (1, 1, 1, 1))
+        self.assertGreater(stats['wait_ms_max'], 0)
+    
+    def test_health_check_reports_pools_to_staff_only(self):
+        from django.contrib.auth import get_user_model
+        
+        url = reverse('portfolio:health_check') + '?pool=1'
+        with self.settings(DEBUG=False):
+            self.assertEqual(self.client.get(url).content, b'OK')
+            self.client.force_login(get_user_model().objects.create_user('staff', password='pw', is_staff=True))
+            data = self.client.get(url).json()
+        self.assertEqual(data['status'], 'ok')
+        self.assertIn('default', data['pools'])
+
+
+class ReplicaRoutingTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from django.test import RequestFactory
+        from .routers import ReplicaRouter, ReplicaRoutingMiddleware, replica_reads
+        cache.clear()
+        
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+        self.routed = []
+        
+        @replica_reads
+        def reader(request):
+            self.routed.append(self.router.db_for_read(Profile))
+            return self.respond()
+        
+        def writer(request):
+            self.routed.append(self.router.db_for_write(Profile))
+            return self.respond()
+        
+        self.reader, self.writer = reader, writer
+        self.middleware = ReplicaRoutingMiddleware(lambda request: self.view(request))
+        self.middleware.replicas = ['replica1']
+    
+    def respond(self):
+        from django.http import HttpResponse
+        return HttpResponse()
+    
+    def call(self, view, **cookies):
+        request = self.factory.get('/')
+        request.COOKIES.update(cookies)
+        self.view = lambda request: self.middleware.process_view(request, view, (), {}) or view(request)
+        return self.middleware(request)
+    
+    def test_marked_views_read_from_a_replica(self):
+        from .routers import STICKY_COOKIE
+        
+        response = self.call(self.reader)
+        self.assertEqual(self.routed, ['replica1'])
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+        # Outside a request everything stays on the primary
+        self.assertIsNone(self.router.db_for_read(Profile))
+    
+    def test_streamed_bodies_keep_the_request_routing(self):
+        from django.http import StreamingHttpResponse
+        from .routers import replica_reads
+        
+        @replica_reads
+        def streamer(request):
+            def sections():
+                for section in ('head', 'body'):
+                    self.routed.append(self.router.db_for_read(Profile))
+                    yield section
+            return StreamingHttpResponse(sections())
+        
+        response = self.call(streamer)
+        self.assertEqual(b''.join(response.streaming_content), b'headbody')
+        self.assertEqual(self.routed, ['replica1', 'replica1'])
+        self.assertIsNone(self.router.db_for_read(Profile))
+    
+    def test_writes_make_the_visitor_sticky_to_the_primary(self):
+        from .routers import STICKY_COOKIE
+        
+        response = self.call(self.writer)
+        self.assertEqual(self.routed, ['default'])
+        self.assertIn(STICKY_COOKIE, response.cookies)
+        
+        self.call(self.reader, **{STICKY_COOKIE: '1'})
+        self.assertEqual(self.routed[-1], None)
+    
+    def test_cache_misses_do_not_make_the_visitor_sticky(self):
+        """Test that filling a DatabaseCache on a GET isn't taken for a write"""
+        from io import StringIO
+        from unittest import mock
+        from django.core.management import call_command
+        from .routers import STICKY_COOKIE
+        
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'routing_cache'}}
+        with self.settings(CACHES=caches), \
+                mock.patch('portfolio_app.routers.replica_aliases', return_value=['replica1']), \
+                mock.patch('portfolio_app.routers.replica_caught_up', return_value=False):
+            call_command('createcachetable', stdout=StringIO())
+            for url in (reverse('portfolio:home'), reverse('portfolio:project_list')):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(STICKY_COOKIE, response.cookies)
+    
+    def test_content_changes_fence_the_replicas_until_they_catch_up(self):
+        from unittest import mock
+        from django.core.cache import cache
+        from .models import ReplicationMarker
+        from .routers import PRIMARY_FENCE_KEY, _replica_positions
+        
+        self.addCleanup(_replica_positions.clear)
+        with mock.patch('portfolio_app.routers.replica_aliases', return_value=['replica1']):
+            with self.captureOnCommitCallbacks(execute=True):
+                Skill.objects.create(name='Routing', category='backend')
+                # Nothing is fenced before the write commits
+                self.assertIsNone(cache.get(PRIMARY_FENCE_KEY))
+        fence = cache.get(PRIMARY_FENCE_KEY)
+        self.assertEqual(ReplicationMarker.objects.get().version, fence)
+        
+        # However long it takes, a replica behind the write isn't read
+        with mock.patch('portfolio_app.routers.replica_position', return_value=fence - 1):
+            self.call(self.reader)
+        self.assertEqual(self.routed, [None])
+        
+        with mock.patch('portfolio_app.routers.replica_position', return_value=fence):
+            self.call(self.reader)
+        self.assertEqual(self.routed, [None, 'replica1'])
+    
+    def test_pooled_replica_connections_notice_a_replaced_file(self):
+        import os
+        import sqlite3
+        import tempfile
+        from django.db import connection
+        from .db_backends.sqlite3.base import DatabaseWrapper
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'replica.sqlite3')
+            for name in (path, path + '.tmp'):
+                sqlite3.connect(name).close()
+            replica = DatabaseWrapper({
+                **connection.settings_dict, 'NAME': f'file:{path}?mode=ro', 'OPTIONS': {'uri': True},
+            }, alias='replica_test')
+            raw = replica.create_connection(replica.get_connection_params())
+            self.addCleanup(raw.close)
+            self.assertTrue(replica.connection_is_alive(raw))
+            
+            # What sync_sqlite_replica does
+            os.replace(path + '.tmp', path)
+            self.assertFalse(replica.connection_is_alive(raw))
+
+
+class EdgeCacheTests(TestCase):
+    def setUp(self):
+        from datetime import date
+        from django.core.cache import cache
+        cache.clear()
+        self.profile = Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+        self.project = Project.objects.create(
+            profile=self.profile, title='Cached', description='Short card text', created_date=date(2024, 5, 1)
+        )
+    
+    def test_public_responses_carry_shared_cache_headers_and_surrogate_keys(self):
+        response = self.client.get(reverse('portfolio:project_list'))
+        cache_control = response['Cache-Control']
+        for directive in ('public', 's-maxage=300', 'stale-while-revalidate=60', 'max-age=0'):
+            self.assertIn(directive, cache_control)
+        self.assertEqual(response['Surrogate-Key'].split(), ['portfolio', 'project', 'skill'])
+        self.assertFalse(response.cookies)
+        self.assertNotIn('Cookie', response.get('Vary', ''))
+        
+        # The view's own browser lifetime is kept
+        response = self.client.get(reverse('portfolio:project_detail', args=[self.project.pk]))
+        self.assertIn('max-age=300', response['Cache-Control'])
+        self.assertIn('s-maxage=300', response['Cache-Control'])
+    
+    def test_responses_that_set_cookies_stay_private(self):
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+        from .edge_cache import EdgeCacheMiddleware
+        
+        def visitor_page(request):
+            response = HttpResponse()
+            response.set_cookie('visitor', '1')
+            return response
+        
+        request = RequestFactory().get('/')
+        request.surrogate_keys = ('project',)
+        response = EdgeCacheMiddleware(visitor_page)(request)
+        self.assertEqual(response['Cache-Control'], 'private')
+        self.assertNotIn('Surrogate-Key', response)
+    
+    def test_content_changes_purge_their_surrogate_keys_after_commit(self):
+        from unittest import mock
+        
+        hook = mock.Mock()
+        with self.settings(EDGE_CACHE_PURGE_HOOK='portfolio_app.tests.purge_hook'), \
+                mock.patch('portfolio_app.edge_cache.import_string', return_value=hook) as import_string:
+            with self.captureOnCommitCallbacks(execute=True):
+                skill = Skill.objects.create(name='Edge', category='backend', proficiency='expert')
+                hook.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.project.technologies.add(skill)
+        
+        import_string.assert_called_with('portfolio_app.tests.purge_hook')
+        self.assertEqual(hook.call_args_list[0], mock.call(('skill',)))
+        self.assertEqual(hook.call_args_list[-1], mock.call(('project', 'skill')))
+    
+    def test_failing_purge_hook_does_not_break_saves(self):
+        from unittest import mock
+        
+        with self.settings(EDGE_CACHE_PURGE_HOOK='portfolio_app.tests.purge_hook'), \
+                mock.patch('portfolio_app.edge_cache.import_string', side_effect=OSError('CDN down')), \
+                self.assertLogs('portfolio_app.edge_cache', 'ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                Skill.objects.create(name='Edge', category='backend', proficiency='expert')
+        self.assertTrue(Skill.objects.filter(name='Edge').exists())
+
+
+class CookieFreePageTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        Profile.objects.create(
+            full_name="Test User", title="AI Engineer", bio="Test bio",
+            location="Test Location", email="test@example.com"
+        )
+    
+    def test_homepage_sets_no_cookies_and_is_shared(self):
+        response = self.client.get(reverse('portfolio:home'))
+        self.assertFalse(response.cookies)
+        self.assertNotIn('Cookie', response.get('Vary', ''))
+        self.assertIn('public', response['Cache-Control'])
+        self.assertContains(response, reverse('portfolio:csrf_token'))
+        self.assertNotContains(response, 'name="csrfmiddlewaretoken" value="')
+    
+    def test_homepage_does_not_load_the_session(self):
+        from unittest import mock
+        from django.contrib.auth import get_user_model
+        from django.contrib.sessions.backends.db import SessionStore
+        
+        self.client.force_login(get_user_model().objects.create_user('staff', password='pw', is_staff=True))
+        with mock.patch.object(SessionStore, 'load') as load:
+            response = self.client.get(reverse('portfolio:home'))
+        load.assert_not_called()
+        self.assertFalse(response.cookies)
+    
+    def test_fetched_token_is_accepted_by_the_contact_form(self):
+        client = Client(enforce_csrf_checks=True)
+        response = client.get(reverse('portfolio:csrf_token'))
+        self.assertIn('no-store', response['Cache-Control'])
+        self.assertIn('csrftoken', response.cookies)
+        
+        data = {'name': 'John Doe', 'email': 'john@example.com', 'subject': 'Hello', 'message': 'A message with enough content.'}
+        self.assertEqual(client.post(reverse('portfolio:contact'), data).status_code, 403)
+        response = client.post(
+            reverse('portfolio:contact'), data,
+            HTTP_X_CSRFTOKEN=response.json()['token'], HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(ContactMessage.objects.filter(name='John Doe').exists())
+
+
+class NotificationDigestTests(TestCase):
+    def test_notifications_are_coalesced_until_the_window_closes(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from .models import NotificationDigest
+        from .notifications import CONTACT, notify, send_due_digests
+        
+        with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+            notify(['owner@example.com'], 'Portfolio Contact: Hello', 'First message', kind=CONTACT)
+            notify(['owner@example.com'], 'Portfolio Contact: Again', 'Second message', kind=CONTACT)
+        
+        self.assertEqual(len(mail.outbox), 0)
+        digest = NotificationDigest.objects.get()
+        self.assertEqual(digest.items.count(), 2)
+        
+        self.assertEqual(send_due_digests(), 0)
+        self.assertEqual(send_due_digests(now=timezone.now() + timedelta(minutes=6)), 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('2 × contact message', mail.outbox[0].subject)
+        self.assertIn('First message', mail.outbox[0].body)
+        self.assertIn('Second message', mail.outbox[0].body)
+        digest.refresh_from_db()
+        self.assertIsNotNone(digest.sent_at)
+        
+        # Digests off: mailed straight away, as before
+        notify(['owner@example.com'], 'Portfolio Contact: Now', 'Third message')
+        self.assertEqual(len(mail.outbox), 2)
+    
+    def test_an_unreachable_mail_server_leaves_digests_pending(self):
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+        from .models import NotificationDigest
+        from .notifications import notify, send_due_digests
+        
+        with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+            notify(['owner@example.com'], 'Portfolio Contact: Hello', 'Pending message')
+        
+        connection = mock.Mock(**{'open.side_effect': ConnectionRefusedError('Connection refused')})
+        with mock.patch('portfolio_app.notifications.get_connection', return_value=connection), \
+                self.assertLogs('portfolio_app.notifications', 'ERROR'):
+            self.assertEqual(send_due_digests(now=timezone.now() + timedelta(minutes=6)), 0)
+        
+        self.assertIsNone(NotificationDigest.objects.get().sent_at)
+        self.assertEqual(send_due_digests(now=timezone.now() + timedelta(minutes=6)), 1)
+    
+    def test_items_never_join_a_digest_that_is_being_sent(self):
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+        from .models import NotificationDigest
+        from . import notifications
+        
+        with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+            notifications.notify(['owner@example.com'], 'Portfolio Contact: Hello', 'First message')
+        build = notifications.build_digest_email
+        
+        def build_during_a_new_message(digest, connection=None):
+            # Another request notifies while the claimed digest is mailed
+            with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+                notifications.notify(['owner@example.com'], 'Portfolio Contact: Again', 'Second message')
+            return build(digest, connection)
+        
+        # The sender sees the window closed; the notifying request's clock
+        # still has it open
+        due = timezone.now() + timedelta(minutes=6)
+        with mock.patch('portfolio_app.notifications.build_digest_email', side_effect=build_during_a_new_message):
+            self.assertEqual(notifications.send_due_digests(now=due), 1)
+        
+        self.assertNotIn('Second message', mail.outbox[0].body)
+        pending = NotificationDigest.objects.get(sent_at__isnull=True)
+        self.assertEqual(list(pending.items.values_list('body', flat=True)), ['Second message'])
+    
+    def test_a_failed_send_releases_the_claim(self):
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+        from .models import NotificationDigest
+        from .notifications import notify, send_due_digests
+        
+        with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+            notify(['owner@example.com'], 'Portfolio Contact: Hello', 'Pending message')
+        
+        with mock.patch('django.core.mail.EmailMessage.send', side_effect=OSError('Connection reset')), \
+                self.assertLogs('portfolio_app.notifications', 'ERROR'):
+            self.assertEqual(send_due_digests(now=timezone.now() + timedelta(minutes=6)), 0)
+        
+        self.assertIsNone(NotificationDigest.objects.get().sent_at)
+    
+    def test_repeated_errors_are_counted_once_per_digest(self):
+        from .models import DigestItem
+        from .notifications import ERROR, notify
+        
+        with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+            for _ in range(3):
+                notify(
+                    ['admin@example.com'], 'Error: OperationalError', 'Database is locked',
+                    kind=ERROR, fingerprint='db-locked',
+                )
+        
+        self.assertEqual(len(mail.outbox), 0)
+        item = DigestItem.objects.get()
+        self.assertEqual((item.kind, item.count, item.digest.recipient), ('error', 3, 'admin@example.com'))
+    
+    def test_admin_lists_pending_digests_and_sends_them(self):
+        from django.contrib.auth import get_user_model
+        from .models import NotificationDigest
+        from .notifications import notify
+        
+        with self.settings(NOTIFICATION_DIGEST_MINUTES=5):
+            notify(['owner@example.com'], 'Portfolio Contact: Hello', 'Pending message')
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        url = reverse('admin:portfolio_app_notificationdigest_changelist')
+        
+        self.assertContains(self.client.get(url, {'status': 'pending'}), 'owner@example.com')
+        self.client.post(url, {
+            'action': 'send_now',
+            '_selected_action': [NotificationDigest.objects.get().pk],
+        })
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertNotContains(self.client.get(url, {'status': 'pending'}), 'owner@example.com')
+
+
+def raise_locked():
+    from django.db import OperationalError
+    raise OperationalError('database is locked')
+
+
+class ErrorReporterTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+    
+    def error_record(self, raise_error=raise_locked):
+        import logging
+        import sys
+        
+        try:
+            raise_error()
+        except Exception:
+            exc_info = sys.exc_info()
+        return logging.LogRecord('django.request', logging.ERROR, __file__, 1, 'Internal Server Error: /', None, exc_info)
+    
+    def test_handler_only_queues_inside_the_request(self):
+        from unittest import mock
+        from .error_reporter import ErrorReporter, ErrorReportHandler
+        from .models import ErrorReport
+        
+        reporter = ErrorReporter()
+        with mock.patch('portfolio_app.error_reporter.get_reporter', return_value=reporter), \
+                mock.patch.object(ErrorReporter, '_ensure_thread'):
+            ErrorReportHandler().emit(self.error_record())
+        
+        self.assertFalse(ErrorReport.objects.exists())
+        self.assertEqual(len(mail.outbox), 0)
+        report, = reporter.drain(block=False)
+        self.assertEqual(report['exception_type'], 'django.db.utils.OperationalError')
+        self.assertTrue(report['location'].startswith('portfolio_app/tests.py:'))
+        self.assertTrue(report['location'].endswith('in raise_locked'))
+    
+    def test_errors_are_grouped_by_fingerprint_and_mails_rate_limited(self):
+        from datetime import timedelta
+        from .error_reporter import ErrorReporter, build_report
+        from .models import ErrorReport
+        
+        def raise_other():
+            raise ValueError('bad value')
+        
+        reporter = ErrorReporter()
+        locked = build_report(self.error_record())
+        with self.settings(ADMINS=[('Admin', 'admin@example.com')], ERROR_MAIL_INTERVAL=600):
+            reporter.process([locked, locked, locked, build_report(self.error_record(raise_other))])
+            self.assertEqual(len(mail.outbox), 2)
+            self.assertEqual(ErrorReport.objects.get(fingerprint=locked['fingerprint']).count, 3)
+            self.assertIn('3 occurrence(s) since the last email', mail.outbox[0].body)
+            
+            # Within the interval: counted, not mailed
+            reporter.process([locked, locked])
+            self.assertEqual(len(mail.outbox), 2)
+            report = ErrorReport.objects.get(fingerprint=locked['fingerprint'])
+            self.assertEqual((report.count, report.unmailed_count), (5, 2))
+            
+            ErrorReport.objects.update(last_mailed_at=report.last_mailed_at - timedelta(minutes=11))
+            reporter.process([locked])
+            self.assertEqual(len(mail.outbox), 3)
+            self.assertIn('3 occurrence(s) since the last email', mail.outbox[2].body)
+    
+    def test_admins_are_mailed_when_the_database_cannot_record(self):
+        from unittest import mock
+        from django.db import OperationalError
+        from .error_reporter import ErrorReporter, build_report
+        
+        reporter = ErrorReporter()
+        locked = build_report(self.error_record())
+        with self.settings(ADMINS=[('Admin', 'admin@example.com')], ERROR_MAIL_INTERVAL=600), \
+                mock.patch.object(ErrorReporter, 'record', side_effect=OperationalError('disk I/O error')), \
+                self.assertLogs('portfolio_app.error_reporter', 'ERROR'):
+            reporter.process([locked, locked])
+            # Still at most once per interval
+            reporter.process([locked])
+        
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('2 occurrence(s)', mail.outbox[0].body)
+        self.assertIn('not recorded', mail.outbox[0].body)
+    
+    def test_hourly_mail_budget(self):
+        from .error_reporter import ErrorReporter, build_report
+        from .models import ErrorMailHour, ErrorReport
+        
+        def raise_other():
+            raise ValueError('bad value')
+        
+        with self.settings(ADMINS=[('Admin', 'admin@example.com')], ERROR_MAIL_MAX_PER_HOUR=1):
+            ErrorReporter().process([build_report(self.error_record()), build_report(self.error_record(raise_other))])
+            # A claim lost to the interval spends nothing
+            ErrorReporter().process([build_report(self.error_record())])
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(ErrorReport.objects.count(), 2)
+        self.assertEqual(ErrorMailHour.objects.get().sent, 1)
+        # Over budget: the claim is undone, so the next email includes it
+        unmailed = ErrorReport.objects.get(exception_type='ValueError')
+        self.assertEqual((unmailed.last_mailed_at, unmailed.unmailed_count), (None, 1))
+    
+    def test_digest_mode_and_admin_index(self):
+        from django.contrib.auth import get_user_model
+        from .error_reporter import ErrorReporter, build_report
+        from .models import DigestItem, ErrorReport
+        
+        with self.settings(ADMINS=[('Admin', 'admin@example.com')], NOTIFICATION_DIGEST_MINUTES=5):
+            ErrorReporter().process([build_report(self.error_record())] * 2)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(DigestItem.objects.get().kind, 'error')
+        
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        response = self.client.get(reverse('admin:portfolio_app_errorreport_changelist'))
+        self.assertContains(response, 'in raise_locked')
+        response = self.client.get(reverse('admin:portfolio_app_errorreport_change', args=[ErrorReport.objects.get().pk]))
+        self.assertContains(response, 'database is locked')
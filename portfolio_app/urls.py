@@ -6,6 +6,12 @@ app_name = 'portfolio'
 urlpatterns = [
     path('', views.home, name='home'),
     path('contact/', views.contact, name='contact'),
+    path('csrf/', views.csrf_token, name='csrf_token'),
+    path('projects/', views.project_list, name='project_list'),
+    path('technologies/', views.technology_filter, name='technology_filter'),
+    path('search/', views.site_search, name='search'),
+    path('projects/<int:pk>/', views.project_detail, name='project_detail'),
+    path('sw.js', views.service_worker, name='service_worker'),
     path('health/', views.health_check, name='health_check'),
     path('health', views.health_check, name='health_check1'),
 ]
\ No newline at end of file
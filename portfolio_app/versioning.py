@@ -0,0 +1,45 @@
+"""
+Content version counter shared by every cache that renders portfolio data.
+
+Any save or delete of Profile, Skill, Experience or Project (see
+``signals.py``) bumps the counter, which retires every key built with
+``versioned_key`` at once instead of deleting keys one by one.
+
+The counter lives in the shared cache (``CACHES`` in settings), so every
+worker sees a bump as soon as it is made.
+"""
+
+import time
+
+from django.core.cache import cache
+
+CONTENT_VERSION_KEY = 'portfolio_content_version'
+
+
+def get_content_version():
+    """Return the current content version, initialising it if needed"""
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        # Seed from the clock so a flushed cache never reuses an old version
+        # that a process may still hold in memory
+        seed = time.time_ns() // 1000
+        cache.add(CONTENT_VERSION_KEY, seed, None)
+        # A cache that keeps nothing (DummyCache) gets a new version each time
+        version = cache.get(CONTENT_VERSION_KEY, seed)
+    return version
+
+
+def bump_content_version():
+    """Invalidate every versioned cache entry"""
+    # Not cache.incr(): on the database cache that is a read then a write, so
+    # two edits at once could both end on the same version. A fresh value
+    # from the clock differs from whatever either of them read.
+    current = cache.get(CONTENT_VERSION_KEY) or 0
+    version = max(time.time_ns() // 1000, current + 1)
+    cache.set(CONTENT_VERSION_KEY, version, None)
+    return version
+
+
+def versioned_key(name):
+    """Build a cache key that is only valid for the current content version"""
+    return f'{name}:v{get_content_version()}'
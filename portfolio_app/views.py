@@ -1,16 +1,37 @@
 from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from django.views.decorators.cache import cache_control, never_cache
+from django.middleware.csrf import get_token
 from django.views.decorators.csrf import csrf_protect
-from django.core.mail import send_mail
+from django.views.decorators.http import condition, require_GET
 from django.conf import settings
 from django.utils import timezone
 from django.core.cache import cache
+from django.db import router
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.template.loader import render_to_string
+from django.utils.dateformat import format as format_date
+from django.utils.text import slugify
 from datetime import timedelta
+import hashlib
+import json
+import os
 import re
 import logging
 from .models import Profile, Skill, Experience, Project, ContactMessage
 from .forms import ContactForm
+from .edge_cache import edge_cache, exclude_from_edge_cache
+from .notifications import CONTACT, notify
+from .projects import (
+    DEFAULT_PAGE_SIZE, MAX_FILTER_TECHNOLOGIES, MAX_PAGE_SIZE, PAGE_CACHE_TIMEOUT, InvalidCursor,
+    decode_cursor, get_project_page, page_cache_key,
+)
+from .routers import replica_reads
+from . import search
+from .tech_index import EXPERIENCE, PROJECT, get_technology_index
+from .versioning import get_content_version, versioned_key
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
@@ -64,34 +85,36 @@ def is_too_soon(request):
     return False
 
 
+# Compiled once at import, so a preloaded gunicorn master shares them with
+# every worker
+SPAM_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    # URLs (multiple or suspicious domains)
+    r'https?://[^\s]+.*https?://[^\s]+',  # Multiple URLs
+    r'\b\w+\.(tk|ml|ga|cf|gq|bit\.ly|tinyurl)\b',  # Suspicious domains
+    
+    # Excessive repetition
+    r'(.)\1{4,}',  # Same character 5+ times
+    r'(\b\w+\b)(\s+\1){3,}',  # Same word 4+ times
+    
+    # Excessive caps or punctuation
+    r'[A-Z]{10,}',  # 10+ consecutive caps
+    r'[!?]{3,}',    # Excessive punctuation
+    
+    # Common spam keywords
+    r'\b(viagra|cialis|casino|lottery|winner|urgent|act now|limited time|free money|make money|work from home|click here|buy now|guaranteed|risk free|call now|bitcoin|cryptocurrency|investment opportunity|loan|credit|pharmacy|pills|weight loss|dating|singles|adult|xxx|replica|rolex|seo|backlinks|traffic|followers|likes|marketing|advertising|spam|bulk email|business opportunity|mlm|pyramid|scam|fraud|phishing|malware|virus)\b',
+    
+    # Suspicious patterns
+    r'\b(dear friend|beneficiary|inheritance|million dollars|congratulations|you have won|claim your prize|limited offer|act fast|don\'t delete|urgent response|time sensitive|confidential|business proposal)\b'
+)]
+
+
 def contains_spam_content(name, email, subject, message):
     """Check if content contains spam patterns"""
     # Combine all text for analysis
     all_text = f"{name} {email} {subject} {message}".lower()
     
-    # Common spam patterns
-    spam_patterns = [
-        # URLs (multiple or suspicious domains)
-        r'https?://[^\s]+.*https?://[^\s]+',  # Multiple URLs
-        r'\b\w+\.(tk|ml|ga|cf|gq|bit\.ly|tinyurl)\b',  # Suspicious domains
-        
-        # Excessive repetition
-        r'(.)\1{4,}',  # Same character 5+ times
-        r'(\b\w+\b)(\s+\1){3,}',  # Same word 4+ times
-        
-        # Excessive caps or punctuation
-        r'[A-Z]{10,}',  # 10+ consecutive caps
-        r'[!?]{3,}',    # Excessive punctuation
-        
-        # Common spam keywords
-        r'\b(viagra|cialis|casino|lottery|winner|urgent|act now|limited time|free money|make money|work from home|click here|buy now|guaranteed|risk free|call now|bitcoin|cryptocurrency|investment opportunity|loan|credit|pharmacy|pills|weight loss|dating|singles|adult|xxx|replica|rolex|seo|backlinks|traffic|followers|likes|marketing|advertising|spam|bulk email|business opportunity|mlm|pyramid|scam|fraud|phishing|malware|virus)\b',
-        
-        # Suspicious patterns
-        r'\b(dear friend|beneficiary|inheritance|million dollars|congratulations|you have won|claim your prize|limited offer|act fast|don\'t delete|urgent response|time sensitive|confidential|business proposal)\b'
-    ]
-    
-    for pattern in spam_patterns:
-        if re.search(pattern, all_text, re.IGNORECASE):
+    for pattern in SPAM_PATTERNS:
+        if pattern.search(all_text):
             return True
     
     return False
@@ -102,10 +125,9 @@ def has_honeypot_content(request):
     return bool(request.POST.get('website', '').strip())
 
 
-def home(request):
-    """Main portfolio homepage with error handling and logging"""
+def get_home_profile(request):
     try:
-        profile = Profile.objects.first()
+        profile = Profile.get_solo()
         logger.info(f"Portfolio homepage accessed by {get_client_ip(request)}")
     except Profile.DoesNotExist:
         profile = None
@@ -113,41 +135,119 @@ def home(request):
     except Exception as e:
         logger.error(f"Error fetching profile: {str(e)}")
         profile = None
-    
+    return profile
+
+
+def get_skills_context():
+    """Featured skills grouped by category display name"""
     try:
-        # Get featured skills by category
         skills_by_category = {}
         for category, display_name in Skill.CATEGORY_CHOICES:
             skills = Skill.objects.filter(category=category, is_featured=True)
             if skills.exists():
                 skills_by_category[display_name] = skills
-        
-        # Get recent experiences (limit to 3)
-        experiences = Experience.objects.select_related('profile').prefetch_related('technologies')[:3]
-        
-        # Get featured projects (limit to 6)
-        projects = Project.objects.filter(is_featured=True).prefetch_related('technologies')[:6]
-        
     except Exception as e:
-        logger.error(f"Error fetching portfolio data: {str(e)}")
+        logger.error(f"Error fetching skills: {str(e)}")
         skills_by_category = {}
+    return {'skills_by_category': skills_by_category}
+
+
+def get_experience_context():
+    """The three most recent experiences"""
+    try:
+        experiences = list(Experience.objects.select_related('profile').prefetch_related('technologies')[:3])
+    except Exception as e:
+        logger.error(f"Error fetching experiences: {str(e)}")
         experiences = []
-        projects = []
-    
+    return {'experiences': experiences}
+
+
+def get_projects_context():
+    """First page of featured projects; the rest load through project_list.
+    Detailed descriptions are served on demand by project_detail."""
+    try:
+        projects, projects_next_cursor = get_project_page(featured=True)
+    except Exception as e:
+        logger.error(f"Error fetching projects: {str(e)}")
+        projects, projects_next_cursor = [], None
+    return {'projects': projects, 'projects_next_cursor': projects_next_cursor}
+
+
+# Homepage sections in page order, with the function that loads each one's data
+HOME_SECTIONS = [
+    ('portfolio/sections/hero.html', None),
+    ('portfolio/sections/skills.html', get_skills_context),
+    ('portfolio/sections/experience.html', get_experience_context),
+    ('portfolio/sections/projects.html', get_projects_context),
+    ('portfolio/sections/contact.html', None),
+]
+
+# Stands in for the sections when the page shell is rendered for streaming
+HOME_SECTIONS_MARKER = '<!-- home-sections -->'
+
+
+def stream_home(request, context):
+    """
+    Render the page shell first so <head> and its preloads reach the browser
+    straight away, then query and render each section as it is streamed.
+    """
+    shell = render_to_string(
+        'portfolio/home.html', {**context, 'home_sections_marker': HOME_SECTIONS_MARKER}, request=request
+    )
+    head, tail = shell.split(HOME_SECTIONS_MARKER, 1)
+
+    def sections():
+        yield head
+        for template_name, get_section_context in HOME_SECTIONS:
+            section_context = {**context, **(get_section_context() if get_section_context else {})}
+            yield render_to_string(template_name, section_context, request=request)
+        yield tail
+
+    return StreamingHttpResponse(sections(), content_type='text/html; charset=utf-8')
+
+
+def static_version():
+    """Hash of the static files manifest; changes with every collectstatic"""
+    return getattr(staticfiles_storage, 'manifest_hash', '') or 'dev'
+
+
+def home_etag(request):
+    # Content edits bump the version and deploys change the manifest hash,
+    # so an unchanged ETag means the page (and its asset URLs) is unchanged
+    return f"home-v{get_content_version()}-{static_version()}"
+
+
+@replica_reads
+@edge_cache('profile', 'skill', 'experience', 'project')
+@condition(etag_func=home_etag)
+def home(request):
+    """Main portfolio homepage with error handling and logging"""
     context = {
-        'profile': profile,
-        'skills_by_category': skills_by_category,
-        'experiences': experiences,
-        'projects': projects,
+        'profile': get_home_profile(request),
         'emailjs_public_key': settings.EMAILJS_PUBLIC_KEY,
         'emailjs_service_id': settings.EMAILJS_SERVICE_ID,
         'emailjs_template_id': settings.EMAILJS_TEMPLATE_ID,
         'emailjs_to_email': settings.EMAILJS_TO_EMAIL,
     }
-    
+
+    if settings.HOMEPAGE_STREAMING:
+        return stream_home(request, context)
+
+    for _, get_section_context in HOME_SECTIONS:
+        if get_section_context:
+            context.update(get_section_context())
+    context['home_sections'] = [template_name for template_name, _ in HOME_SECTIONS]
+
     return render(request, 'portfolio/home.html', context)
 
 
+@require_GET
+@never_cache
+def csrf_token(request):
+    """CSRF token (and cookie) for the homepage contact form, which is cached without one"""
+    return JsonResponse({'token': get_token(request)})
+
+
 @csrf_protect
 def contact(request):
     """Handle contact form submissions with anti-spam protection"""
@@ -198,16 +298,15 @@ def contact(request):
                 message=form.cleaned_data['message']
             )
             
-            # Send email notification (optional)
+            # Send email notification (optional), or queue it for the digest
             try:
-                profile = Profile.objects.first()
+                profile = Profile.get_solo()
                 if profile and profile.email:
-                    send_mail(
+                    notify(
+                        [profile.email],
                         subject=f"Portfolio Contact: {form.cleaned_data['subject']}",
-                        message=f"From: {form.cleaned_data['name']} ({form.cleaned_data['email']})\n\n{form.cleaned_data['message']}",
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[profile.email],
-                        fail_silently=True,
+                        body=f"From: {form.cleaned_data['name']} ({form.cleaned_data['email']})\n\n{form.cleaned_data['message']}",
+                        kind=CONTACT,
                     )
             except Exception:
                 pass  # Email sending is optional
@@ -228,6 +327,232 @@ def contact(request):
     return render(request, 'portfolio/contact.html', {'form': form})
 
 
+def serialize_project_card(project):
+    """JSON-ready representation of a project card"""
+    return {
+        'id': project.id,
+        'title': project.title,
+        'description': project.description,
+        'image': project.image.url if project.image else '',
+        'github_url': project.github_url,
+        'demo_url': project.demo_url,
+        'technologies': [tech.name for tech in project.technologies.all()],
+        'created_date': format_date(project.created_date, 'F Y'),
+    }
+
+
+def serialize_project(project):
+    """JSON-ready representation of a project for the detail modal"""
+    data = serialize_project_card(project)
+    data['detailed_description'] = project.detailed_description
+    return data
+
+
+def project_etag(request, pk):
+    # No ETag for a missing project, so the view answers 404 instead of 304
+    if cache.get(versioned_key(f'project_detail_{pk}')) is None and not Project.objects.filter(pk=pk).exists():
+        return None
+    # Any content change bumps the version, so the ETag never goes stale
+    return f"project-{pk}-v{get_content_version()}"
+
+
+@replica_reads
+@edge_cache('project', 'skill')
+@require_GET
+@cache_control(public=True, max_age=300)
+@condition(etag_func=project_etag)
+def project_detail(request, pk):
+    """Project details for the homepage modal, fetched on demand"""
+    cache_key = versioned_key(f'project_detail_{pk}')
+    data = cache.get(cache_key)
+    if data is None:
+        project = Project.objects.prefetch_related('technologies').filter(pk=pk).first()
+        if project is None:
+            return JsonResponse({'error': 'Project not found'}, status=404)
+        data = serialize_project(project)
+        cache.set(cache_key, data, 60 * 60 * 24)
+    return JsonResponse(data)
+
+
+def get_technology_params(request):
+    """
+    Technology slugs and match mode from the ``tech``/``match`` query parameters.
+    
+    Only slugs of existing skills are returned, at most
+    ``MAX_FILTER_TECHNOLOGIES`` of them, so the values that reach cache keys
+    are bounded. The third value is False if an unknown slug was dropped:
+    with ``match=all`` nothing can match then.
+    """
+    requested = {slugify(tech) for tech in request.GET.get('tech', '').split(',')[:MAX_FILTER_TECHNOLOGIES]} - {''}
+    match = 'all' if request.GET.get('match') == 'all' else 'any'
+    technologies = sorted(requested & get_technology_index().slugs)
+    return technologies, match, len(technologies) == len(requested)
+
+
+@replica_reads
+@edge_cache('project', 'experience', 'skill')
+@require_GET
+def technology_filter(request):
+    """Ids of projects and experiences tagged with the requested technologies"""
+    technologies, match, known = get_technology_params(request)
+    index = get_technology_index()
+    if not technologies and known:
+        return JsonResponse({
+            'technologies': {
+                PROJECT: index.technologies(PROJECT),
+                EXPERIENCE: index.technologies(EXPERIENCE),
+            },
+        })
+    if not known and (match == 'all' or not technologies):
+        return exclude_from_edge_cache(request, JsonResponse({'match': match, 'projects': [], 'experiences': []}))
+    response = JsonResponse({
+        'match': match,
+        'projects': index.query(technologies, kind=PROJECT, match=match),
+        'experiences': index.query(technologies, kind=EXPERIENCE, match=match),
+    })
+    return response if known else exclude_from_edge_cache(request, response)
+
+
+@replica_reads
+@edge_cache('project', 'skill')
+@require_GET
+def project_list(request):
+    """
+    Paginated project listing as JSON or as an HTML fragment of cards.
+    
+    Query parameters: ``tech`` (comma-separated technology slugs),
+    ``match`` (``any`` or ``all``), ``featured=1``, ``cursor`` (from the
+    previous page), ``page_size`` and ``format=html``.
+    """
+    technologies, match, known = get_technology_params(request)
+    featured = request.GET.get('featured') in ('1', 'true')
+    as_html = request.GET.get('format') == 'html'
+    cursor = request.GET.get('cursor') or None
+    try:
+        page_size = min(max(int(request.GET.get('page_size', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+    except ValueError:
+        page_size = DEFAULT_PAGE_SIZE
+    
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except InvalidCursor:
+            return JsonResponse({'error': 'Invalid cursor'}, status=400)
+    
+    # An unknown technology only drops out of an ``any`` filter; under
+    # ``all`` (or on its own) it matches nothing, and that isn't cached.
+    # Neither are pages after the first: every cursor would get its own key
+    matches_nothing = not known and (match == 'all' or not technologies)
+    cacheable = not matches_nothing and not cursor
+    cache_key = page_cache_key('html' if as_html else 'json', technologies, match, featured, page_size)
+    payload = cache.get(cache_key) if cacheable else None
+    if payload is None:
+        if matches_nothing:
+            projects, next_cursor = [], None
+        else:
+            projects, next_cursor = get_project_page(
+                technologies=technologies, match=match, featured=featured, cursor=cursor, page_size=page_size
+            )
+        payload = {'next_cursor': next_cursor}
+        if as_html:
+            payload['html'] = render_to_string('portfolio/partials/project_list.html', {'projects': projects})
+        else:
+            payload['results'] = [serialize_project_card(project) for project in projects]
+        if cacheable:
+            cache.set(cache_key, payload, PAGE_CACHE_TIMEOUT)
+    
+    if as_html:
+        response = HttpResponse(payload['html'])
+        if payload['next_cursor']:
+            response['X-Next-Cursor'] = payload['next_cursor']
+    else:
+        response = JsonResponse(payload)
+    return response if known else exclude_from_edge_cache(request, response)
+
+
+@replica_reads
+@edge_cache('project', 'experience', 'skill')
+@require_GET
+def site_search(request):
+    """
+    Ranked keyword search over projects, experiences and skills.
+    
+    Query parameters: ``q`` and optionally ``type`` (comma-separated
+    ``project``, ``experience``, ``skill``).
+    """
+    term = request.GET.get('q', '').strip()[:200]
+    kinds = [kind for kind in request.GET.get('type', '').split(',') if kind in search.SEARCH_MODELS.values()]
+    if not term:
+        return JsonResponse({'query': '', 'results': []})
+    
+    # Free text isn't cached, here or at the edge: only the hits for a
+    # short query in its normal form, and only when there are any
+    cacheable = search.cacheable_term(term)
+    cache_key = versioned_key(f"search:{hashlib.md5(f'{term}|{sorted(kinds)}'.encode()).hexdigest()}")
+    results = cache.get(cache_key) if cacheable else None
+    if results is None:
+        # The FTS query is raw SQL, which the router never sees
+        using = router.db_for_read(Project)
+        if search.search_available(using):
+            results = search.search(term, kinds=kinds, using=using)
+        else:
+            results = search.fallback_search(term, kinds=kinds)
+        if cacheable and results:
+            cache.set(cache_key, results, search.RESULTS_CACHE_TIMEOUT)
+    
+    home_url = reverse('portfolio:home')
+    for result in results:
+        if result['kind'] == search.PROJECT:
+            result['url'] = reverse('portfolio:project_detail', args=[result['id']])
+        elif result['kind'] == search.EXPERIENCE:
+            result['url'] = f'{home_url}#experience'
+        else:
+            result['url'] = f'{home_url}#about'
+    
+    response = JsonResponse({'query': term, 'results': results})
+    return response if cacheable and results else exclude_from_edge_cache(request, response)
+
+
+# Hashed assets the service worker precaches on install
+PRECACHE_EXTENSIONS = ('.css', '.js', '.woff2', '.ico')
+PRECACHE_EXCLUDE_PREFIXES = ('admin/', 'src/')
+
+# Served instead of the worker when it is disabled, so installed copies go away
+SERVICE_WORKER_UNREGISTER = """self.addEventListener('install', () => self.skipWaiting());
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys.map(key => caches.delete(key))))
+            .then(() => self.registration.unregister())
+    );
+});
+"""
+
+
+def precache_urls():
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', {})
+    return sorted(
+        staticfiles_storage.url(name) for name in hashed_files
+        if name.endswith(PRECACHE_EXTENSIONS) and not name.startswith(PRECACHE_EXCLUDE_PREFIXES)
+    )
+
+
+@require_GET
+@cache_control(no_cache=True)
+def service_worker(request):
+    """Service worker built from the static files manifest, served from the site root"""
+    if not settings.SERVICE_WORKER_ENABLED:
+        return HttpResponse(SERVICE_WORKER_UNREGISTER, content_type='application/javascript')
+    context = {
+        'version': static_version(),
+        'precache_urls': json.dumps(precache_urls()),
+        'home_url': reverse('portfolio:home'),
+        'contact_url': reverse('portfolio:contact'),
+        'csrf_url': reverse('portfolio:csrf_token'),
+    }
+    return render(request, 'portfolio/service_worker.js', context, content_type='application/javascript')
+
+
 def custom_404(request, exception):
     """Custom 404 error handler with logging"""
     logger.warning(f"404 error for URL: {request.path} from IP: {get_client_ip(request)}")
@@ -240,17 +565,23 @@ def custom_500(request):
     return render(request, '500.html', status=500)
 
 
+@replica_reads
 def health_check(request):
     """Health check endpoint for Docker and load balancers"""
     try:
-        # Basic database connectivity check
-        from django.db import connection
-        with connection.cursor() as cursor:
+        # Basic database connectivity check, on the database this request reads
+        from django.db import connections, router
+        with connections[router.db_for_read(Profile)].cursor() as cursor:
             cursor.execute("SELECT 1")
         
         # Check if we can access the Profile model
         Profile.objects.exists()
         
+        # Connection pool metrics of the worker that answered, for staff
+        if request.GET.get('pool') and (settings.DEBUG or request.user.is_staff):
+            from .db_backends.pool import pool_stats
+            return JsonResponse({'status': 'ok', 'pid': os.getpid(), 'pools': pool_stats()})
+        
         return HttpResponse("OK", status=200, content_type="text/plain")
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -0,0 +1,85 @@
+"""
+Pre-fork warm-up for the gunicorn master (see ``gunicorn.conf.py``).
+
+With ``preload_app`` the master imports Django once; ``warm_up()`` then
+compiles every project template, fills the process-local caches the
+homepage relies on (the profile singleton, the technology index, the
+critical CSS, font manifest and module graph) and renders the homepage once,
+so each forked worker starts with all of it in copy-on-write memory.
+Database and cache connections are closed afterwards: a socket opened in
+the master must never be shared by the workers.
+"""
+
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connections
+from django.template import TemplateDoesNotExist, TemplateSyntaxError
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+
+def project_templates():
+    """Names of the templates under the project's template directories"""
+    for directory in settings.TEMPLATES[0]['DIRS']:
+        for root, _, files in os.walk(directory):
+            for filename in files:
+                yield os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, '/')
+
+
+def warm_templates():
+    count = 0
+    for name in project_templates():
+        try:
+            get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+            logger.warning(f"Template {name} could not be compiled: {exc}")
+            continue
+        count += 1
+    return count
+
+
+def warm_homepage():
+    """Render the homepage so every cache behind it is filled"""
+    from django.test import RequestFactory
+
+    from .models import Profile
+    from .tech_index import get_technology_index
+    from .views import home
+
+    Profile.get_solo()
+    get_technology_index()
+    request = RequestFactory().get('/', HTTP_HOST=next(
+        (host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost'
+    ))
+    response = home(request)
+    if response.streaming:
+        b''.join(response.streaming_content)
+    return response.status_code
+
+
+def warm_up():
+    """Warm the current process; returns ``{step: milliseconds}``"""
+    # The views module compiles the spam patterns when it is imported
+    from . import views  # noqa: F401
+
+    timings = {}
+    steps = (('templates', warm_templates), ('homepage', warm_homepage))
+    try:
+        for name, step in steps:
+            started = time.perf_counter()
+            try:
+                step()
+            except DatabaseError as exc:
+                # e.g. the first start, before bootstrap has migrated
+                logger.warning(f"Skipped warming {name}: {exc}")
+            timings[name] = (time.perf_counter() - started) * 1000
+    finally:
+        connections.close_all()
+        for cache in caches.all(initialized_only=True):
+            cache.close()
+    return timings
@@ -0,0 +1,12 @@
+// Homepage: section animations and projects on top of the shared site code
+import './site.js';
+import {
+    ScrollAnimations, HeroInteractions, SkillsInteractions, ExperienceInteractions,
+} from './modules/animations.js';
+import { ProjectsManager } from './modules/projects.js';
+
+new ScrollAnimations();
+new HeroInteractions();
+new SkillsInteractions();
+new ProjectsManager();
+new ExperienceInteractions();
@@ -0,0 +1,182 @@
+// Accessibility Manager
+export class AccessibilityManager {
+    constructor() {
+        this.init();
+    }
+    
+    init() {
+        this.setupKeyboardNavigation();
+        this.setupFocusManagement();
+        this.setupScreenReaderSupport();
+        this.setupReducedMotionSupport();
+        this.setupHighContrastSupport();
+    }
+    
+    setupKeyboardNavigation() {
+        // Add keyboard navigation for interactive elements
+        document.addEventListener('keydown', (e) => {
+            // Skip to main content with Ctrl+/
+            if (e.ctrlKey && e.key === '/') {
+                e.preventDefault();
+                const mainContent = document.getElementById('main-content');
+                if (mainContent) {
+                    mainContent.focus();
+                    mainContent.scrollIntoView({ behavior: 'smooth' });
+                }
+            }
+            
+            // Theme toggle with Ctrl+Shift+T
+            if (e.ctrlKey && e.shiftKey && e.key === 'T') {
+                e.preventDefault();
+                const themeToggle = document.getElementById('theme-toggle');
+                if (themeToggle) {
+                    themeToggle.click();
+                }
+            }
+            
+            // Navigate sections with arrow keys when focused on navigation
+            if (document.activeElement && document.activeElement.classList.contains('nav-link')) {
+                const navLinks = Array.from(document.querySelectorAll('.nav-link'));
+                const currentIndex = navLinks.indexOf(document.activeElement);
+                
+                if (e.key === 'ArrowDown' || e.key === 'ArrowRight') {
+                    e.preventDefault();
+                    const nextIndex = (currentIndex + 1) % navLinks.length;
+                    navLinks[nextIndex].focus();
+                } else if (e.key === 'ArrowUp' || e.key === 'ArrowLeft') {
+                    e.preventDefault();
+                    const prevIndex = (currentIndex - 1 + navLinks.length) % navLinks.length;
+                    navLinks[prevIndex].focus();
+                }
+            }
+        });
+        
+        // Add Enter key support for clickable elements
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Enter' && e.target.classList.contains('clickable')) {
+                e.target.click();
+            }
+        });
+    }
+    
+    setupFocusManagement() {
+        // Ensure focus is visible
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Tab') {
+                document.body.classList.add('keyboard-navigation');
+            }
+        });
+        
+        document.addEventListener('mousedown', () => {
+            document.body.classList.remove('keyboard-navigation');
+        });
+        
+        // Focus trap for modals
+        this.setupFocusTrap();
+    }
+    
+    setupFocusTrap() {
+        const modal = document.getElementById('project-modal');
+        if (!modal) return;
+        
+        const focusableElements = 'button, [href], input, select, textarea, [tabindex]:not([tabindex="-1"])';
+        
+        modal.addEventListener('keydown', (e) => {
+            if (e.key === 'Tab') {
+                const focusableContent = modal.querySelectorAll(focusableElements);
+                const firstFocusableElement = focusableContent[0];
+                const lastFocusableElement = focusableContent[focusableContent.length - 1];
+                
+                if (e.shiftKey) {
+                    if (document.activeElement === firstFocusableElement) {
+                        lastFocusableElement.focus();
+                        e.preventDefault();
+                    }
+                } else {
+                    if (document.activeElement === lastFocusableElement) {
+                        firstFocusableElement.focus();
+                        e.preventDefault();
+                    }
+                }
+            }
+        });
+    }
+    
+    setupScreenReaderSupport() {
+        // Announce dynamic content changes
+        this.createLiveRegion();
+        
+        // Add screen reader only text for context
+        this.addScreenReaderContext();
+    }
+    
+    createLiveRegion() {
+        const liveRegion = document.createElement('div');
+        liveRegion.id = 'live-region';
+        liveRegion.setAttribute('aria-live', 'polite');
+        liveRegion.setAttribute('aria-atomic', 'true');
+        liveRegion.className = 'sr-only';
+        document.body.appendChild(liveRegion);
+        
+        // Function to announce messages
+        window.announceToScreenReader = (message) => {
+            liveRegion.textContent = message;
+            setTimeout(() => {
+                liveRegion.textContent = '';
+            }, 1000);
+        };
+    }
+    
+    addScreenReaderContext() {
+        // Add context for skill progress bars
+        const skillBars = document.querySelectorAll('.skill-progress');
+        skillBars.forEach(bar => {
+            const skillItem = bar.closest('.skill-item');
+            const skillName = skillItem.querySelector('span').textContent;
+            const proficiency = skillItem.querySelector('.text-sm').textContent;
+            
+            bar.setAttribute('role', 'progressbar');
+            bar.setAttribute('aria-label', `${skillName} proficiency: ${proficiency}`);
+            
+            bar.setAttribute('aria-valuenow', bar.dataset.width || 0);
+            bar.setAttribute('aria-valuemin', '0');
+            bar.setAttribute('aria-valuemax', '100');
+        });
+    }
+    
+    setupReducedMotionSupport() {
+        // Check for reduced motion preference
+        const prefersReducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)').matches;
+        
+        if (prefersReducedMotion) {
+            // Disable animations
+            document.documentElement.style.setProperty('--animation-duration', '0.01ms');
+            document.documentElement.style.setProperty('--transition-duration', '0.01ms');
+            
+            // Remove animation classes
+            const animatedElements = document.querySelectorAll('.animate-on-scroll, .animate-blob, .animate-bounce');
+            animatedElements.forEach(el => {
+                el.style.animation = 'none';
+                el.style.transition = 'none';
+            });
+        }
+    }
+    
+    setupHighContrastSupport() {
+        // Detect high contrast mode
+        const supportsHighContrast = window.matchMedia('(prefers-contrast: high)').matches;
+        
+        if (supportsHighContrast) {
+            document.documentElement.classList.add('high-contrast');
+        }
+        
+        // Listen for changes
+        window.matchMedia('(prefers-contrast: high)').addEventListener('change', (e) => {
+            if (e.matches) {
+                document.documentElement.classList.add('high-contrast');
+            } else {
+                document.documentElement.classList.remove('high-contrast');
+            }
+        });
+    }
+}
@@ -0,0 +1,235 @@
+import { onScrollFrame, prefersReducedMotion } from './scheduler.js';
+
+// Enhanced Scroll Animations
+export class ScrollAnimations {
+    constructor() {
+        this.animatedElements = document.querySelectorAll('.animate-on-scroll');
+        this.skillItems = document.querySelectorAll('.skill-item');
+        this.init();
+    }
+    
+    init() {
+        // Main scroll animations observer
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.classList.add('visible');
+                    
+                    // Handle staggered animations
+                    const delay = entry.target.style.animationDelay || '0s';
+                    setTimeout(() => {
+                        entry.target.style.transform = 'translateY(0)';
+                        entry.target.style.opacity = '1';
+                    }, parseFloat(delay) * 1000);
+                }
+            });
+        }, {
+            threshold: 0.1,
+            rootMargin: '0px 0px -50px 0px'
+        });
+        
+        // Skills progress animation observer
+        const skillObserver = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    this.animateSkillProgress(entry.target);
+                }
+            });
+        }, {
+            threshold: 0.5,
+            rootMargin: '0px 0px -100px 0px'
+        });
+        
+        this.animatedElements.forEach(el => observer.observe(el));
+        this.skillItems.forEach(el => skillObserver.observe(el));
+    }
+    
+    animateSkillProgress(skillItem) {
+        const progressBar = skillItem.querySelector('.skill-progress');
+        if (progressBar && !skillItem.classList.contains('animated')) {
+            skillItem.classList.add('animated');
+            
+            // The server renders the proficiency as a percentage
+            const targetWidth = `${progressBar.dataset.width || 0}%`;
+            if (prefersReducedMotion()) {
+                progressBar.style.width = targetWidth;
+                return;
+            }
+            
+            // Animate the progress bar
+            setTimeout(() => {
+                progressBar.style.width = targetWidth;
+            }, 200);
+        }
+    }
+}
+
+// Enhanced Hero Interactions
+export class HeroInteractions {
+    constructor() {
+        this.init();
+    }
+    
+    init() {
+        // Add parallax effect to hero background elements
+        this.setupParallax();
+        
+        // Add typing effect to name (if desired)
+        this.setupTypingEffect();
+        
+        // Add smooth scroll indicator interaction
+        this.setupScrollIndicator();
+    }
+    
+    setupParallax() {
+        const blobs = [...document.querySelectorAll('.animate-blob')];
+        if (!blobs.length) return;
+        
+        // Read the scroll position once per frame, then move every blob
+        onScrollFrame((scrolled) => {
+            const rate = scrolled * -0.5;
+            blobs.forEach((blob, index) => {
+                const speed = 0.2 + (index * 0.1);
+                blob.style.transform = `translate3d(0, ${rate * speed}px, 0)`;
+            });
+        }, () => window.scrollY, {
+            reset: () => blobs.forEach(blob => { blob.style.transform = ''; }),
+        });
+    }
+    
+    setupTypingEffect() {
+        // Optional: Add typing effect to the hero title
+        const heroTitle = document.querySelector('#home h1 span');
+        if (heroTitle && heroTitle.textContent) {
+            const text = heroTitle.textContent;
+            heroTitle.textContent = '';
+            heroTitle.style.borderRight = '2px solid';
+            
+            let i = 0;
+            const typeWriter = () => {
+                if (i < text.length) {
+                    heroTitle.textContent += text.charAt(i);
+                    i++;
+                    setTimeout(typeWriter, 60);
+                } else {
+                    heroTitle.style.borderRight = 'none';
+                }
+            };
+            
+            // Start typing effect immediately
+            setTimeout(typeWriter, 100);
+        }
+    }
+    
+    setupScrollIndicator() {
+        const scrollIndicator = document.querySelector('.scroll-indicator');
+        if (scrollIndicator) {
+            scrollIndicator.addEventListener('click', () => {
+                const aboutSection = document.getElementById('about');
+                if (aboutSection) {
+                    aboutSection.scrollIntoView({ behavior: 'smooth' });
+                }
+            });
+        }
+    }
+}
+
+// Skills Interaction Enhancement
+export class SkillsInteractions {
+    constructor() {
+        this.init();
+    }
+    
+    init() {
+        // Add hover effects for skill cards
+        this.setupSkillCardHovers();
+        
+        // Add click interactions for skill details
+        this.setupSkillDetails();
+    }
+    
+    setupSkillCardHovers() {
+        const skillCards = document.querySelectorAll('#about .group');
+        
+        skillCards.forEach(card => {
+            card.addEventListener('mouseenter', () => {
+                // Add subtle animation to skill progress bars
+                const progressBars = card.querySelectorAll('.skill-progress');
+                progressBars.forEach(bar => {
+                    bar.style.transform = 'scaleX(1.02)';
+                    bar.style.transition = 'transform 0.3s ease';
+                });
+            });
+            
+            card.addEventListener('mouseleave', () => {
+                const progressBars = card.querySelectorAll('.skill-progress');
+                progressBars.forEach(bar => {
+                    bar.style.transform = 'scaleX(1)';
+                });
+            });
+        });
+    }
+    
+    setupSkillDetails() {
+        // Add click handlers for skill items to show more details
+        const skillItems = document.querySelectorAll('.skill-item');
+        
+        skillItems.forEach(item => {
+            item.addEventListener('click', () => {
+                // Add a subtle pulse effect when clicked
+                item.style.transform = 'scale(1.02)';
+                setTimeout(() => {
+                    item.style.transform = 'scale(1)';
+                }, 150);
+            });
+        });
+    }
+}
+
+// Enhanced Experience Interactions
+export class ExperienceInteractions {
+    constructor() {
+        this.experienceCards = document.querySelectorAll('#experience .group');
+        this.init();
+    }
+    
+    init() {
+        this.setupHoverEffects();
+        this.setupTimelineAnimations();
+    }
+    
+    setupHoverEffects() {
+        this.experienceCards.forEach(card => {
+            card.addEventListener('mouseenter', () => {
+                // Add subtle glow effect to timeline dot
+                const timelineDot = card.querySelector('.absolute.w-4.h-4');
+                if (timelineDot) {
+                    timelineDot.style.boxShadow = '0 0 20px rgba(59, 130, 246, 0.5)';
+                }
+            });
+            
+            card.addEventListener('mouseleave', () => {
+                const timelineDot = card.querySelector('.absolute.w-4.h-4');
+                if (timelineDot) {
+                    timelineDot.style.boxShadow = '';
+                }
+            });
+        });
+    }
+    
+    setupTimelineAnimations() {
+        // Add intersection observer for timeline items
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.classList.add('timeline-visible');
+                }
+            });
+        }, {
+            threshold: 0.3,
+            rootMargin: '0px 0px -100px 0px'
+        });
+        
+        this.experienceCards.forEach(card => observer.observe(card));
+    }
+}
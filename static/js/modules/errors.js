@@ -0,0 +1,126 @@
+// Error Handling Manager
+export class ErrorManager {
+    constructor() {
+        this.init();
+    }
+    
+    init() {
+        this.setupGlobalErrorHandling();
+        this.setupFormErrorHandling();
+        this.setupImageErrorHandling();
+    }
+    
+    setupGlobalErrorHandling() {
+        // Handle JavaScript errors gracefully
+        window.addEventListener('error', (e) => {
+            console.error('JavaScript error:', e.error);
+            this.showUserFriendlyError('Something went wrong. Please refresh the page.');
+        });
+        
+        // Handle unhandled promise rejections
+        window.addEventListener('unhandledrejection', (e) => {
+            console.error('Unhandled promise rejection:', e.reason);
+            this.showUserFriendlyError('A network error occurred. Please check your connection.');
+        });
+    }
+    
+    setupFormErrorHandling() {
+        // Enhanced form validation and error display
+        const forms = document.querySelectorAll('form');
+        forms.forEach(form => {
+            form.addEventListener('submit', (e) => {
+                if (!this.validateForm(form)) {
+                    e.preventDefault();
+                }
+            });
+        });
+    }
+    
+    setupImageErrorHandling() {
+        // Handle broken images gracefully
+        const images = document.querySelectorAll('img');
+        images.forEach(img => {
+            img.addEventListener('error', () => {
+                img.style.display = 'none';
+                
+                // Create placeholder
+                const placeholder = document.createElement('div');
+                placeholder.className = 'bg-gray-200 dark:bg-gray-700 rounded-lg flex items-center justify-center';
+                placeholder.style.width = img.style.width || '100px';
+                placeholder.style.height = img.style.height || '100px';
+                placeholder.innerHTML = `
+                    <svg class="w-8 h-8 text-gray-400" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 16l4.586-4.586a2 2 0 012.828 0L16 16m-2-2l1.586-1.586a2 2 0 012.828 0L20 14m-6-6h.01M6 20h12a2 2 0 002-2V6a2 2 0 00-2-2H6a2 2 0 00-2 2v12a2 2 0 002 2z"></path>
+                    </svg>
+                `;
+                
+                img.parentNode.insertBefore(placeholder, img);
+            });
+        });
+    }
+    
+    validateForm(form) {
+        let isValid = true;
+        const requiredFields = form.querySelectorAll('[required]');
+        
+        requiredFields.forEach(field => {
+            if (!field.value.trim()) {
+                this.showFieldError(field, 'This field is required');
+                isValid = false;
+            } else {
+                this.clearFieldError(field);
+            }
+        });
+        
+        return isValid;
+    }
+    
+    showFieldError(field, message) {
+        field.classList.add('border-red-500');
+        field.setAttribute('aria-invalid', 'true');
+        
+        let errorElement = field.parentNode.querySelector('.field-error');
+        if (!errorElement) {
+            errorElement = document.createElement('div');
+            errorElement.className = 'field-error text-red-500 text-sm mt-1';
+            errorElement.setAttribute('role', 'alert');
+            field.parentNode.appendChild(errorElement);
+        }
+        errorElement.textContent = message;
+    }
+    
+    clearFieldError(field) {
+        field.classList.remove('border-red-500');
+        field.removeAttribute('aria-invalid');
+        
+        const errorElement = field.parentNode.querySelector('.field-error');
+        if (errorElement) {
+            errorElement.remove();
+        }
+    }
+    
+    showUserFriendlyError(message) {
+        // Create or update error notification
+        let errorNotification = document.getElementById('error-notification');
+        if (!errorNotification) {
+            errorNotification = document.createElement('div');
+            errorNotification.id = 'error-notification';
+            errorNotification.className = 'fixed top-20 right-4 bg-red-500 text-white px-6 py-4 rounded-lg shadow-lg z-50 transform translate-x-full transition-transform duration-300';
+            errorNotification.setAttribute('role', 'alert');
+            document.body.appendChild(errorNotification);
+        }
+        
+        errorNotification.textContent = message;
+        errorNotification.style.transform = 'translateX(0)';
+        
+        // Auto-hide after 5 seconds
+        setTimeout(() => {
+            errorNotification.style.transform = 'translateX(full)';
+        }, 5000);
+        
+        // Announce to screen readers
+        if (window.announceToScreenReader) {
+            window.announceToScreenReader(message);
+        }
+    }
+}
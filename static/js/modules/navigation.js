@@ -0,0 +1,133 @@
+// Mobile Navigation
+export class MobileNavigation {
+    constructor() {
+        this.mobileMenuButton = document.getElementById('mobile-menu-button');
+        this.mobileMenu = document.getElementById('mobile-menu');
+        this.mobileMenuIcon = this.mobileMenuButton?.querySelector('svg');
+        this.isOpen = false;
+        
+        this.init();
+    }
+    
+    init() {
+        if (this.mobileMenuButton) {
+            this.mobileMenuButton.addEventListener('click', () => this.toggleMenu());
+        }
+        
+        // Close menu when clicking on links
+        const mobileLinks = this.mobileMenu?.querySelectorAll('a');
+        mobileLinks?.forEach(link => {
+            link.addEventListener('click', () => this.closeMenu());
+        });
+        
+        // Close menu when clicking outside
+        document.addEventListener('click', (e) => {
+            if (this.isOpen && !this.mobileMenu?.contains(e.target) && !this.mobileMenuButton?.contains(e.target)) {
+                this.closeMenu();
+            }
+        });
+        
+        // Close menu on escape key
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape' && this.isOpen) {
+                this.closeMenu();
+            }
+        });
+    }
+    
+    toggleMenu() {
+        if (this.isOpen) {
+            this.closeMenu();
+        } else {
+            this.openMenu();
+        }
+    }
+    
+    openMenu() {
+        this.mobileMenu?.classList.remove('hidden');
+        this.mobileMenu?.classList.add('animate-slide-down');
+        this.updateMenuIcon(true);
+        this.isOpen = true;
+        
+        // Prevent body scroll
+        document.body.style.overflow = 'hidden';
+    }
+    
+    closeMenu() {
+        this.mobileMenu?.classList.add('hidden');
+        this.mobileMenu?.classList.remove('animate-slide-down');
+        this.updateMenuIcon(false);
+        this.isOpen = false;
+        
+        // Restore body scroll
+        document.body.style.overflow = '';
+    }
+    
+    updateMenuIcon(isOpen) {
+        if (this.mobileMenuIcon) {
+            if (isOpen) {
+                this.mobileMenuIcon.innerHTML = `
+                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12"></path>
+                `;
+            } else {
+                this.mobileMenuIcon.innerHTML = `
+                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6h16M4 12h16M4 18h16"></path>
+                `;
+            }
+        }
+    }
+}
+
+// Smooth Scrolling and Active Navigation
+export class NavigationManager {
+    constructor() {
+        this.navLinks = document.querySelectorAll('.nav-link, .mobile-nav-link');
+        this.sections = [];
+        
+        this.init();
+    }
+    
+    init() {
+        // Setup smooth scrolling for anchor links
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', (e) => {
+                e.preventDefault();
+                const targetId = anchor.getAttribute('href').substring(1);
+                const target = document.getElementById(targetId);
+                
+                if (target) {
+                    const offsetTop = target.offsetTop - 80; // Account for fixed header
+                    window.scrollTo({
+                        top: offsetTop,
+                        behavior: 'smooth'
+                    });
+                }
+            });
+        });
+        
+        // Setup intersection observer for active navigation
+        this.setupIntersectionObserver();
+    }
+    
+    setupIntersectionObserver() {
+        const sections = document.querySelectorAll('section[id]');
+        
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                const id = entry.target.getAttribute('id');
+                const navLink = document.querySelector(`a[href="#${id}"]`);
+                
+                if (entry.isIntersecting) {
+                    // Remove active class from all links
+                    this.navLinks.forEach(link => link.classList.remove('active'));
+                    // Add active class to current link
+                    navLink?.classList.add('active');
+                }
+            });
+        }, {
+            rootMargin: '-80px 0px -50% 0px' // Account for fixed header
+        });
+        
+        sections.forEach(section => observer.observe(section));
+    }
+}
@@ -0,0 +1,16 @@
+// Service worker registration (see templates/portfolio/service_worker.js)
+export function registerServiceWorker() {
+    const url = document.documentElement.dataset.serviceWorker;
+    if (!url || !('serviceWorker' in navigator)) return;
+    
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(url).catch(error => {
+            console.error('Service worker registration failed:', error);
+        });
+    });
+    
+    // Browsers without Background Sync retry queued contact messages here
+    window.addEventListener('online', () => {
+        navigator.serviceWorker.controller?.postMessage('flush-contact-queue');
+    });
+}
@@ -0,0 +1,85 @@
+// Server-side project filtering and "load more" pagination
+export class ProjectFilter {
+    constructor(projectsGrid, filterButtons, loadMoreBtn) {
+        this.projectsGrid = projectsGrid;
+        this.filterButtons = filterButtons;
+        this.loadMoreBtn = loadMoreBtn;
+        this.listUrl = projectsGrid?.getAttribute('data-list-url');
+        this.activeFilter = 'all';
+    }
+    
+    filterProjects(filter) {
+        this.activeFilter = filter;
+        
+        // Filter on the server so projects beyond the first page are included
+        if (this.listUrl) {
+            this.loadProjectPage(filter);
+            return;
+        }
+        
+        document.querySelectorAll('.project-card').forEach(card => {
+            const technologies = card.getAttribute('data-technologies');
+            
+            if (filter === 'all' || technologies.includes(filter)) {
+                card.style.display = 'block';
+                card.classList.add('animate-on-scroll');
+                // Trigger animation
+                setTimeout(() => {
+                    card.style.opacity = '1';
+                    card.style.transform = 'translateY(0)';
+                }, 100);
+            } else {
+                card.style.opacity = '0';
+                card.style.transform = 'translateY(20px)';
+                setTimeout(() => {
+                    card.style.display = 'none';
+                }, 300);
+            }
+        });
+    }
+    
+    async loadProjectPage(filter, cursor = null) {
+        const params = new URLSearchParams({ format: 'html', featured: '1' });
+        if (filter && filter !== 'all') params.set('tech', filter);
+        if (cursor) params.set('cursor', cursor);
+        
+        try {
+            const response = await fetch(`${this.listUrl}?${params}`);
+            if (!response.ok) return;
+            const html = await response.text();
+            
+            // Ignore responses for a filter the user has already moved away from
+            if (filter !== this.activeFilter) return;
+            
+            if (cursor) {
+                this.projectsGrid.insertAdjacentHTML('beforeend', html);
+            } else {
+                this.projectsGrid.innerHTML = html;
+            }
+            requestAnimationFrame(() => {
+                this.projectsGrid.querySelectorAll('.animate-on-scroll:not(.visible)')
+                    .forEach(card => card.classList.add('visible'));
+            });
+            
+            const nextCursor = response.headers.get('X-Next-Cursor');
+            if (this.loadMoreBtn) {
+                this.loadMoreBtn.setAttribute('data-cursor', nextCursor || '');
+                this.loadMoreBtn.classList.toggle('hidden', !nextCursor);
+            }
+        } catch (error) {
+            console.error('Failed to load projects:', error);
+        }
+    }
+    
+    updateActiveFilter(activeButton) {
+        this.filterButtons.forEach(btn => {
+            btn.classList.remove('active');
+            btn.classList.remove('bg-primary-600', 'text-white');
+            btn.classList.add('bg-gray-200', 'dark:bg-gray-700', 'text-gray-700', 'dark:text-gray-300');
+        });
+        
+        activeButton.classList.add('active');
+        activeButton.classList.remove('bg-gray-200', 'dark:bg-gray-700', 'text-gray-700', 'dark:text-gray-300');
+        activeButton.classList.add('bg-primary-600', 'text-white');
+    }
+}
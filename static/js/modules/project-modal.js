@@ -0,0 +1,110 @@
+// Project details modal; details are fetched from project_detail on demand
+export class ProjectModal {
+    constructor() {
+        this.modal = document.getElementById('project-modal');
+        this.modalBackdrop = document.getElementById('modal-backdrop');
+        this.closeModalBtn = document.getElementById('close-modal');
+        this.projectDetailsCache = new Map();
+        
+        // Close modal
+        this.closeModalBtn?.addEventListener('click', () => this.closeModal());
+        this.modalBackdrop?.addEventListener('click', () => this.closeModal());
+        
+        // Close modal on escape key
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape' && !this.modal?.classList.contains('hidden')) {
+                this.closeModal();
+            }
+        });
+    }
+    
+    async openModal(button) {
+        // Details are fetched on demand instead of being embedded in the page
+        const project = await this.fetchProjectDetails(button.getAttribute('data-detail-url'));
+        if (!project) return;
+        
+        const title = project.title;
+        const description = project.detailed_description || project.description;
+        const image = project.image;
+        const github = project.github_url;
+        const demo = project.demo_url;
+        const technologies = project.technologies;
+        const date = project.created_date;
+        
+        // Populate modal
+        document.getElementById('modal-title').textContent = title;
+        document.getElementById('modal-date').textContent = date;
+        document.getElementById('modal-description').textContent = description;
+        
+        // Handle image
+        const modalImageContainer = document.getElementById('modal-image-container');
+        const modalImage = document.getElementById('modal-image');
+        if (image) {
+            modalImage.src = image;
+            modalImage.alt = title;
+            modalImageContainer.style.display = 'block';
+        } else {
+            modalImageContainer.style.display = 'none';
+        }
+        
+        // Handle technologies
+        const modalTechnologies = document.getElementById('modal-technologies');
+        modalTechnologies.innerHTML = '';
+        if (technologies.length) {
+            technologies.forEach(tech => {
+                const techTag = document.createElement('span');
+                techTag.className = 'inline-flex items-center px-3 py-1 rounded-full text-sm font-medium bg-primary-100 dark:bg-primary-900 text-primary-800 dark:text-primary-200';
+                techTag.textContent = tech.trim();
+                modalTechnologies.appendChild(techTag);
+            });
+        }
+        
+        // Handle links
+        const githubLink = document.getElementById('modal-github-link');
+        const demoLink = document.getElementById('modal-demo-link');
+        
+        if (github) {
+            githubLink.href = github;
+            githubLink.classList.remove('hidden');
+        } else {
+            githubLink.classList.add('hidden');
+        }
+        
+        if (demo) {
+            demoLink.href = demo;
+            demoLink.classList.remove('hidden');
+        } else {
+            demoLink.classList.add('hidden');
+        }
+        
+        // Show modal
+        this.modal.classList.remove('hidden');
+        document.body.style.overflow = 'hidden';
+        
+        // Focus management
+        this.closeModalBtn?.focus();
+    }
+    
+    async fetchProjectDetails(url) {
+        if (!url) return null;
+        if (this.projectDetailsCache.has(url)) {
+            return this.projectDetailsCache.get(url);
+        }
+        
+        try {
+            const response = await fetch(url, { headers: { 'Accept': 'application/json' } });
+            if (!response.ok) return null;
+            const project = await response.json();
+            this.projectDetailsCache.set(url, project);
+            return project;
+        } catch (error) {
+            console.error('Failed to load project details:', error);
+            return null;
+        }
+    }
+    
+    closeModal() {
+        this.modal?.classList.add('hidden');
+        document.body.style.overflow = '';
+    }
+}
@@ -0,0 +1,104 @@
+// Project Filtering and Modal System
+// The filter and modal code is only fetched the first time it is used
+export class ProjectsManager {
+    constructor() {
+        this.filterButtons = document.querySelectorAll('.filter-btn');
+        this.projectsGrid = document.getElementById('projects-grid');
+        this.loadMoreBtn = document.getElementById('load-more-projects');
+        this.filter = null;
+        this.modal = null;
+        
+        this.init();
+    }
+    
+    init() {
+        // Setup filter functionality
+        this.setupFiltering();
+        
+        // Setup modal functionality
+        this.setupModal();
+        
+        // Setup expandable achievements
+        this.setupExpandableAchievements();
+    }
+    
+    loadFilter() {
+        this.filter ??= import('./project-filter.js')
+            .then(({ ProjectFilter }) => new ProjectFilter(this.projectsGrid, this.filterButtons, this.loadMoreBtn));
+        return this.filter;
+    }
+    
+    loadModal() {
+        this.modal ??= import('./project-modal.js').then(({ ProjectModal }) => new ProjectModal());
+        return this.modal;
+    }
+    
+    setupFiltering() {
+        this.filterButtons.forEach(button => {
+            button.addEventListener('click', async (e) => {
+                const target = e.currentTarget;
+                const filter = await this.loadFilter();
+                filter.filterProjects(target.getAttribute('data-filter'));
+                filter.updateActiveFilter(target);
+            });
+        });
+        
+        this.loadMoreBtn?.addEventListener('click', async () => {
+            const filter = await this.loadFilter();
+            filter.loadProjectPage(filter.activeFilter, this.loadMoreBtn.getAttribute('data-cursor'));
+        });
+    }
+    
+    setupModal() {
+        // Open modal (delegated, so cards loaded later work too)
+        this.projectsGrid?.addEventListener('click', async (e) => {
+            const button = e.target.closest('.view-more-btn');
+            if (!button) return;
+            e.preventDefault();
+            const modal = await this.loadModal();
+            modal.openModal(button);
+        });
+        
+        // Fetch the modal code early when a card is hovered or focused
+        this.projectsGrid?.addEventListener('pointerover', (e) => {
+            if (e.target.closest('.view-more-btn')) this.loadModal();
+        });
+        this.projectsGrid?.addEventListener('focusin', (e) => {
+            if (e.target.closest('.view-more-btn')) this.loadModal();
+        });
+    }
+    
+    setupExpandableAchievements() {
+        const achievementToggles = document.querySelectorAll('.achievements-toggle');
+        
+        achievementToggles.forEach(toggle => {
+            toggle.addEventListener('click', () => {
+                const experienceId = toggle.getAttribute('data-experience-id');
+                const content = document.getElementById(`achievements-${experienceId}`);
+                const chevron = toggle.querySelector('.chevron-icon');
+                const isExpanded = toggle.getAttribute('aria-expanded') === 'true';
+                
+                if (isExpanded) {
+                    // Collapse
+                    content.classList.add('hidden');
+                    toggle.setAttribute('aria-expanded', 'false');
+                    chevron.style.transform = 'rotate(0deg)';
+                } else {
+                    // Expand
+                    content.classList.remove('hidden');
+                    toggle.setAttribute('aria-expanded', 'true');
+                    chevron.style.transform = 'rotate(180deg)';
+                    
+                    // Trigger animations for achievement items
+                    const achievementItems = content.querySelectorAll('.animate-on-scroll');
+                    achievementItems.forEach((item, index) => {
+                        setTimeout(() => {
+                            item.style.opacity = '1';
+                            item.style.transform = 'translateY(0)';
+                        }, index * 100);
+                    });
+                }
+            });
+        });
+    }
+}
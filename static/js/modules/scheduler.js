@@ -0,0 +1,55 @@
+// Frame scheduler: one passive scroll/resize listener and one
+// requestAnimationFrame callback per frame for every scroll-driven effect.
+// Each frame runs all reads before any writes, so layout is computed at most
+// once however many effects are registered.
+
+const reducedMotionQuery = window.matchMedia('(prefers-reduced-motion: reduce)');
+const tasks = new Set();
+let frame = null;
+let listening = false;
+
+export const prefersReducedMotion = () => reducedMotionQuery.matches;
+
+const flush = () => {
+    frame = null;
+    const measured = [];
+    tasks.forEach(task => measured.push([task, task.read ? task.read() : undefined]));
+    measured.forEach(([task, value]) => task.write(value));
+};
+
+export const requestFrame = () => {
+    if (frame === null && tasks.size && !prefersReducedMotion()) {
+        frame = window.requestAnimationFrame(flush);
+    }
+};
+
+const listen = () => {
+    if (listening) return;
+    listening = true;
+    window.addEventListener('scroll', requestFrame, { passive: true });
+    window.addEventListener('resize', requestFrame, { passive: true });
+};
+
+// Register a scroll-driven effect. `read` measures (scroll position, sizes)
+// and its result is handed to `write`, which only touches styles. Returns a
+// function that unregisters the effect.
+export const onScrollFrame = (write, read = null, { reset = null } = {}) => {
+    const task = { read, write, reset };
+    tasks.add(task);
+    listen();
+    requestFrame();
+    return () => tasks.delete(task);
+};
+
+// Users who turn on reduced motion mid-visit get effects reset and stopped
+reducedMotionQuery.addEventListener('change', () => {
+    if (prefersReducedMotion()) {
+        if (frame !== null) {
+            window.cancelAnimationFrame(frame);
+            frame = null;
+        }
+        tasks.forEach(task => task.reset && task.reset());
+    } else {
+        requestFrame();
+    }
+});
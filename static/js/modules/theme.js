@@ -0,0 +1,66 @@
+// Theme Management
+export class ThemeManager {
+    constructor() {
+        this.themeToggle = document.getElementById('theme-toggle');
+        this.darkIcon = document.getElementById('theme-toggle-dark-icon');
+        this.lightIcon = document.getElementById('theme-toggle-light-icon');
+        
+        this.init();
+    }
+    
+    init() {
+        // Check for saved theme preference or default to system preference
+        const savedTheme = localStorage.getItem('theme');
+        const systemPrefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
+        
+        if (savedTheme === 'dark' || (!savedTheme && systemPrefersDark)) {
+            this.setDarkMode(true);
+        } else {
+            this.setDarkMode(false);
+        }
+        
+        // Add event listener for theme toggle
+        if (this.themeToggle) {
+            this.themeToggle.addEventListener('click', () => this.toggleTheme());
+        }
+        
+        // Listen for system theme changes
+        window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', (e) => {
+            if (!localStorage.getItem('theme')) {
+                this.setDarkMode(e.matches);
+            }
+        });
+    }
+    
+    setDarkMode(isDark) {
+        if (isDark) {
+            document.documentElement.classList.add('dark');
+            this.showIcon('dark');
+        } else {
+            document.documentElement.classList.remove('dark');
+            this.showIcon('light');
+        }
+    }
+    
+    showIcon(mode) {
+        if (mode === 'dark') {
+            this.darkIcon?.classList.remove('hidden');
+            this.lightIcon?.classList.add('hidden');
+        } else {
+            this.lightIcon?.classList.remove('hidden');
+            this.darkIcon?.classList.add('hidden');
+        }
+    }
+    
+    toggleTheme() {
+        const isDark = document.documentElement.classList.contains('dark');
+        
+        if (isDark) {
+            this.setDarkMode(false);
+            localStorage.setItem('theme', 'light');
+        } else {
+            this.setDarkMode(true);
+            localStorage.setItem('theme', 'dark');
+        }
+    }
+}
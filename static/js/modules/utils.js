@@ -0,0 +1,31 @@
+// Utility functions
+
+// Debounce function for performance
+export const debounce = (func, wait) => {
+    let timeout;
+    return function executedFunction(...args) {
+        const later = () => {
+            clearTimeout(timeout);
+            func(...args);
+        };
+        clearTimeout(timeout);
+        timeout = setTimeout(later, wait);
+    };
+};
+
+// Format date helper
+export const formatDate = (dateString) => {
+    const options = { year: 'numeric', month: 'long' };
+    return new Date(dateString).toLocaleDateString('en-US', options);
+};
+
+// Copy to clipboard
+export const copyToClipboard = async (text) => {
+    try {
+        await navigator.clipboard.writeText(text);
+        return true;
+    } catch (err) {
+        console.error('Failed to copy text: ', err);
+        return false;
+    }
+};
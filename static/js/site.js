@@ -0,0 +1,18 @@
+// Shared by every page: theme, navigation, accessibility and error handling.
+// Loaded as a module, so it runs once the document has been parsed.
+import { ThemeManager } from './modules/theme.js';
+import { MobileNavigation, NavigationManager } from './modules/navigation.js';
+import { AccessibilityManager } from './modules/accessibility.js';
+import { ErrorManager } from './modules/errors.js';
+import { registerServiceWorker } from './modules/offline.js';
+import { debounce, formatDate, copyToClipboard } from './modules/utils.js';
+
+new ThemeManager();
+new MobileNavigation();
+new NavigationManager();
+new AccessibilityManager();
+new ErrorManager();
+registerServiceWorker();
+
+// Kept for inline scripts written against the old global
+window.portfolioUtils = { debounce, formatDate, copyToClipboard };
@@ -0,0 +1,171 @@
+// Service worker generated by portfolio_app.views.service_worker from the
+// static files manifest. A new collectstatic changes VERSION, which installs
+// a fresh precache and drops the old one.
+const VERSION = '{{ version }}';
+const PRECACHE = `precache-${VERSION}`;
+const PAGES = 'pages';
+const PRECACHE_URLS = {{ precache_urls|safe }};
+const HOME_URL = '{{ home_url }}';
+const CONTACT_URL = '{{ contact_url }}';
+const CSRF_URL = '{{ csrf_url }}';
+const QUEUE_TAG = 'contact-queue';
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then(cache => cache.addAll(PRECACHE_URLS))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys.filter(key => key.startsWith('precache-') && key !== PRECACHE).map(key => caches.delete(key))
+            ))
+            .then(() => self.clients.claim())
+            .then(() => flushQueue())
+    );
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+
+    if (request.method === 'POST' && url.pathname === CONTACT_URL) {
+        event.respondWith(sendOrQueue(request));
+        return;
+    }
+    if (request.method !== 'GET') return;
+
+    if (request.mode === 'navigate' && url.pathname === HOME_URL) {
+        event.respondWith(staleWhileRevalidate(event));
+        return;
+    }
+    if (PRECACHE_URLS.includes(url.pathname)) {
+        // Hashed names never change content, so the cache is always right
+        event.respondWith(
+            caches.match(request, { cacheName: PRECACHE }).then(cached => cached || fetch(request))
+        );
+    }
+});
+
+self.addEventListener('sync', (event) => {
+    if (event.tag === QUEUE_TAG) {
+        event.waitUntil(flushQueue());
+    }
+});
+
+// Browsers without Background Sync ask for a flush when they come back online
+self.addEventListener('message', (event) => {
+    if (event.data === 'flush-contact-queue') {
+        event.waitUntil(flushQueue());
+    }
+});
+
+// Homepage: answer from the cache straight away, then revalidate with the
+// content-version ETag so an unchanged page costs a 304 and no body
+async function staleWhileRevalidate(event) {
+    const cache = await caches.open(PAGES);
+    const cached = await cache.match(HOME_URL);
+
+    const revalidate = (async () => {
+        const headers = new Headers();
+        const etag = cached?.headers.get('ETag');
+        if (etag) headers.set('If-None-Match', etag);
+        const response = await fetch(HOME_URL, { headers, credentials: 'same-origin', cache: 'no-store' });
+        if (response.status === 200) {
+            await cache.put(HOME_URL, response.clone());
+        }
+        return response;
+    })();
+
+    if (cached) {
+        event.waitUntil(revalidate.catch(() => {}));
+        return cached;
+    }
+    try {
+        return await revalidate;
+    } catch (error) {
+        return Response.error();
+    }
+}
+
+async function sendOrQueue(request) {
+    const body = await request.clone().formData();
+    try {
+        return await fetch(request);
+    } catch (error) {
+        await enqueue({
+            url: request.url,
+            headers: {
+                'X-CSRFToken': request.headers.get('X-CSRFToken') || '',
+                'X-Requested-With': request.headers.get('X-Requested-With') || '',
+            },
+            fields: [...body.entries()],
+        });
+        if (self.registration.sync) {
+            await self.registration.sync.register(QUEUE_TAG).catch(() => {});
+        }
+        return new Response(JSON.stringify({
+            success: true,
+            queued: true,
+            message: "You're offline. Your message has been saved and will be sent when you're back online.",
+        }), { status: 202, headers: { 'Content-Type': 'application/json' } });
+    }
+}
+
+// Minimal IndexedDB queue of contact submissions
+
+function openQueue() {
+    return new Promise((resolve, reject) => {
+        const open = indexedDB.open(QUEUE_TAG, 1);
+        open.onupgradeneeded = () => open.result.createObjectStore('requests', { autoIncrement: true });
+        open.onsuccess = () => resolve(open.result);
+        open.onerror = () => reject(open.error);
+    });
+}
+
+function transact(mode, operation) {
+    return openQueue().then(db => new Promise((resolve, reject) => {
+        const transaction = db.transaction('requests', mode);
+        const result = operation(transaction.objectStore('requests'));
+        transaction.oncomplete = () => resolve(result.result);
+        transaction.onerror = () => reject(transaction.error);
+    }));
+}
+
+function enqueue(entry) {
+    return transact('readwrite', store => store.add(entry));
+}
+
+async function flushQueue() {
+    const [keys, entries] = await Promise.all([
+        transact('readonly', store => store.getAllKeys()),
+        transact('readonly', store => store.getAll()),
+    ]);
+    if (!keys.length) return;
+    // Whatever token was queued may be missing or outdated by now
+    let token;
+    try {
+        const response = await fetch(CSRF_URL, { credentials: 'same-origin', cache: 'no-store' });
+        token = (await response.json()).token;
+    } catch (error) {
+        return;
+    }
+    for (let index = 0; index < keys.length; index++) {
+        const entry = entries[index];
+        const body = new FormData();
+        entry.fields.forEach(([name, value]) => name !== 'csrfmiddlewaretoken' && body.append(name, value));
+        const headers = { ...entry.headers, 'X-CSRFToken': token };
+        try {
+            await fetch(entry.url, { method: 'POST', body, headers, credentials: 'same-origin' });
+        } catch (error) {
+            // Still offline; keep this and the remaining entries for the next flush
+            return;
+        }
+        await transact('readwrite', store => store.delete(keys[index]));
+    }
+}